@@ -0,0 +1,59 @@
+"""
+ArmorIQ hardware-trojan detection core, importable without Streamlit.
+
+Public names are resolved lazily so `import armoriq` stays cheap and e.g. the
+parser can be used without pulling in torch:
+
+    from armoriq import CompetitionVerilogParser, HybridTrojanDetectionSystem
+"""
+
+import importlib
+
+__version__ = "2.0"
+
+_EXPORTS = {
+    'constants':  ['AgentState', 'ThreatLevel', 'MODEL_VERSION', 'INFERENCE_BACKENDS',
+                   'TRADITIONAL_TROJAN_TYPES'],
+    'structures': ['VerilogSignal', 'VerilogModule', 'AgentMessage', 'MCPServer'],
+    'mcp':        ['MCPServerRegistry', 'InProcessTransport', 'JsonLinesTransport', 'StdioTransport',
+                   'SocketTransport', 'mcp_serve', 'mcp_stub_handler'],
+    'agents':     ['BaseAgent', 'DetectionAgent', 'AnalysisAgent', 'MonitorAgent', 'AgentPipeline',
+                   'threat_level', 'summarize_threats'],
+    'parser':     ['Token', 'tokenize', 'CompetitionVerilogParser'],
+    'netlist':    ['NetlistGraph', 'get_netlist', 'EDGE_ASSIGN', 'EDGE_NONBLOCKING', 'EDGE_BLOCKING',
+                   'SignalTable', 'get_signal_table', 'SIGNAL_TYPE_CODES'],
+    'names':      ['NameClassifier', 'DEFAULT_NAME_FAMILIES'],
+    'stats':      ['StatisticalTrojanDetector'],
+    'centrality': ['CentralityEngine', 'CENTRALITY_METRICS'],
+    'graph':      ['EnhancedGraphBuilder'],
+    'gnn':        ['ArmorIQ_GNN'],
+    'models':     ['ModelRegistry', 'DEFAULT_ARCH'],
+    'engine':     ['InferenceEngine', 'TensorGNN', 'export_torchscript', 'export_onnx', 'quantize_dynamic',
+                   'quantize_onnx', 'configure_threads'],
+    'detector':   ['HybridTrojanDetectionSystem'],
+    'elaborate':  ['DesignElaborator', 'analyze_module'],
+    'cache':      ['ResultCache', 'analysis_config'],
+    'ingest':     ['ingest_files'],
+    'golden':     ['GoldenStore', 'BruteForceIndex', 'GOLDEN_FEATURES'],
+    'similarity': ['EmbeddingIndex', 'IVFIndex'],
+    'cone':       ['Cone', 'extract_cone', 'flagged_cone', 'flagged_signals', 'CONE_DIRECTIONS'],
+    'layout':     ['LayoutEngine', 'netlist_digest', 'layered_layout', 'spring_layout'],
+    'scan':       ['ScanResult', 'ingest_designs', 'score_designs', 'ingest_golden', 'index_designs',
+                   'ingest_corpus'],
+    'report':     ['build_report', 'report_csv', 'browse_designs'],
+}
+_WHERE = {name: mod for mod, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_WHERE)
+
+
+def __getattr__(name):
+    if name in _WHERE:
+        value = getattr(importlib.import_module(f".{_WHERE[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_WHERE))
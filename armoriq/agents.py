@@ -0,0 +1,409 @@
+"""Detection / Analysis / Monitor agents and the streaming pipeline that connects them"""
+
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import AgentState, ThreatLevel
+from .golden import Golden
+from .mcp import MCPServerRegistry
+from .structures import AgentMessage, VerilogModule
+
+if TYPE_CHECKING:
+    from torch_geometric.data import Data
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AI AGENT BASE + SPECIALIZED AGENTS
+# ─────────────────────────────────────────────────────────────────────────────
+class BaseAgent:
+    """Base AI agent with MCP tool-calling capability"""
+
+    def __init__(self, agent_id: str, name: str, mcp: MCPServerRegistry):
+        self.agent_id  = agent_id
+        self.name      = name
+        self.mcp       = mcp
+        self.state     = AgentState.IDLE
+        self.log: List[AgentMessage] = []
+
+    def emit(self, level: str, content: str, data: Any = None):
+        msg = AgentMessage(
+            agent_id=self.agent_id,
+            agent_name=self.name,
+            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
+            level=level,
+            content=content,
+            data=data
+        )
+        self.log.append(msg)
+        return msg
+
+    def begin(self):
+        self.state = AgentState.ACTIVE
+
+    def finish(self):
+        self.state = AgentState.COMPLETE
+
+    def run(self, *args, **kwargs):
+        raise NotImplementedError
+
+
+def threat_level(score: float) -> ThreatLevel:
+    """Monitor band of a hybrid score (MEDIUM and above count as HT-infested)"""
+    if score >= 0.75: return ThreatLevel.CRITICAL
+    if score >= 0.50: return ThreatLevel.HIGH
+    if score >= 0.30: return ThreatLevel.MEDIUM
+    return ThreatLevel.CLEAN
+
+
+def threat_event(mod: VerilogModule, pred: Dict) -> Dict:
+    level = threat_level(pred["hybrid_score"])
+    return {
+        "file": pred.get("filename", mod.name), "module": mod.name,
+        "score": pred["hybrid_score"], "level": level.value[0],
+        "color": level.value[1],
+        "signals": len(mod.signals),
+        "anomalies": pred["anomalies"].get("score", 0)
+    }
+
+
+def _empty_summary() -> Dict:
+    return {"total": 0, "trojans": 0, "clean": 0, "critical": 0, "threat_events": []}
+
+
+def _tally(summary: Dict, event: Dict):
+    summary["total"] += 1
+    summary["critical"] += event["level"] == "CRITICAL"
+    summary["trojans" if event["level"] != "CLEAN" else "clean"] += 1
+    summary["threat_events"].append(event)
+
+
+def summarize_threats(modules: List[VerilogModule], predictions: List[Dict]) -> Dict:
+    """The Monitor Agent's summary without agents or MCP calls, e.g. after re-weighting stored predictions"""
+    summary = _empty_summary()
+    for mod, pred in zip(modules, predictions):
+        _tally(summary, threat_event(mod, pred))
+    return summary
+
+
+class MonitorAgent(BaseAgent):
+    """
+    Real-time monitor: watches all other agents, aggregates threat feeds,
+    raises global alerts, updates live dashboard metrics.
+    """
+
+    def __init__(self, mcp: MCPServerRegistry):
+        super().__init__("agent-monitor", "🛰️  MONITOR AGENT", mcp)
+        self.threat_feed: List[Dict] = []
+
+    def begin(self):
+        super().begin()
+        self.emit("info", "Monitor Agent online — initialising threat feed")
+        self.mcp.submit("mcp-monitor", "subscribe", {"feed": "global"})
+        self.summary = _empty_summary()
+
+    def observe(self, mod: VerilogModule, pred: Dict) -> Dict:
+        """Turn one committed verdict into a threat event"""
+        event = threat_event(mod, pred)
+        _tally(self.summary, event)
+        fname, score = event["file"], event["score"]
+        if event["level"] == "CRITICAL":
+            self.emit("alert", f"CRITICAL THREAT detected in '{fname}' — score {score:.3f}", {"file": fname, "score": score})
+        elif event["level"] == "HIGH":
+            self.emit("warn", f"HIGH THREAT in '{fname}' — score {score:.3f}", {"file": fname, "score": score})
+        elif event["level"] == "MEDIUM":
+            self.emit("warn", f"MEDIUM THREAT in '{fname}' — score {score:.3f}")
+        else:
+            self.emit("ok", f"'{fname}' assessed CLEAN — score {score:.3f}")
+        self.threat_feed.append(event)
+        return event
+
+    def finish(self) -> Dict:
+        summary = self.summary
+        self.mcp.submit("mcp-monitor", "push_summary", summary)
+        self.emit("info", f"Threat feed updated — {summary['trojans']} HT-infested / {summary['clean']} HT-free")
+        super().finish()
+        return summary
+
+    def run(self, modules: List[VerilogModule], predictions: List[Dict]) -> Dict:
+        self.begin()
+        for mod, pred in zip(modules, predictions):
+            self.observe(mod, pred)
+        return self.finish()
+
+
+class AnalysisAgent(BaseAgent):
+    """
+    Deep analysis: runs multi-pass structural analysis, classifies
+    hardware trojan type (combinational/sequential/functional/etc).
+    """
+
+    def __init__(self, mcp: MCPServerRegistry):
+        super().__init__("agent-analysis", "🔬  ANALYSIS AGENT", mcp)
+
+    def classify_trojan_type(self, module: VerilogModule, pred: Dict) -> List[str]:
+        """Heuristically classify which traditional HT types are present"""
+        detected = []
+        anomalies = pred["anomalies"]
+
+        # Sequential trojan — wide counter signals
+        if anomalies.get("rare_signals"):
+            detected.append("Sequential")
+            self.emit("warn", f"Sequential HT pattern: wide counter signals detected → {anomalies['rare_signals'][:3]}")
+
+        # Combinational trojan — complex logic in always blocks
+        if anomalies.get("complex_logic"):
+            detected.append("Combinational")
+            self.emit("warn", f"Combinational HT pattern: {len(anomalies['complex_logic'])} high-complexity logic blocks")
+
+        # Data leakage — isolated wide regs with no fanout
+        if anomalies.get("isolated_signals"):
+            detected.append("Data Leakage")
+            self.emit("alert", f"Potential Data Leakage HT: {len(anomalies['isolated_signals'])} isolated signals")
+
+        # Kill switch — high fanout from single suspicious signal
+        if anomalies.get("high_fanout"):
+            detected.append("Kill Switch")
+            for name, fo in anomalies["high_fanout"][:2]:
+                self.emit("alert", f"Kill Switch candidate: '{name}' → {fo} fanout connections")
+
+        # Parametric / covert — unusual bit widths
+        if anomalies.get("unusual_widths"):
+            detected.append("Parametric")
+            self.emit("warn", f"Parametric HT pattern: unusual signal widths detected")
+
+        # Functional — suspicious naming
+        if anomalies.get("suspicious_names"):
+            detected.append("Functional")
+            self.emit("alert", f"Functional HT names: {anomalies['suspicious_names'][:3]}")
+
+        return list(set(detected)) if detected else ["No HT Pattern"]
+
+    def begin(self):
+        super().begin()
+        self.emit("info", "Analysis Agent initialised — loading structural models")
+        self.mcp.submit("mcp-stat", "configure", {"depth": "full", "golden": True})
+        self.count = 0
+
+    def analyze(self, mod: VerilogModule, pred: Dict) -> Dict:
+        """HT-type classification + structural fingerprint of one scored design"""
+        self.emit("info", f"Analysing '{mod.name}' ({len(mod.signals)} signals)")
+        self.mcp.submit("mcp-graph", "analyze", {"module": mod.name})
+
+        ht_types = self.classify_trojan_type(mod, pred)
+
+        # Compute structural fingerprint
+        total_bits = sum(s.width for s in mod.signals.values())
+        avg_fanout = np.mean([s.fanout for s in mod.signals.values()]) if mod.signals else 0
+
+        fingerprint = {
+            "module": mod.name,
+            "file": pred.get("filename", mod.name),
+            "ht_types": ht_types,
+            "gnn_score": pred["gnn_score"],
+            "stat_score": pred["statistical_score"],
+            "hybrid_score": pred["hybrid_score"],
+            "total_bits": total_bits,
+            "avg_fanout": avg_fanout,
+            "signal_density": len(mod.signals) / max(len(mod.always_blocks), 1),
+            "is_trojan": pred["prediction"] == 1
+        }
+        self.count += 1
+
+        if pred["prediction"] == 1:
+            self.emit("alert", f"Trojan fingerprint: {', '.join(ht_types)}")
+        else:
+            self.emit("ok", f"'{mod.name}' — No significant trojan fingerprint")
+        return fingerprint
+
+    def finish(self):
+        self.mcp.submit("mcp-report", "store_fingerprints", {"count": self.count})
+        super().finish()
+        self.emit("info", "Analysis complete — results written to MCP report server")
+
+    def run(self, modules: List[VerilogModule], predictions: List[Dict]) -> List[Dict]:
+        self.begin()
+        results = [self.analyze(mod, pred) for mod, pred in zip(modules, predictions)]
+        self.finish()
+        return results
+
+
+class DetectionAgent(BaseAgent):
+    """
+    Primary detection agent: orchestrates GNN + statistical scoring,
+    applies adaptive thresholds, issues verdicts.
+    """
+
+    def __init__(self, mcp: MCPServerRegistry, detector):
+        super().__init__("agent-detect", "⚡  DETECTION AGENT", mcp)
+        self.detector = detector
+
+    def stream(self, modules: List[VerilogModule], graphs: List["Data"],
+               golden_features: Optional[Golden] = None, stats: Optional[List[Dict]] = None,
+               gnn: Optional[List[Optional[Tuple]]] = None,
+               filenames: Optional[List[str]] = None) -> Iterator[Tuple[int, Dict]]:
+        """(index, prediction) for each design as soon as its verdict is committed"""
+        self.begin()
+        gnn_on = not self.detector.statistical_only
+        if gnn_on:
+            self.emit("info", "Detection Agent online — calling GNN inference server")
+            self.mcp.submit("mcp-gnn", "load_checkpoint", {"arch": "GAT-4L-256H", "version": self.detector.model_version})
+        else:
+            self.emit("info", "Detection Agent online — statistical-only mode, GNN not loaded")
+        self.mcp.submit("mcp-stat", "analyze", {"designs": len(modules)})
+        if golden_features:
+            self.mcp.submit("mcp-golden", "load_references", {"references": len(golden_features)})
+
+        reused = sum(1 for g in (gnn or []) if g is not None)
+        n = 0
+        for i, pred in self.detector.iter_predict(modules, graphs, golden_features, stats, gnn):
+            mod = modules[i]
+            pred["filename"] = filenames[i] if filenames else mod.name
+
+            hs = pred["hybrid_score"]
+            n += 1
+            if hs > 0.75:
+                self.emit("alert", f"[{n}/{len(modules)}] VERDICT: HT-INFESTED  score={hs:.3f}  '{mod.name}'")
+            elif hs > 0.50:
+                self.emit("warn",  f"[{n}/{len(modules)}] VERDICT: HT-INFESTED  score={hs:.3f}  '{mod.name}'")
+            else:
+                self.emit("ok",    f"[{n}/{len(modules)}] VERDICT: HT-FREE      score={hs:.3f}  '{mod.name}'")
+
+            if "golden" in pred:
+                gm = pred["golden"]
+                self.mcp.submit("mcp-golden", "diff", {"module": mod.name, "reference": gm["reference"],
+                                                       "distance": round(gm["distance"], 4)})
+                self.emit("info", f"Golden reference for '{mod.name}': {gm['reference']} (d={gm['distance']:.2f})")
+            nd = pred.get("near_duplicate")
+            if nd:
+                self.mcp.submit("mcp-classify", "match_similar", {"module": mod.name, "match": nd["key"],
+                                                                  "distance": round(nd["distance"], 5)})
+                self.emit("warn" if nd["verdict"] else "info",
+                          f"'{mod.name}' is a near-duplicate of {nd['key']} ({nd['source']}, "
+                          f"{'HT-infested' if nd['verdict'] else 'HT-free'}, d={nd['distance']:.1e})")
+            self.mcp.submit("mcp-classify", "commit_verdict", {"file": pred.get("filename")})
+            yield i, pred
+
+        if gnn_on:
+            self.mcp.submit("mcp-gnn", "infer", {"designs": len(graphs) - reused,
+                                                 "nodes": sum(g.num_nodes for g in graphs),
+                                                 "batches": self.detector.last_batches})
+            self.emit("info", f"GNN inference: {len(graphs) - reused} designs in {self.detector.last_batches} batch(es)"
+                              + (f", {reused} from cache" if reused else ""))
+        self.finish()
+        self.emit("info", f"Detection complete — {n} designs evaluated")
+
+    def run(self, modules: List[VerilogModule], graphs: List["Data"],
+            golden_features: Optional[Golden] = None, stats: Optional[List[Dict]] = None,
+            gnn: Optional[List[Optional[Tuple]]] = None, filenames: Optional[List[str]] = None) -> List[Dict]:
+        predictions: List[Optional[Dict]] = [None] * len(modules)
+        for i, pred in self.stream(modules, graphs, golden_features, stats, gnn, filenames):
+            predictions[i] = pred
+        return predictions
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AGENT PIPELINE
+# ─────────────────────────────────────────────────────────────────────────────
+class AgentPipeline:
+    """
+    Detection → {Analysis, Monitor} as a streaming DAG. The detection stage runs
+    on the caller's thread and fans each committed verdict out to one bounded
+    queue per downstream agent; each downstream agent drains its queue on its
+    own thread. A full queue blocks detection (backpressure), and the time spent
+    blocked is reported in `metrics` alongside per-stage throughput.
+    """
+
+    _DONE = object()
+
+    def __init__(self, detect: DetectionAgent, analysis: AnalysisAgent, monitor: MonitorAgent,
+                 maxsize: int = 8):
+        self.detect, self.analysis, self.monitor = detect, analysis, monitor
+        self.maxsize = maxsize
+        self.metrics: Dict[str, Any] = {}
+
+    def _consume(self, name: str, q: "queue.Queue", fn, out: Dict[int, Any], m: Dict, errors: List):
+        while True:
+            t0 = time.perf_counter()
+            item = q.get()
+            m['wait_s'] += time.perf_counter() - t0
+            if item is self._DONE:
+                break
+            if errors:                                      # keep draining so detection never blocks forever
+                continue
+            i, mod, pred, t_verdict = item
+            t1 = time.perf_counter()
+            try:
+                out[i] = fn(mod, pred)
+            except Exception as e:
+                errors.append((name, e)); continue
+            now = time.perf_counter()
+            m['busy_s'] += now - t1
+            m['items']  += 1
+            m['max_latency_s'] = max(m['max_latency_s'], now - t_verdict)
+            if m['first_s'] is None:
+                m['first_s'] = now - self._t0
+
+    def run(self, modules: List[VerilogModule], graphs: List["Data"], golden_features: Optional[Golden] = None,
+            stats: Optional[List[Dict]] = None, gnn: Optional[List[Optional[Tuple]]] = None,
+            filenames: Optional[List[str]] = None) -> Tuple[List[Dict], List[Dict], Dict]:
+        """Same (predictions, fingerprints, monitor summary) as running the three agents back to back"""
+        n = len(modules)
+        self._t0 = time.perf_counter()
+        stage = lambda: {'items': 0, 'busy_s': 0.0, 'wait_s': 0.0, 'blocked_put_s': 0.0,
+                         'max_depth': 0, 'max_latency_s': 0.0, 'first_s': None}
+        self.metrics = {'detection': stage(), 'analysis': stage(), 'monitor': stage()}
+        predictions: List[Optional[Dict]] = [None] * n
+        fingerprints: Dict[int, Dict] = {}
+        events: Dict[int, Dict] = {}
+        errors: List[Tuple[str, Exception]] = []
+
+        self.analysis.begin(); self.monitor.begin()
+        queues = {'analysis': queue.Queue(self.maxsize), 'monitor': queue.Queue(self.maxsize)}
+        workers = [
+            threading.Thread(target=self._consume, name=f"agent-{name}", daemon=True,
+                             args=(name, queues[name], fn, out, self.metrics[name], errors))
+            for name, fn, out in (('analysis', self.analysis.analyze, fingerprints),
+                                  ('monitor',  self.monitor.observe,  events))
+        ]
+        for w in workers:
+            w.start()
+
+        det = self.metrics['detection']
+        try:
+            t1 = time.perf_counter()
+            for i, pred in self.detect.stream(modules, graphs, golden_features, stats, gnn, filenames):
+                now = time.perf_counter()
+                det['busy_s'] += now - t1
+                det['items']  += 1
+                if det['first_s'] is None:
+                    det['first_s'] = now - self._t0
+                predictions[i] = pred
+                for name, q in queues.items():
+                    t2 = time.perf_counter()
+                    q.put((i, modules[i], pred, now))
+                    self.metrics[name]['blocked_put_s'] += time.perf_counter() - t2
+                    self.metrics[name]['max_depth'] = max(self.metrics[name]['max_depth'], q.qsize())
+                t1 = time.perf_counter()
+        finally:
+            for q in queues.values():
+                q.put(self._DONE)
+            for w in workers:
+                w.join()
+        if errors:
+            raise RuntimeError(f"{errors[0][0]} stage failed: {errors[0][1]}") from errors[0][1]
+
+        self.analysis.finish()
+        summary = self.monitor.finish()
+        summary['threat_events'] = [events[i] for i in sorted(events)]   # design order, as the batch agents
+
+        wall = time.perf_counter() - self._t0
+        for m in self.metrics.values():
+            m['items_per_s'] = m['items'] / m['busy_s'] if m['busy_s'] else 0.0
+        self.metrics['wall_s'] = wall
+        self.metrics['serial_s'] = sum(self.metrics[k]['busy_s'] for k in ('detection', 'analysis', 'monitor'))
+        return predictions, [fingerprints[i] for i in range(n)], summary
@@ -0,0 +1,119 @@
+"""Content-addressed on-disk result cache"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from .detector import HybridTrojanDetectionSystem
+from .graph import EnhancedGraphBuilder
+from .parser import CompetitionVerilogParser
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RESULT CACHE
+# ─────────────────────────────────────────────────────────────────────────────
+def analysis_config(builder: EnhancedGraphBuilder, detector: HybridTrojanDetectionSystem) -> Dict:
+    """Everything besides the RTL bytes that changes parsed modules, graphs, statistics or GNN outputs"""
+    try:
+        tv = importlib.metadata.version("torch")           # without importing torch
+    except importlib.metadata.PackageNotFoundError:
+        tv = None
+    return {
+        'model': detector.models.fingerprint(detector.model_version), 'graphs': not detector.statistical_only,
+        'backend': None if detector.statistical_only else (detector.backend, detector.quantize),
+        'parser': CompetitionVerilogParser.VERSION, 'torch': tv,
+        'feature_dim': builder.feature_dim, 'names': builder.names.signature(),
+        'centrality': builder.centrality.params(), 'centrality_version': builder.centrality.VERSION,
+        'stat_names': detector.stat_det.names.signature(),
+    }
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk store: sha256(file bytes + analysis config)
+    → pickled per-file results. Entries are written atomically and evicted
+    least-recently-used (by mtime) once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = 512 << 20, config: Optional[Dict] = None):
+        self.root = root or os.environ.get("ARMORIQ_CACHE_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "armoriq")
+        os.makedirs(self.root, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.salt = json.dumps(config or {}, sort_keys=True, default=str).encode()
+        self.hits = self.misses = 0
+
+    def key(self, data: bytes) -> str:
+        h = hashlib.sha256(data)
+        h.update(b"\0"); h.update(self.salt)
+        return h.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key + ".pkl")
+
+    def get(self, key: str) -> Any:
+        p = self.path(key)
+        try:
+            with open(p, "rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            self.misses += 1; return None
+        except Exception:                                  # truncated / stale pickle: drop it
+            self.misses += 1
+            try: os.remove(p)
+            except OSError: pass
+            return None
+        try: os.utime(p)                                   # LRU touch
+        except OSError: pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path(key))
+        except Exception:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+        self.evict(keep=key)
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        out = []
+        for fn in os.listdir(self.root):
+            if fn.endswith(".pkl"):
+                try:
+                    stt = os.stat(os.path.join(self.root, fn))
+                    out.append((stt.st_mtime, stt.st_size, fn))
+                except OSError:
+                    pass
+        return out
+
+    def evict(self, keep: Optional[str] = None):
+        ents  = sorted(self.entries())
+        total = sum(sz for _, sz, _ in ents)
+        for _, sz, fn in ents:
+            if total <= self.max_bytes:
+                break
+            if keep and fn == keep + ".pkl":
+                continue
+            try:
+                os.remove(os.path.join(self.root, fn)); total -= sz
+            except OSError:
+                pass
+
+    def clear(self):
+        for _, _, fn in self.entries():
+            try: os.remove(os.path.join(self.root, fn))
+            except OSError: pass
+
+    def stats(self) -> Dict[str, int]:
+        ents = self.entries()
+        return {'entries': len(ents), 'bytes': sum(sz for _, sz, _ in ents),
+                'hits': self.hits, 'misses': self.misses}
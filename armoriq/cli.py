@@ -0,0 +1,277 @@
+"""
+Headless entry point.
+
+    python -m armoriq scan rtl/ 'ip/**/*.v' --json report.json --csv results.csv [--golden]
+    python -m armoriq golden add clean_ip/ | list | clear
+    python -m armoriq index add trust_hub/ --label trojan | list | clear
+    python -m armoriq mcp-serve stdio | tcp:8765
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import warnings
+from typing import List, Optional, Tuple
+
+from .constants import INFERENCE_BACKENDS, MODEL_VERSION
+
+
+def collect_files(paths: List[str], recursive: bool = True) -> List[str]:
+    """Expand directories (→ *.v / *.vh) and glob patterns; keeps first-seen order, drops duplicates"""
+    out, seen = [], set()
+    for p in paths:
+        if os.path.isdir(p):
+            pat = os.path.join(p, "**" if recursive else "", "*.v*")
+            hits = sorted(f for f in glob.glob(pat, recursive=recursive) if f.endswith((".v", ".vh")))
+        elif any(c in p for c in "*?["):
+            hits = sorted(glob.glob(p, recursive=True))
+        else:
+            hits = [p]
+        for f in hits:
+            k = os.path.abspath(f)
+            if k not in seen and os.path.isfile(f):
+                seen.add(k); out.append(f)
+    return out
+
+
+def _quiet_torch_warnings():
+    """Silence torch / PyG / ONNX deprecation chatter only; everything else still reaches stderr"""
+    for cat in (DeprecationWarning, FutureWarning):
+        warnings.filterwarnings("ignore", category=cat, module=r"(torch|torch_geometric|onnx\w*)(\.|$)")
+    warnings.filterwarnings("ignore", message="Warning only once for all operators", category=UserWarning,
+                            module=r"torch\.")
+
+
+def _write(path: str, text: str):
+    if path == "-":
+        sys.stdout.write(text)
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+
+
+def _read_files(args) -> List[Tuple[str, bytes]]:
+    files: List[Tuple[str, bytes]] = []
+    for p in collect_files(args.paths, recursive=not args.no_recursive):
+        with open(p, "rb") as fh:
+            files.append((p, fh.read()))
+    return files
+
+
+def _detector(args, **kw):
+    from .detector import HybridTrojanDetectionSystem
+    det = HybridTrojanDetectionSystem(model_version=args.model_version, backend=args.backend,
+                                      quantize=args.int8, **kw)
+    if not det.statistical_only and (args.threads or args.interop_threads):
+        from .engine import configure_threads
+        configure_threads(args.threads, args.interop_threads)
+    return det
+
+
+def cmd_scan(args) -> int:
+    from .cache import ResultCache, analysis_config
+    from .golden import GoldenStore
+    from .graph import EnhancedGraphBuilder
+    from .mcp import InProcessTransport, MCPServerRegistry
+    from .report import build_report, report_csv
+    from .scan import ingest_designs, score_designs
+    from .similarity import EmbeddingIndex
+
+    files = _read_files(args)
+    if not files:
+        print("armoriq: no Verilog files matched", file=sys.stderr); return 2
+    golden = GoldenStore(args.golden_dir, args.model_version) if args.golden or args.golden_dir else None
+    if golden is not None and not len(golden) and not args.quiet:
+        print(f"armoriq: golden store {golden.path} is empty; deviation scoring skipped", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    builder  = EnhancedGraphBuilder(48)
+    index    = EmbeddingIndex(args.index_dir, args.model_version) if args.index or args.index_dir else None
+    detector = _detector(args, gnn_weight=args.gnn_weight, stat_weight=1.0 - args.gnn_weight,
+                         index=index, top_k=args.top_k, cone_hops=args.cone_hops, cone_rescore=args.cone_rescore)
+    if index is not None and detector.statistical_only and not args.quiet:
+        print("armoriq: similarity index needs GNN embeddings; skipped with --gnn-weight 0", file=sys.stderr)
+    mcp      = MCPServerRegistry(InProcessTransport(latency=0.0))
+    cache    = None if args.no_cache else ResultCache(args.cache_dir, config=analysis_config(builder, detector))
+
+    def progress(done, total):
+        if not args.quiet:
+            print(f"\rparsed {done}/{total}", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+    try:
+        res = ingest_designs(files, builder, detector, mcp, cache, args.workers or None, progress)
+        for name, err in res.errors:
+            print(f"armoriq: parse error — {name}: {err}", file=sys.stderr)
+        for name, fname in res.elab.duplicates:
+            print(f"armoriq: module '{name}' in {fname} is also defined in {res.elab.origin[name]}; "
+                  f"both are scored, instances resolve to the first definition", file=sys.stderr)
+        unscored = sorted({n for n, _ in files} - set(res.filenames))
+        if not res.modules:
+            print("armoriq: no designs could be parsed", file=sys.stderr); return 2
+        score_designs(res, detector, mcp, cache, golden)
+        report = build_report(res.modules, res.predictions, res.fingerprints, res.monitor, len(mcp.call_log))
+    finally:
+        mcp.close()
+
+    if args.json:
+        _write(args.json, json.dumps(report, indent=2))
+    if args.csv:
+        _write(args.csv, report_csv(report))
+    s = report['summary']
+    if not args.quiet:
+        print(f"{s['total']} design(s) from {len(files)} file(s) [{res.cached_files} cached]: "
+              f"{s['trojans']} HT-infested, {s['clean']} HT-free, {s['critical']} critical "
+              f"({time.perf_counter() - t0:.2f}s)", file=sys.stderr)
+        dups = sum(1 for d in report['designs'] if d['near_duplicate'])
+        if dups:
+            print(f"{dups} near-duplicate(s) of previously indexed designs", file=sys.stderr)
+    if unscored:
+        print(f"armoriq: {len(unscored)} file(s) produced no scored design: {', '.join(unscored[:10])}"
+              + (" …" if len(unscored) > 10 else ""), file=sys.stderr)
+    return 1 if args.fail_on_trojan and (s['trojans'] or unscored) else 0
+
+
+def cmd_golden(args) -> int:
+    from .golden import GoldenStore
+
+    store = GoldenStore(args.golden_dir, args.model_version)
+    if args.action == "list":
+        s = store.summary()
+        print(f"{s['references']} reference(s), {s['with_embedding']} with embeddings [{s['model']}] — {s['path']}")
+        for k in store.keys:
+            print(f"  {k}")
+        return 0
+    if args.action == "clear":
+        store.clear(); return 0
+
+    from .cache import ResultCache, analysis_config
+    from .graph import EnhancedGraphBuilder
+    from .mcp import InProcessTransport, MCPServerRegistry
+    from .scan import ingest_golden
+
+    files = _read_files(args)
+    if not files:
+        print("armoriq: no Verilog files matched", file=sys.stderr); return 2
+    builder  = EnhancedGraphBuilder(48)
+    detector = _detector(args)
+    mcp   = MCPServerRegistry(InProcessTransport(latency=0.0))
+    cache = None if args.no_cache else ResultCache(args.cache_dir, config=analysis_config(builder, detector))
+    try:
+        n0  = len(store)
+        res = ingest_golden(files, store, builder, detector, mcp, cache, args.workers or None)
+    finally:
+        mcp.close()
+    for name, err in res.errors:
+        print(f"armoriq: {name}: {err}", file=sys.stderr)
+    print(f"golden store: {len(res.modules)} design(s) ingested, {len(store) - n0} new, "
+          f"{len(store)} total — {store.path}", file=sys.stderr)
+    return 0 if res.modules else 2
+
+
+def cmd_index(args) -> int:
+    from .similarity import EmbeddingIndex
+
+    index = EmbeddingIndex(args.index_dir, args.model_version)
+    if args.action == "list":
+        s = index.summary()
+        print(f"{s['designs']} design(s) [{s['scan']} scanned, {s['trojan-corpus']} known-trojan, "
+              f"{s['clean-corpus']} known-clean; {s['index']}] [{s['model']}] — {s['path']}")
+        for k, v, src in zip(index.keys, index.verdicts.tolist(), index.sources.tolist()):
+            print(f"  {'HT ' if v else '   '} {index.SOURCES[src]:<13} {k}")
+        return 0
+    if args.action == "clear":
+        index.clear(); return 0
+
+    from .cache import ResultCache, analysis_config
+    from .graph import EnhancedGraphBuilder
+    from .mcp import InProcessTransport, MCPServerRegistry
+    from .scan import ingest_corpus
+
+    files = _read_files(args)
+    if not files:
+        print("armoriq: no Verilog files matched", file=sys.stderr); return 2
+    builder  = EnhancedGraphBuilder(48)
+    detector = _detector(args)
+    mcp   = MCPServerRegistry(InProcessTransport(latency=0.0))
+    cache = None if args.no_cache else ResultCache(args.cache_dir, config=analysis_config(builder, detector))
+    try:
+        n0  = len(index)
+        res = ingest_corpus(files, index, int(args.label == "trojan"), builder, detector, mcp, cache,
+                            args.workers or None)
+    finally:
+        mcp.close()
+    for name, err in res.errors:
+        print(f"armoriq: {name}: {err}", file=sys.stderr)
+    print(f"similarity index: {len(res.modules)} {args.label} design(s) ingested, {len(index) - n0} new, "
+          f"{len(index)} total — {index.path}", file=sys.stderr)
+    return 0 if res.modules else 2
+
+
+def cmd_mcp_serve(args) -> int:
+    from .mcp import mcp_serve
+    mcp_serve(args.spec, args.latency)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="armoriq", description="ArmorIQ hardware-trojan detection (headless)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sc = sub.add_parser("scan", help="scan Verilog files / directories / globs and write a report")
+    sc.add_argument("paths", nargs="+", help="files, directories (searched for *.v / *.vh) or glob patterns")
+    sc.add_argument("--json", metavar="PATH", help="write the JSON report ('-' for stdout)")
+    sc.add_argument("--csv", metavar="PATH", help="write per-design CSV results ('-' for stdout)")
+    sc.add_argument("--gnn-weight", type=float, default=0.6,
+                    help="hybrid blend weight of the GNN score (0 = statistical only, torch is not loaded)")
+    sc.add_argument("--golden", action="store_true",
+                    help="score deviation against the nearest reference in the golden store")
+    sc.add_argument("--golden-dir", default=None, help="golden store directory (default $ARMORIQ_GOLDEN_DIR; implies --golden)")
+    sc.add_argument("--index", action="store_true",
+                    help="look up similar / near-duplicate designs in the embedding index and record this scan")
+    sc.add_argument("--index-dir", default=None, help="embedding index directory (default $ARMORIQ_INDEX_DIR; implies --index)")
+    sc.add_argument("--top-k", type=int, default=5, help="similar designs reported per design")
+    sc.add_argument("--cone-hops", type=int, default=2,
+                    help="fan-in / fan-out steps around flagged signals summarised per design (0 = off)")
+    sc.add_argument("--cone-rescore", action="store_true", help="also score each flagged-signal cone with the GNN")
+    sc.add_argument("--fail-on-trojan", action="store_true",
+                    help="exit 1 if any design is HT-infested or any file could not be scored")
+    sc.add_argument("-q", "--quiet", action="store_true")
+    sc.set_defaults(fn=cmd_scan)
+
+    gd = sub.add_parser("golden", help="manage the golden-reference store of known-clean designs")
+    gd.add_argument("action", choices=["add", "list", "clear"])
+    gd.add_argument("paths", nargs="*", help="designs to add (files, directories or globs)")
+    gd.add_argument("--golden-dir", default=None, help="golden store directory (default $ARMORIQ_GOLDEN_DIR)")
+    gd.set_defaults(fn=cmd_golden)
+
+    ix = sub.add_parser("index", help="manage the embedding index of analysed designs and labelled corpora")
+    ix.add_argument("action", choices=["add", "list", "clear"])
+    ix.add_argument("paths", nargs="*", help="corpus designs to add (files, directories or globs)")
+    ix.add_argument("--label", choices=["trojan", "clean"], default="trojan", help="label of the added corpus")
+    ix.add_argument("--index-dir", default=None, help="embedding index directory (default $ARMORIQ_INDEX_DIR)")
+    ix.set_defaults(fn=cmd_index)
+
+    for p in (sc, gd, ix):
+        p.add_argument("--workers", type=int, default=0, help="ingestion processes (0 = one per core)")
+        p.add_argument("--cache-dir", default=None, help="result cache directory (default $ARMORIQ_CACHE_DIR)")
+        p.add_argument("--no-cache", action="store_true")
+        p.add_argument("--no-recursive", action="store_true", help="do not descend into sub-directories")
+        p.add_argument("--model-version", default=MODEL_VERSION,
+                       help="GNN checkpoint version under $ARMORIQ_MODEL_DIR (missing → seeded init)")
+        p.add_argument("--backend", choices=INFERENCE_BACKENDS, default="eager",
+                       help="GNN inference backend; torchscript / onnx export the checkpoint once on first use")
+        p.add_argument("--int8", action="store_true", help="dynamic int8 quantization of the GNN's linear layers")
+        p.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = torch default)")
+        p.add_argument("--interop-threads", type=int, default=0, help="torch inter-op threads (0 = torch default)")
+
+    ms = sub.add_parser("mcp-serve", help="run the local JSON-lines MCP server")
+    ms.add_argument("spec", nargs="?", default="stdio", help="'stdio' or 'tcp:[HOST:]PORT'")
+    ms.add_argument("--latency", type=float, default=0.02, help="simulated tool latency (s)")
+    ms.set_defaults(fn=cmd_mcp_serve)
+
+    args = ap.parse_args(argv)
+    _quiet_torch_warnings()
+    return args.fn(args)
@@ -0,0 +1,136 @@
+"""k-hop fan-in / fan-out cones around flagged signals, read straight off the netlist CSR / CSC"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .netlist import NetlistGraph, get_netlist
+from .structures import VerilogModule
+
+if TYPE_CHECKING:
+    from torch_geometric.data import Data
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CONE EXTRACTION
+# ─────────────────────────────────────────────────────────────────────────────
+CONE_DIRECTIONS = ('in', 'out', 'both')
+FANIN, FANOUT = 1, 2                                       # Cone.side bits
+
+
+def flagged_signals(anomalies: Dict) -> List[str]:
+    """Cone seeds from a statistical analysis: suspicious names, high fan-out and isolated signals"""
+    out = list(anomalies.get('suspicious_names', []))
+    out += [nm for nm, _ in anomalies.get('high_fanout', [])]
+    out += anomalies.get('isolated_signals', [])
+    return list(dict.fromkeys(out))
+
+
+def _edge_ids(indptr: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """Positions of all CSR entries of the frontier rows"""
+    starts = indptr[frontier]
+    deg = indptr[frontier + 1] - starts
+    tot = int(deg.sum())
+    if tot == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.repeat(starts, deg) + np.arange(tot) - np.repeat(np.cumsum(deg) - deg, deg)
+
+
+def _reach(indptr: np.ndarray, eid: Optional[np.ndarray], ends: np.ndarray, seeds: np.ndarray, hops: int):
+    """Level-synchronous BFS touching only frontier rows → (nodes, hop distance), seeds at 0"""
+    seen, nodes, dist, frontier = seeds, [seeds], [np.zeros(len(seeds), np.int64)], seeds
+    for h in range(1, hops + 1):
+        e = _edge_ids(indptr, frontier)
+        v = np.unique(ends[e if eid is None else eid[e]])
+        frontier = v[~np.isin(v, seen, assume_unique=True)]
+        if not frontier.size:
+            break
+        seen = np.union1d(seen, frontier)
+        nodes.append(frontier); dist.append(np.full(len(frontier), h, np.int64))
+    return np.concatenate(nodes), np.concatenate(dist)
+
+
+class Cone:
+    """
+    Signals within `hops` driver (fan-in) and/or load (fan-out) steps of the
+    seeds. `nodes` are sorted netlist ids, `dist` the hop distance to the
+    nearest seed, `side` FANIN | FANOUT bits, `edges` the `ei` columns of the
+    induced subgraph (parallel edges kept, so edge types carry over).
+    """
+
+    def __init__(self, nl: NetlistGraph, seeds: np.ndarray, nodes: np.ndarray, dist: np.ndarray,
+                 side: np.ndarray, edges: np.ndarray, hops: int, direction: str):
+        self.netlist, self.seeds, self.nodes, self.dist, self.side, self.edges = nl, seeds, nodes, dist, side, edges
+        self.hops, self.direction = hops, direction
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edges)
+
+    @property
+    def names(self) -> List[str]:
+        nm = self.netlist.names
+        return [nm[i] for i in self.nodes.tolist()]
+
+    def mask(self) -> np.ndarray:
+        m = np.zeros(self.netlist.num_nodes, dtype=bool); m[self.nodes] = True
+        return m
+
+    def edge_index(self) -> np.ndarray:
+        """(2, E') induced edges renumbered to positions in `nodes`"""
+        return np.searchsorted(self.nodes, self.netlist.ei[:, self.edges])
+
+    def to_data(self, graph: "Data") -> "Data":
+        """Cone subgraph of a built graph: node features keep their whole-design context"""
+        import torch
+        from torch_geometric.data import Data
+        d = Data(x=graph.x[torch.from_numpy(self.nodes)], edge_index=torch.from_numpy(self.edge_index()))
+        if getattr(graph, 'edge_attr', None) is not None:
+            d.edge_attr = graph.edge_attr[torch.from_numpy(self.edges)]
+        return d
+
+    def summary(self) -> Dict:
+        return {'seeds': len(self.seeds), 'signals': self.num_nodes, 'edges': self.num_edges,
+                'hops': self.hops, 'direction': self.direction,
+                'fraction': self.num_nodes / max(self.netlist.num_nodes, 1)}
+
+
+def extract_cone(nl: NetlistGraph, seeds: Iterable, hops: int = 2, direction: str = 'both') -> Cone:
+    """
+    Fan-in (CSC) / fan-out (CSR) cone of the seeds (names or node ids). Cost
+    is proportional to the edges incident to the cone, not to design size;
+    the reverse index is built once per netlist.
+    """
+    if direction not in CONE_DIRECTIONS:
+        raise ValueError(f"unknown cone direction {direction!r}; expected one of {CONE_DIRECTIONS}")
+    ids = [nl.index[s] if isinstance(s, str) else int(s) for s in seeds if not isinstance(s, str) or s in nl.index]
+    seeds = np.unique(np.asarray(ids, dtype=np.int64))
+    parts = []
+    if direction in ('in', 'both'):
+        in_ptr, in_eid = nl.csc()
+        parts.append((*_reach(in_ptr, in_eid, nl.ei[0], seeds, hops), FANIN))
+    if direction in ('out', 'both'):
+        parts.append((*_reach(nl.indptr, None, nl.ei[1], seeds, hops), FANOUT))
+    node = np.concatenate([p[0] for p in parts])
+    dist = np.concatenate([p[1] for p in parts])
+    bits = np.concatenate([np.full(len(p[0]), p[2], np.int8) for p in parts])
+    order = np.lexsort((dist, node))
+    node, dist, bits = node[order], dist[order], bits[order]
+    nodes, first = np.unique(node, return_index=True)
+    side = np.bitwise_or.reduceat(bits, first) if len(first) else bits
+
+    e = _edge_ids(nl.indptr, nodes)                        # out-edges of cone nodes that stay in the cone
+    if e.size:
+        dst = nl.ei[1, e]
+        pos = np.minimum(np.searchsorted(nodes, dst), len(nodes) - 1)
+        e = e[nodes[pos] == dst]
+    return Cone(nl, seeds, nodes, dist[first], side, e, hops, direction)
+
+
+def flagged_cone(module: VerilogModule, anomalies: Dict, hops: int = 2, direction: str = 'both') -> Cone:
+    """Cone around every signal the statistical analysis flagged"""
+    return extract_cone(get_netlist(module), flagged_signals(anomalies), hops, direction)
@@ -0,0 +1,34 @@
+"""Enums, thresholds and taxonomy shared by the core and the dashboard"""
+
+from enum import Enum
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ENUMS & CONSTANTS
+# ─────────────────────────────────────────────────────────────────────────────
+class AgentState(Enum):
+    IDLE       = "IDLE"
+    ACTIVE     = "ACTIVE"
+    ALERTING   = "ALERTING"
+    COMPLETE   = "COMPLETE"
+
+class ThreatLevel(Enum):
+    CRITICAL  = ("CRITICAL",  "#ff2d4a")
+    HIGH      = ("HIGH",      "#ff6600")
+    MEDIUM    = ("MEDIUM",    "#ffaa00")
+    LOW       = ("LOW",       "#00e5ff")
+    CLEAN     = ("CLEAN",     "#00ff88")
+
+MODEL_VERSION = "gat4-256h-v2.0"
+
+INFERENCE_BACKENDS = ("eager", "torchscript", "onnx")
+
+TRADITIONAL_TROJAN_TYPES = {
+    "Combinational":    "Logic-only trojan; no state; triggered by rare input pattern",
+    "Sequential":       "FSM-based trojan; triggered after N clock cycles",
+    "Functional":       "Modifies circuit function; always-on malicious behavior",
+    "Parametric":       "Alters timing/power; not functionally detectable",
+    "Covert Channel":   "Side-channel leak via power/EM emanation",
+    "Kill Switch":      "Disables circuit on trigger condition",
+    "Data Leakage":     "Exfiltrates secret keys or sensitive registers",
+}
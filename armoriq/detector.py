@@ -0,0 +1,234 @@
+"""GNN + statistical hybrid scoring"""
+
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .cone import flagged_cone
+from .constants import INFERENCE_BACKENDS, MODEL_VERSION
+from .golden import Golden, GoldenStore
+from .models import ModelRegistry
+from .similarity import EmbeddingIndex
+from .stats import StatisticalTrojanDetector
+from .structures import VerilogModule
+
+if TYPE_CHECKING:
+    import torch
+    from torch_geometric.data import Data
+
+    from .engine import InferenceEngine
+    from .gnn import ArmorIQ_GNN
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HYBRID DETECTOR
+# ─────────────────────────────────────────────────────────────────────────────
+class HybridTrojanDetectionSystem:
+    """
+    Blends GNN and statistical scores. The GNN is fetched from a ModelRegistry
+    on first use (shared across instances / sessions); with gnn_weight == 0
+    it is never fetched and torch is never imported. `backend` picks how the
+    GNN runs: eager PyTorch, a traced TorchScript module or ONNX Runtime;
+    quantize=True swaps in dynamic int8 linear layers. With an EmbeddingIndex,
+    every GNN prediction also carries its top_k most similar indexed designs.
+    Each prediction summarises the cone_hops fan-in / fan-out cone around the
+    flagged signals; cone_rescore=True also runs the GNN on that subgraph and
+    lets a higher cone score raise the design's GNN score.
+    """
+
+    def __init__(self, gnn_weight=0.6, stat_weight=0.4, max_nodes_per_batch=4096,
+                 model_version: str = MODEL_VERSION, models: Optional[ModelRegistry] = None,
+                 backend: str = "eager", quantize: bool = False, index: Optional[EmbeddingIndex] = None,
+                 top_k: int = 5, cone_hops: int = 2, cone_rescore: bool = False):
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"unknown inference backend {backend!r}; expected one of {INFERENCE_BACKENDS}")
+        self.gnn_weight  = gnn_weight
+        self.stat_weight = stat_weight
+        self.max_nodes_per_batch = max_nodes_per_batch
+        self.model_version = model_version
+        self.backend     = backend
+        self.quantize    = quantize
+        self.models      = models or ModelRegistry.default()
+        self.stat_det    = StatisticalTrojanDetector()
+        self.index       = index
+        self.top_k       = top_k
+        self.cone_hops   = cone_hops
+        self.cone_rescore = cone_rescore
+        self.last_batches = 0
+        self.model_wait_s = 0.0                            # time this instance spent obtaining the GNN
+        self._gnn: Optional["ArmorIQ_GNN"] = None
+        self._engine: Optional["InferenceEngine"] = None
+
+    @property
+    def statistical_only(self) -> bool:
+        return self.gnn_weight == 0
+
+    @property
+    def gnn_model(self) -> "ArmorIQ_GNN":
+        if self._gnn is None:
+            t0 = time.perf_counter()
+            self._gnn = self.models.get(self.model_version)
+            self.model_wait_s = time.perf_counter() - t0
+        return self._gnn
+
+    @property
+    def engine(self) -> "InferenceEngine":
+        if self._engine is None:
+            t0 = time.perf_counter()
+            self._engine = self.models.engine(self.model_version, self.backend, self.quantize)
+            self._gnn    = self._engine.model
+            self.model_wait_s = time.perf_counter() - t0
+        return self._engine
+
+    def predict(self, module: VerilogModule, graph: Optional["Data"], golden: Optional[Golden]=None,
+                stat_res: Optional[Dict]=None) -> Dict:
+        if self.statistical_only:
+            return self._blend(module, None, None, golden, stat_res)
+        from torch_geometric.data import Batch
+        out, emb = self.engine(Batch.from_data_list([graph]))
+        return self._rescore([(0, self._blend(module, out[0], emb[0], golden, stat_res))], [module], [graph])[0][1]
+
+    def batches(self, graphs: List["Data"]) -> List[List[int]]:
+        """Greedy in-order packing under max_nodes_per_batch; an oversized graph gets a batch of its own"""
+        out, cur, n = [], [], 0
+        for i, g in enumerate(graphs):
+            k = g.num_nodes
+            if cur and n + k > self.max_nodes_per_batch:
+                out.append(cur); cur, n = [], 0
+            cur.append(i); n += k
+        if cur:
+            out.append(cur)
+        return out
+
+    def predict_many(self, modules: List[VerilogModule], graphs: List[Optional["Data"]], golden: Optional[Golden]=None,
+                     stats: Optional[List[Dict]]=None, gnn: Optional[List[Optional[Tuple]]]=None) -> List[Dict]:
+        """
+        One GNN forward pass per size-bounded mini-batch; same per-design dicts as predict().
+        gnn[i] = (logits, embedding) arrays from a previous run skips inference for design i.
+        """
+        preds: List[Optional[Dict]] = [None] * len(graphs)
+        for i, pred in self.iter_predict(modules, graphs, golden, stats, gnn):
+            preds[i] = pred
+        return preds
+
+    def iter_predict(self, modules: List[VerilogModule], graphs: List[Optional["Data"]], golden: Optional[Golden]=None,
+                     stats: Optional[List[Dict]]=None, gnn: Optional[List[Optional[Tuple]]]=None
+                     ) -> Iterator[Tuple[int, Dict]]:
+        """(index, prediction) pairs as they become available: cached designs first, then batch by batch"""
+        if self.statistical_only:                          # graphs may be None; no GNN work at all
+            self.last_batches = 0
+            for i, m in enumerate(modules):
+                yield i, self._blend(m, None, None, golden, stats[i] if stats else None)
+            return
+        import torch
+        from torch_geometric.data import Batch
+        done = [False] * len(graphs)
+        items = []
+        for i, out in enumerate(gnn or []):
+            if out is not None:
+                done[i] = True
+                items.append((i, self._blend(modules[i], torch.from_numpy(out[0]), torch.from_numpy(out[1]),
+                                             golden, stats[i] if stats else None)))
+        yield from self._rescore(items, modules, graphs)
+        live = [i for i in range(len(graphs)) if not done[i]]
+        chunks = self.batches([graphs[i] for i in live])
+        self.last_batches = len(chunks)
+        for chunk in chunks:
+            idx = [live[j] for j in chunk]
+            out, emb = self.engine(Batch.from_data_list([graphs[i] for i in idx]))
+            yield from self._rescore([(i, self._blend(modules[i], out[row], emb[row], golden, stats[i] if stats else None))
+                                      for row, i in enumerate(idx)], modules, graphs)
+
+    def _rescore(self, items: List[Tuple[int, Dict]], modules: List[VerilogModule],
+                 graphs: List[Optional["Data"]]) -> List[Tuple[int, Dict]]:
+        """With cone_rescore: one GNN pass per size-bounded batch of flagged-cone subgraphs"""
+        todo = [(i, p) for i, p in items if self.cone_rescore and p.get('cone') and p['cone']['signals']
+                and graphs[i] is not None and graphs[i].num_nodes == len(modules[i].signals)]
+        if not todo:
+            return items
+        from torch_geometric.data import Batch
+        subs = [flagged_cone(modules[i], p['anomalies'], self.cone_hops).to_data(graphs[i]) for i, p in todo]
+        for chunk in self.batches(subs):
+            out, _ = self.engine(Batch.from_data_list([subs[j] for j in chunk]))
+            probs = out.softmax(dim=1)[:, 1].tolist()
+            for row, j in enumerate(chunk):
+                p = todo[j][1]
+                p['cone']['gnn_score'] = probs[row]
+                p.update(self.reblend(p, self.gnn_weight, self.stat_weight))
+        return items
+
+    @staticmethod
+    def blend(gnn_score: float, stat_score: float, gnn_weight: float, stat_weight: float, gnn_conf: float = 0.0,
+              stat_conf: float = 0.5, gnn_pred: Optional[int] = None) -> Tuple[float, int, float]:
+        """(hybrid score, verdict, confidence) from the two opinions; gnn_pred None = statistical only"""
+        hybrid = gnn_weight*gnn_score + stat_weight*stat_score
+        pred   = 1 if hybrid>0.5 else 0
+        if gnn_pred is None:
+            conf = stat_conf
+        else:
+            conf = (gnn_conf+stat_conf)/2 if gnn_pred==(1 if stat_score>0.5 else 0) else abs(hybrid-0.5)*2
+        return hybrid, pred, conf
+
+    @classmethod
+    def reblend(cls, pred: Dict, gnn_weight: float, stat_weight: float) -> Dict:
+        """
+        Copy of a prediction re-weighted from its stored scores — no model, no
+        re-analysis. gnn_weight 0 gives the statistical-only prediction: GNN
+        outputs (score, embedding, similar designs, cone score) are dropped.
+        """
+        if gnn_weight == 0:
+            pred = {k: v for k, v in pred.items() if k not in ('similar', 'near_duplicate')}
+            pred.update(gnn_score=0.0, gnn_confidence=0.0, embedding=None, gnn_logits=None, method='statistical')
+            if pred.get('cone'):
+                pred['cone'] = {k: v for k, v in pred['cone'].items() if k != 'gnn_score'}
+            if pred.get('golden'):
+                pred['golden'] = {**pred['golden'], 'embedding_distance': None}
+        gnn = max(pred['gnn_score'], (pred.get('cone') or {}).get('gnn_score') or 0.0)
+        gnn_pred = None if pred['method'] == 'statistical' else int(pred['gnn_score'] > 0.5)
+        hybrid, verdict, conf = cls.blend(gnn, pred['statistical_score'], gnn_weight, stat_weight,
+                                          pred['gnn_confidence'], pred['statistical_confidence'], gnn_pred)
+        return {**pred, 'hybrid_score': hybrid, 'prediction': verdict, 'confidence': conf}
+
+    def _blend(self, module: VerilogModule, logits: Optional["torch.Tensor"], emb: Optional["torch.Tensor"],
+               golden: Optional[Golden]=None, stat_res: Optional[Dict]=None) -> Dict:
+        match = None
+        if isinstance(golden, GoldenStore):                # nearest known-clean reference stands in as golden
+            store  = golden
+            match  = store.nearest(self.stat_det.compute_structural_features(module))[0] if store else None
+            golden = match['features'] if match else None
+
+        gnn_pred, gnn_conf, gnn_score = None, 0.0, 0.0     # statistical-only: no GNN opinion
+        if logits is not None:
+            import torch.nn.functional as F
+            probs     = F.softmax(logits,dim=0)
+            gnn_pred  = logits.argmax().item()
+            gnn_conf  = probs[gnn_pred].item()
+            gnn_score = probs[1].item()
+
+        if stat_res is None or golden:                     # cached results are golden-free
+            stat_res = self.stat_det.analyze(module, golden)
+        stat_score = stat_res['score']
+        stat_conf  = stat_res.get('confidence',0.5)
+
+        hybrid, pred, conf = self.blend(gnn_score, stat_score, self.gnn_weight, self.stat_weight,
+                                        gnn_conf, stat_conf, gnn_pred)
+
+        out = {
+            'prediction': pred, 'confidence': conf,
+            'hybrid_score': hybrid, 'gnn_score': gnn_score,
+            'gnn_confidence': gnn_conf, 'statistical_score': stat_score,
+            'statistical_confidence': stat_conf, 'anomalies': stat_res,
+            'embedding':  None if emb is None else emb.numpy(),
+            'gnn_logits': None if logits is None else logits.numpy(),
+            'method': 'statistical' if logits is None else 'hybrid'
+        }
+        if self.cone_hops > 0:
+            cone = flagged_cone(module, stat_res, self.cone_hops)
+            out['cone'] = cone.summary() if len(cone.seeds) else None
+        if self.index is not None and out['embedding'] is not None:
+            sim = self.index.search(out['embedding'], self.top_k)
+            out['similar'] = sim
+            out['near_duplicate'] = sim[0] if sim and sim[0]['distance'] <= self.index.duplicate_distance else None
+        if match:
+            out['golden'] = {'reference': match['reference'], 'distance': match['distance'],
+                             'embedding_distance': store.embedding_distance(match['row'], out['embedding'])}
+        return out
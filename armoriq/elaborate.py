@@ -0,0 +1,114 @@
+"""Instance-hierarchy elaboration with memoised per-definition analysis"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
+
+from .graph import EnhancedGraphBuilder
+from .stats import StatisticalTrojanDetector
+from .structures import VerilogModule
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DESIGN ELABORATION
+# ─────────────────────────────────────────────────────────────────────────────
+def analyze_module(builder: Optional[EnhancedGraphBuilder], stat_det: StatisticalTrojanDetector,
+                   module: VerilogModule) -> Dict:
+    """builder=None (statistical-only scoring) skips the GNN input graph"""
+    return {
+        'graph':    builder.build(module) if builder is not None else None,
+        'features': stat_det.compute_structural_features(module),
+        'stats':    stat_det.analyze(module),
+    }
+
+
+class DesignElaborator:
+    """
+    Resolves VerilogModule.instances into a hierarchy across every uploaded
+    file. Each unique definition is analysed once (graph + statistics) and
+    per-instance results are composed upward from the memoized leaves.
+    Every added module is a design of its own; when a name is defined more
+    than once the first definition resolves instances (`duplicates` lists the
+    later ones), but each variant is still analysed and scored.
+    """
+
+    def __init__(self, builder: Optional[EnhancedGraphBuilder], stat_det: StatisticalTrojanDetector):
+        self.builder    = builder
+        self.stat_det   = stat_det
+        self.defs:      Dict[str, VerilogModule] = {}
+        self.origin:    Dict[str, str] = {}
+        self.designs:   List[Tuple[str, VerilogModule]] = []
+        self.duplicates: List[Tuple[str, str]] = []
+        self._analysis: Dict[int, Dict] = {}               # id(module) → analysis; modules held by `designs`
+        self._rollup:   Dict[str, Dict] = {}
+
+    def add(self, module: VerilogModule, filename: str = "", analysis: Optional[Dict] = None) -> bool:
+        """Register a design (optionally with a cached analysis); False if an earlier same-name definition resolves instances"""
+        self.designs.append((filename, module))
+        if analysis is not None:
+            self._analysis[id(module)] = analysis
+        if module.name in self.defs:
+            self.duplicates.append((module.name, filename)); return False
+        self.defs[module.name] = module
+        self.origin[module.name] = filename or module.name
+        self._rollup.clear()
+        return True
+
+    def children(self, name: str) -> Dict[str, int]:
+        """Instantiated module type → count, in order of first instantiation"""
+        out: Dict[str, int] = {}
+        for inst in self.defs[name].instances:
+            mtype = inst.split()[0]
+            out[mtype] = out.get(mtype, 0) + 1
+        return out
+
+    def tops(self) -> List[str]:
+        used = {c for n in self.defs for c in self.children(n)}
+        return [n for n in self.defs if n not in used]
+
+    def analyze(self, design: Union[str, VerilogModule]) -> Dict:
+        """Graph, structural features and statistical result of a design, or of the definition of a name (memoized)"""
+        module = self.defs[design] if isinstance(design, str) else design
+        if id(module) not in self._analysis:
+            self._analysis[id(module)] = analyze_module(self.builder, self.stat_det, module)
+        return self._analysis[id(module)]
+
+    def rollup(self, name: str, _active: Optional[set] = None) -> Dict:
+        """Flattened view of `name`: instance counts, signal totals and the worst sub-design"""
+        if name in self._rollup:
+            return self._rollup[name]
+        active = _active if _active is not None else set()
+        active.add(name)
+        own = self.analyze(name)['stats']['score']
+        r = {'module': name, 'instances': 0, 'signals': len(self.defs[name].signals),
+             'score': own, 'worst': name, 'counts': defaultdict(int), 'unresolved': set(),
+             'recursive': False}
+        for child, k in self.children(name).items():
+            if child not in self.defs:
+                r['unresolved'].add(child); r['instances'] += k; continue
+            if child in active:
+                r['recursive'] = True; continue
+            c = self.rollup(child, active)
+            r['instances'] += k * (1 + c['instances'])
+            r['signals']   += k * c['signals']
+            r['counts'][child] += k
+            for m, cnt in c['counts'].items():
+                r['counts'][m] += k * cnt
+            r['unresolved'].update(c['unresolved'])
+            r['recursive']  |= c['recursive']
+            if c['score'] > r['score']:
+                r['score'], r['worst'] = c['score'], c['worst']
+        active.discard(name)
+        r['counts'], r['unresolved'] = dict(r['counts']), sorted(r['unresolved'])
+        if not r['recursive']:                              # a cycle member's view depends on entry point
+            self._rollup[name] = r
+        return r
+
+    def hierarchy(self, name: str, depth: int = 0, max_depth: int = 32) -> List[Tuple[int, str, int]]:
+        """(depth, module, multiplicity) rows for a tree view; shared sub-trees expanded once per parent"""
+        rows = [(depth, name, 1)] if depth == 0 else []
+        if depth >= max_depth or name not in self.defs:
+            return rows
+        for child, k in self.children(name).items():
+            rows.append((depth + 1, child, k))
+            rows.extend(self.hierarchy(child, depth + 1, max_depth))
+        return rows
@@ -0,0 +1,197 @@
+"""Exported CPU inference backends for ArmorIQ_GNN: eager, TorchScript, ONNX Runtime"""
+
+import copy
+import logging
+import os
+import tempfile
+import time
+import warnings
+from typing import Dict, Optional, Tuple
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from .constants import INFERENCE_BACKENDS
+from .gnn import ArmorIQ_GNN
+
+ENGINE_FORMAT = 1                                          # bump when TensorGNN's graph changes
+EXTENSIONS = {'torchscript': 'ts', 'onnx': 'onnx'}
+INPUTS  = ['x', 'edge_index', 'batch', 'ptr']
+OUTPUTS = ['logits', 'embedding']
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# EXPORTABLE FORWARD
+# ─────────────────────────────────────────────────────────────────────────────
+class TensorGNN(nn.Module):
+    """
+    ArmorIQ_GNN's eval forward over plain tensors (x, edge_index, batch, ptr).
+    Pooling is written with scatter ops sized from ptr, so the graph count,
+    node count and edge count all stay dynamic when traced or exported.
+    """
+
+    def __init__(self, model: ArmorIQ_GNN):
+        super().__init__()
+        self.model = model
+
+    def forward(self, x, edge_index, batch, ptr):
+        m = self.model
+        x = m.embed(x)
+        for i,(gat,bn) in enumerate(zip(m.gat_layers,m.batch_norms)):
+            xp = x; x = bn(F.elu(gat(x,edge_index)))
+            if i>0: x = x+xp
+        cnt = (ptr[1:]-ptr[:-1]).to(x.dtype).unsqueeze(1)
+        idx = batch.unsqueeze(1).expand(-1, x.size(1))
+        z   = x.new_zeros(ptr.size(0)-1, x.size(1))
+        add = z.scatter_add(0, idx, x)
+        mx  = torch.full_like(z, float('-inf')).scatter_reduce(0, idx, x, 'amax')
+        mx  = torch.where(cnt > 0.5, mx, z)                # empty graph → 0, as global_max_pool
+        g   = torch.cat([add/cnt.clamp(min=1), mx, add], dim=1)
+        return m.classifier(g), g
+
+
+def example_inputs(input_dim: int = 48) -> Tuple[torch.Tensor, ...]:
+    """Two small random graphs, enough for the tracer to see every op"""
+    gen = torch.Generator().manual_seed(0)
+    n   = (9, 5)
+    x   = torch.randn(sum(n), input_dim, generator=gen)
+    ei  = torch.cat([torch.randint(0, n[0], (2, 20), generator=gen),
+                     torch.randint(0, n[1], (2, 12), generator=gen) + n[0]], dim=1)
+    batch = torch.repeat_interleave(torch.arange(len(n)), torch.tensor(n))
+    return x, ei, batch, torch.tensor([0, n[0], n[0]+n[1]])
+
+
+def configure_threads(intra: int = 0, inter: int = 0) -> Dict[str, int]:
+    """
+    Process-wide torch intra-/inter-op thread counts (0 = leave as is); ONNX
+    Runtime sessions created afterwards follow them. Inter-op threads can only
+    be set before torch's first parallel region, later requests are ignored.
+    """
+    if intra:
+        torch.set_num_threads(intra)
+    if inter and inter != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(inter)
+        except RuntimeError:
+            pass
+    return {'intra': torch.get_num_threads(), 'inter': torch.get_num_interop_threads()}
+
+
+def quantize_dynamic(model: ArmorIQ_GNN) -> ArmorIQ_GNN:
+    """
+    Copy of `model` with every nn.Linear (embed + classifier head) as dynamic
+    int8: weights stored int8, activations quantized per call. GATConv keeps
+    its PyG fp32 projections.
+    """
+    from torch.ao.quantization import quantize_dynamic as qd
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return qd(copy.deepcopy(model), {nn.Linear}, dtype=torch.qint8).eval()
+
+
+def _atomic(path: str, write):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        try: os.remove(tmp)
+        except OSError: pass
+        raise
+    return path
+
+
+def export_torchscript(model: ArmorIQ_GNN, path: str) -> str:
+    """Trace + freeze the eval forward and save it with torch.jit.save"""
+    model.eval()
+    with torch.no_grad(), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ts = torch.jit.trace(TensorGNN(model).eval(), example_inputs(model.embed[0].in_features), check_trace=False)
+        ts = torch.jit.freeze(ts)
+    return _atomic(path, lambda tmp: torch.jit.save(ts, tmp))
+
+
+def export_onnx(model: ArmorIQ_GNN, path: str, opset: int = 18) -> str:
+    """TorchScript-based ONNX export with dynamic node / edge / graph axes"""
+    model.eval()
+    axes = {'x': {0: 'nodes'}, 'edge_index': {1: 'edges'}, 'batch': {0: 'nodes'}, 'ptr': {0: 'graphs_p1'},
+            'logits': {0: 'graphs'}, 'embedding': {0: 'graphs'}}
+    def write(tmp):
+        with torch.no_grad(), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            torch.onnx.export(TensorGNN(model).eval(), example_inputs(model.embed[0].in_features), tmp,
+                              dynamo=False, opset_version=opset, input_names=INPUTS, output_names=OUTPUTS,
+                              dynamic_axes=axes)
+    return _atomic(path, write)
+
+
+def quantize_onnx(src: str, path: str) -> str:
+    """ONNX Runtime dynamic int8 quantization of every MatMul / Gemm weight in `src`"""
+    from onnxruntime.quantization import QuantType
+    from onnxruntime.quantization import quantize_dynamic as qd
+    root, level = logging.getLogger(), logging.getLogger().level
+    root.setLevel(logging.ERROR)                           # per-tensor shape-inference notices via the root logger
+    try:
+        return _atomic(path, lambda tmp: qd(src, tmp, weight_type=QuantType.QInt8))
+    finally:
+        root.setLevel(level)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# INFERENCE ENGINE
+# ─────────────────────────────────────────────────────────────────────────────
+class InferenceEngine:
+    """
+    engine(batch) → (logits, embedding) tensors, whatever the backend.
+    Exported artifacts are written once to `path` and reused afterwards;
+    an empty batch always goes through the eager model. quantize=True runs
+    the dynamic int8 variant (torch for eager / torchscript, ONNX Runtime's
+    quantizer for onnx).
+    """
+
+    def __init__(self, model: ArmorIQ_GNN, backend: str = "eager", path: Optional[str] = None,
+                 quantize: bool = False):
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"unknown inference backend {backend!r}; expected one of {INFERENCE_BACKENDS}")
+        if backend != "eager" and path is None:
+            raise ValueError(f"{backend} backend needs an artifact path")
+        self.backend, self.path, self.quantize = backend, path, quantize
+        self.export_s = 0.0
+        t0 = time.perf_counter()
+        self.model = quantize_dynamic(model) if quantize and backend != "onnx" else model
+        if backend == "torchscript":
+            if not os.path.exists(path):
+                export_torchscript(self.model, path); self.export_s = time.perf_counter() - t0
+            self._ts = torch.jit.load(path, map_location="cpu")
+        elif backend == "onnx":
+            try:
+                import onnxruntime as ort
+            except ImportError as e:
+                raise ImportError("the onnx backend needs onnxruntime (pip install onnxruntime)") from e
+            if not os.path.exists(path):
+                if quantize:
+                    with tempfile.TemporaryDirectory() as tmp:
+                        quantize_onnx(export_onnx(model, os.path.join(tmp, "fp32.onnx")), path)
+                else:
+                    export_onnx(model, path)
+                self.export_s = time.perf_counter() - t0
+            so = ort.SessionOptions()
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            so.intra_op_num_threads = torch.get_num_threads()
+            so.inter_op_num_threads = torch.get_num_interop_threads()
+            so.log_severity_level = 3                      # dynamic-shape notices on every run otherwise
+            self._sess = ort.InferenceSession(path, so, providers=["CPUExecutionProvider"])
+        self.load_s = time.perf_counter() - t0
+
+    def __call__(self, batch) -> Tuple[torch.Tensor, torch.Tensor]:
+        with torch.no_grad():
+            if self.backend == "eager" or batch.num_nodes == 0:
+                return self.model(batch)
+            if self.backend == "torchscript":
+                return self._ts(batch.x, batch.edge_index, batch.batch, batch.ptr)
+            out, emb = self._sess.run(OUTPUTS, {'x': batch.x.numpy(), 'edge_index': batch.edge_index.numpy(),
+                                                'batch': batch.batch.numpy(), 'ptr': batch.ptr.numpy()})
+            return torch.from_numpy(out), torch.from_numpy(emb)
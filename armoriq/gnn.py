@@ -0,0 +1,38 @@
+"""ArmorIQ graph-attention classifier"""
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+from torch_geometric.nn import GATConv, global_add_pool, global_max_pool, global_mean_pool
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GNN MODEL
+# ─────────────────────────────────────────────────────────────────────────────
+class ArmorIQ_GNN(nn.Module):
+    def __init__(self, input_dim=48, hidden_dim=256, num_layers=4):
+        super().__init__()
+        self.embed = nn.Sequential(
+            nn.Linear(input_dim, hidden_dim),
+            nn.BatchNorm1d(hidden_dim), nn.ELU(), nn.Dropout(0.15)
+        )
+        self.gat_layers  = nn.ModuleList([GATConv(hidden_dim,hidden_dim//8,heads=8,dropout=0.15,concat=True) for _ in range(num_layers)])
+        self.batch_norms = nn.ModuleList([nn.BatchNorm1d(hidden_dim) for _ in range(num_layers)])
+        pool_dim = hidden_dim * 3
+        self.classifier = nn.Sequential(
+            nn.Linear(pool_dim,hidden_dim*2), nn.ELU(), nn.Dropout(0.3),
+            nn.Linear(hidden_dim*2,hidden_dim), nn.ELU(), nn.Dropout(0.3),
+            nn.Linear(hidden_dim,hidden_dim//2), nn.ELU(),
+            nn.Linear(hidden_dim//2,2)
+        )
+
+    def forward(self, data):
+        x,ei,batch = data.x, data.edge_index, data.batch
+        x = self.embed(x)
+        for i,(gat,bn) in enumerate(zip(self.gat_layers,self.batch_norms)):
+            xp = x; x = F.elu(gat(x,ei)); x = bn(x)
+            if i>0: x = x+xp
+            x = F.dropout(x,p=0.15,training=self.training)
+        g = torch.cat([global_mean_pool(x,batch),global_max_pool(x,batch),global_add_pool(x,batch)],dim=1)
+        out = self.classifier(g)
+        return out, g
@@ -0,0 +1,201 @@
+"""Persistent golden-reference store with nearest-neighbour lookup"""
+
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import MODEL_VERSION
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# NEAREST-NEIGHBOUR INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+class BruteForceIndex:
+    """
+    Exact k-NN over a dense (n, d) matrix: one matrix-vector product per query
+    using |q-x|² = |q|² - 2 q·x + |x|², with row norms precomputed at build time.
+    metric='cosine' normalises rows and queries and returns 1 - cos.
+    """
+
+    def __init__(self, vectors: np.ndarray, metric: str = 'l2', dtype=np.float32):
+        if metric not in ('l2', 'cosine'):
+            raise ValueError(f"unknown metric {metric!r}")
+        self.metric = metric
+        x = np.ascontiguousarray(vectors, dtype=dtype).reshape(len(vectors), -1)
+        if metric == 'cosine':
+            x = x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+        self.x  = x
+        self.sq = np.einsum('ij,ij->i', x, x)
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def search(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """(distances, indices), each (m, k) sorted nearest-first; L2 distances are Euclidean"""
+        q = np.asarray(queries, dtype=self.x.dtype).reshape(-1, self.x.shape[1])
+        k = min(k, len(self))
+        if k == 0:
+            return np.zeros((len(q), 0), self.x.dtype), np.zeros((len(q), 0), np.int64)
+        if self.metric == 'cosine':
+            q = q / np.maximum(np.linalg.norm(q, axis=1, keepdims=True), 1e-12)
+            d = 1.0 - q @ self.x.T
+        else:
+            d = np.einsum('ij,ij->i', q, q)[:, None] - 2.0 * (q @ self.x.T) + self.sq[None, :]
+        idx = np.argpartition(d, k - 1, axis=1)[:, :k] if k < d.shape[1] else np.tile(np.arange(d.shape[1]), (len(q), 1))
+        dk  = np.take_along_axis(d, idx, axis=1)
+        o   = np.argsort(dk, axis=1, kind='stable')
+        idx, dk = np.take_along_axis(idx, o, axis=1), np.take_along_axis(dk, o, axis=1)
+        if self.metric == 'l2':
+            dk = np.sqrt(np.maximum(dk, 0.0))
+        return dk, idx.astype(np.int64)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GOLDEN STORE
+# ─────────────────────────────────────────────────────────────────────────────
+# compute_structural_features keys, in vector-column order
+GOLDEN_FEATURES = ['num_signals', 'num_assignments', 'num_always_blocks', 'num_instances',
+                   'input_ratio', 'output_ratio', 'reg_ratio', 'avg_fanin', 'max_fanin',
+                   'avg_fanout', 'max_fanout', 'avg_width', 'max_width', 'logic_complexity']
+
+
+class GoldenStore:
+    """
+    Known-clean reference designs on disk: structural feature vectors plus GNN
+    embeddings, keyed by "file:module" (re-adding a key replaces it). Uploaded
+    designs are matched to their closest reference in log1p feature space via
+    BruteForceIndex; the index is rebuilt lazily after the store changes. The whole store is one .npz, written
+    atomically.
+    """
+
+    FILENAME = "golden.npz"
+
+    def __init__(self, root: Optional[str] = None, model_version: str = MODEL_VERSION):
+        self.root = root or os.environ.get("ARMORIQ_GOLDEN_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "armoriq", "golden")
+        self.keys: List[str] = []
+        self.features = np.zeros((0, len(GOLDEN_FEATURES)), dtype=np.float64)
+        self.embeddings: Optional[np.ndarray] = None      # (n, d) float32, rows of zeros where missing
+        self.has_embedding = np.zeros(0, dtype=bool)
+        self.model_version = model_version
+        self._index: Optional[BruteForceIndex] = None
+        self.load()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.root, self.FILENAME)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ── persistence ──────────────────────────────────────────────────────────
+    def load(self):
+        try:
+            with np.load(self.path, allow_pickle=False) as z:
+                meta = json.loads(str(z['meta']))
+                if meta.get('features') != GOLDEN_FEATURES:
+                    return                                  # incompatible layout: start empty
+                self.keys, self.features = z['keys'].tolist(), z['features'].astype(np.float64)
+                self.has_embedding = z['has_embedding'].astype(bool)
+                self.embeddings = z['embeddings'] if z['embeddings'].size else None
+                stored = meta.get('model', self.model_version)
+        except FileNotFoundError:
+            return
+        if stored != self.model_version:                    # embeddings from another model are meaningless
+            self.embeddings, self.has_embedding = None, np.zeros(len(self.keys), dtype=bool)
+        self._index = None
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        emb = self.embeddings if self.embeddings is not None else np.zeros((0, 0), np.float32)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez(fh, keys=np.array(self.keys, dtype=str), features=self.features,
+                         embeddings=emb, has_embedding=self.has_embedding,
+                         meta=np.array(json.dumps({'features': GOLDEN_FEATURES, 'model': self.model_version})))
+            os.replace(tmp, self.path)
+        except Exception:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+
+    def clear(self):
+        self.keys, self.features = [], np.zeros((0, len(GOLDEN_FEATURES)), dtype=np.float64)
+        self.embeddings, self.has_embedding, self._index = None, np.zeros(0, dtype=bool), None
+        try: os.remove(self.path)
+        except OSError: pass
+
+    # ── ingestion ────────────────────────────────────────────────────────────
+    @staticmethod
+    def vector(features: Dict) -> np.ndarray:
+        return np.array([float(features.get(k, 0.0)) for k in GOLDEN_FEATURES], dtype=np.float64)
+
+    def add(self, key: str, features: Dict, embedding: Optional[np.ndarray] = None):
+        """Insert or replace one reference; call save() to persist"""
+        self.add_many([key], [features], [embedding])
+
+    def add_many(self, keys: Sequence[str], features: Sequence[Dict],
+                 embeddings: Optional[Sequence[Optional[np.ndarray]]] = None) -> int:
+        """Insert or replace references in bulk (one reallocation per call); returns how many were new"""
+        embeddings = embeddings if embeddings is not None else [None] * len(keys)
+        dim = next((np.asarray(e).size for e in embeddings if e is not None), None)
+        if dim is not None and self.embeddings is not None and dim != self.embeddings.shape[1]:
+            raise ValueError(f"embedding dim {dim} != store dim {self.embeddings.shape[1]}")
+        row = {k: i for i, k in enumerate(self.keys)}
+        new = [k for k in dict.fromkeys(keys) if k not in row]
+        for k in new:
+            row[k] = len(self.keys); self.keys.append(k)
+        n = len(self.keys)
+        self.features = np.vstack([self.features, np.zeros((len(new), len(GOLDEN_FEATURES)))])
+        self.has_embedding = np.concatenate([self.has_embedding, np.zeros(len(new), dtype=bool)])
+        if dim is not None and self.embeddings is None:
+            self.embeddings = np.zeros((0, dim), dtype=np.float32)
+        if self.embeddings is not None:
+            self.embeddings = np.vstack([self.embeddings,
+                                         np.zeros((n - len(self.embeddings), self.embeddings.shape[1]), np.float32)])
+        for k, f, e in zip(keys, features, embeddings):
+            i = row[k]
+            self.features[i] = self.vector(f)
+            if e is not None:
+                self.embeddings[i], self.has_embedding[i] = np.asarray(e, dtype=np.float32).ravel(), True
+        self._index = None
+        return len(new)
+
+    # ── lookup ───────────────────────────────────────────────────────────────
+    @staticmethod
+    def _space(v: np.ndarray) -> np.ndarray:
+        """Counts span orders of magnitude: compare log1p values, i.e. roughly relative differences"""
+        return np.log1p(np.maximum(v, 0.0))
+
+    @property
+    def index(self) -> BruteForceIndex:
+        if self._index is None:
+            self._index = BruteForceIndex(self._space(self.features), dtype=np.float64)
+        return self._index
+
+    def nearest(self, features: Dict, k: int = 1) -> List[Dict]:
+        """Closest references to one design: [{'reference', 'row', 'distance', 'features'}] nearest-first"""
+        if not self.keys:
+            return []
+        dist, idx = self.index.search(self._space(self.vector(features))[None], k)
+        return [{'reference': self.keys[i], 'row': i, 'distance': float(d),
+                 'features': dict(zip(GOLDEN_FEATURES, self.features[i].tolist()))}
+                for d, i in zip(dist[0].tolist(), idx[0].tolist())]
+
+    def embedding_distance(self, i: int, embedding: Optional[np.ndarray]) -> Optional[float]:
+        """Cosine distance between a design's GNN embedding and reference row i's, if both exist"""
+        if embedding is None or self.embeddings is None or not self.has_embedding[i]:
+            return None
+        a, b = np.asarray(embedding, dtype=np.float32).ravel(), self.embeddings[i]
+        return float(1.0 - a @ b / max(float(np.linalg.norm(a) * np.linalg.norm(b)), 1e-12))
+
+    def summary(self) -> Dict:
+        return {'references': len(self), 'with_embedding': int(self.has_embedding.sum()),
+                'model': self.model_version, 'path': self.path}
+
+
+Golden = Union[Dict, GoldenStore]      # fixed reference features, or a store matched per design
@@ -0,0 +1,85 @@
+"""Node-feature construction: VerilogModule → PyG Data"""
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+
+from .centrality import CentralityEngine
+from .names import NameClassifier
+from .netlist import SIGNAL_TYPE_CODES, NetlistGraph, get_signal_table
+from .structures import VerilogModule
+
+if TYPE_CHECKING:
+    from torch_geometric.data import Data
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GRAPH BUILDER
+# ─────────────────────────────────────────────────────────────────────────────
+class EnhancedGraphBuilder:
+    def __init__(self, feature_dim=48, centrality: Optional[CentralityEngine] = None,
+                 names: Optional[NameClassifier] = None):
+        self.feature_dim = feature_dim
+        self.type_map = dict(SIGNAL_TYPE_CODES)
+        self.centrality = centrality or CentralityEngine()
+        # 'feature' family → columns 14–22, 'indexed' → column 36
+        self.names = names or NameClassifier.default()
+
+    @property
+    def name_patterns(self):
+        return self.names.families['feature']
+
+    def _graph_metrics(self, netlist: NetlistGraph) -> Dict[str, np.ndarray]:
+        """Run each centrality once over the module graph; arrays are aligned with netlist node ids"""
+        return self.centrality.compute(netlist)
+
+    def build(self, module: VerilogModule) -> "Data":
+        import torch
+        from torch_geometric.data import Data
+        n = len(module.signals)
+        if n == 0:
+            return Data(x=torch.zeros((1,self.feature_dim)),
+                        edge_index=torch.zeros((2,0),dtype=torch.long),
+                        edge_attr=torch.zeros((0,1)))
+
+        # Columnar view of the module: one array per signal attribute
+        t     = get_signal_table(module)
+        nl    = t.netlist
+        names = t.names
+        w     = t.width.astype(np.float64)
+        fi    = t.fanin.astype(np.float64)
+        fo    = t.fanout.astype(np.float64)
+        is_in, is_out = t.is_kind('input'), t.is_kind('output')
+        nm    = self.names.masks(nl)
+
+        mw, sw = np.mean(w),  np.std(w)+1e-6
+        mf, sf = np.mean(fo), np.std(fo)+1e-6
+
+        x = np.zeros((n, self.feature_dim), dtype=np.float32)
+        x[np.arange(n), t.kind] = 1
+        x[:, 5]  = np.minimum(w/64.0, 1.0)
+        x[:, 6]  = w > 32
+        x[:, 7]  = np.log2(w+1)/8.0
+        x[:, 8]  = t.is_clock
+        x[:, 9]  = t.is_reset
+        x[:,10]  = np.minimum(fi/20.0, 1.0)
+        x[:,11]  = np.minimum(fo/20.0, 1.0)
+        x[:,12]  = np.minimum(fi, 10)
+        x[:,13]  = np.minimum(fo, 10)
+        x[:,14:23] = self.names.bits(nm, 'feature', 9)
+        x[:,23]  = np.fromiter((len(nm) > 20 for nm in names), dtype=bool, count=n)
+        # Centralities are whole-graph quantities: one pass per module, columns 24–27 in bulk
+        gm = self._graph_metrics(nl)
+        x[:,24:28] = np.stack([gm['betweenness'], gm['closeness'],
+                               gm['pagerank'], gm['clustering']], axis=1)
+        x[:,28]  = (fi == 0) & (fo == 0)
+        x[:,29]  = (fi == 0) & ~is_in
+        x[:,30]  = (fo == 0) & ~is_out
+        x[:,31]  = (w - mw) / sw
+        x[:,32]  = (fo - mf) / sf
+        x[:,33]  = fo > 15
+        x[:,34]  = (w > 16) & (fo == 1)
+        x[:,35]  = fi > 10
+        x[:,36]  = nm['indexed'] != 0
+
+        return Data(x=torch.from_numpy(x), edge_index=nl.edge_index(), edge_attr=nl.edge_attr())
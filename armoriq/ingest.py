@@ -0,0 +1,80 @@
+"""Process-pool parse + graph build for multi-file uploads"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .centrality import CentralityEngine
+from .elaborate import analyze_module
+from .graph import EnhancedGraphBuilder
+from .parser import CompetitionVerilogParser
+from .stats import StatisticalTrojanDetector
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PARALLEL INGESTION
+# ─────────────────────────────────────────────────────────────────────────────
+_INGEST_WORKER: Dict[str, Any] = {}
+
+
+def _ingest_init(feature_dim: Optional[int], centrality: Dict[str, Any]):
+    """Per-process parser/builder/detector; one torch thread so workers don't oversubscribe cores.
+    feature_dim=None: statistics only, no graph builder and no torch"""
+    if feature_dim is not None:
+        import torch
+        torch.set_num_threads(1)
+    _INGEST_WORKER.update(
+        parser=CompetitionVerilogParser(),
+        builder=EnhancedGraphBuilder(feature_dim, CentralityEngine(**centrality)) if feature_dim is not None else None,
+        stat_det=StatisticalTrojanDetector(),
+    )
+
+
+def _ingest_one(name: str, data: bytes, w: Optional[Dict[str, Any]] = None) -> Dict:
+    """Parse every module in one file and analyse it; errors are returned, not raised"""
+    if w is None:
+        if not _INGEST_WORKER:
+            _ingest_init(48, {})
+        w = _INGEST_WORKER
+    t0 = time.perf_counter()
+    try:
+        entries = [{'module': mod, 'analysis': analyze_module(w['builder'], w['stat_det'], mod)}
+                   for mod in w['parser'].parse_modules(data.decode("utf-8", errors="ignore"))]
+        return {'name': name, 'entries': entries, 'error': None, 'seconds': time.perf_counter() - t0}
+    except Exception as e:
+        return {'name': name, 'entries': [], 'error': f"{type(e).__name__}: {e}",
+                'seconds': time.perf_counter() - t0}
+
+
+def ingest_files(files: List[Tuple[str, bytes]], builder: Optional[EnhancedGraphBuilder], workers: Optional[int] = None,
+                 progress=None, mp_context: Optional[str] = None, min_parallel: int = 4) -> List[Dict]:
+    """
+    Parse + build graphs for (name, bytes) pairs on a process pool. Results come
+    back in input order, one {'name','entries','error','seconds'} dict per file;
+    progress(done, total) fires as each file completes. Small batches (or
+    workers=1) run in-process. builder=None parses and runs statistics only.
+    """
+    n = len(files)
+    workers = min(workers or os.cpu_count() or 1, n)
+    init = (builder.feature_dim, builder.centrality.params()) if builder is not None else (None, {})
+    out: List[Optional[Dict]] = [None] * n
+    if workers <= 1 or n < min_parallel:
+        local = {'parser': CompetitionVerilogParser(), 'builder': builder, 'stat_det': StatisticalTrojanDetector()}
+        for i, (name, data) in enumerate(files):
+            out[i] = _ingest_one(name, data, local)
+            if progress: progress(i + 1, n)
+        return out
+
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    ctx = mp.get_context(mp_context) if mp_context else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_ingest_init, initargs=init) as ex:
+        futs = {ex.submit(_ingest_one, name, data): i for i, (name, data) in enumerate(files)}
+        for done, fut in enumerate(as_completed(futs), 1):
+            i = futs[fut]
+            try:
+                out[i] = fut.result()
+            except Exception as e:                          # worker died / result not picklable
+                out[i] = {'name': files[i][0], 'entries': [], 'error': f"{type(e).__name__}: {e}", 'seconds': 0.0}
+            if progress: progress(done, n)
+    return out
@@ -0,0 +1,247 @@
+"""Netlist view layouts: computed once per module hash, level-of-detail for large designs"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .centrality import _csr_from_edges, _expand
+from .cone import extract_cone
+from .netlist import NetlistGraph, get_netlist, get_signal_table
+from .structures import VerilogModule
+
+
+def netlist_digest(nl: NetlistGraph) -> str:
+    """Content hash of a netlist (signal names + edges); the layout cache key"""
+    d = nl.__dict__.get('_digest')
+    if d is None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update("\n".join(nl.names).encode()); h.update(nl.ei.tobytes())
+        d = nl.__dict__['_digest'] = h.hexdigest()
+    return d
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LAYOUTS
+# ─────────────────────────────────────────────────────────────────────────────
+def spring_layout(nl: NetlistGraph) -> np.ndarray:
+    """NetworkX Fruchterman-Reingold, as the original netlist view (small graphs only)"""
+    import networkx as nx
+    pos = nx.spring_layout(nl.to_networkx(), k=2.5, iterations=50, seed=42)
+    return np.array([pos[nm] for nm in nl.names], dtype=np.float32).reshape(-1, 2)
+
+
+def layered_layout(nl: NetlistGraph) -> np.ndarray:
+    """
+    Left-to-right dataflow layers in O(V + E): x = BFS depth from the
+    undriven signals (inputs / constants), y = rank inside the layer ordered by
+    the mean y of each node's drivers (one barycentre sweep). Nodes no source
+    reaches get a final layer.
+    """
+    n = nl.num_nodes
+    if n == 0:
+        return np.zeros((0, 2), np.float32)
+    indptr, indices, rows = _csr_from_edges(nl.ei[0], nl.ei[1], n)
+    level = np.full(n, -1, dtype=np.int64)
+    frontier = np.flatnonzero(nl.fanin == 0)
+    if not frontier.size:
+        frontier = np.array([int(np.argmax(nl.fanout))])
+    level[frontier], d = 0, 0
+    while frontier.size:
+        _, v = _expand(indptr, indices, frontier)
+        frontier = np.unique(v[level[v] == -1])
+        d += 1; level[frontier] = d
+    level[level < 0] = level.max() + 1
+
+    y = np.zeros(n, dtype=np.float64)
+    width = np.bincount(level)
+    for lv in range(len(width)):
+        nodes = np.flatnonzero(level == lv)
+        m = (level[indices] == lv) & (level[rows] < lv)    # edges into this layer from earlier layers
+        s = np.bincount(indices[m], weights=y[rows[m]], minlength=n)[nodes]
+        c = np.bincount(indices[m], minlength=n)[nodes]
+        bary = np.where(c > 0, s / np.maximum(c, 1), np.arange(len(nodes)) / max(len(nodes), 1))
+        rank = np.empty(len(nodes)); rank[np.argsort(bary, kind='stable')] = np.arange(len(nodes))
+        y[nodes] = (rank - (len(nodes) - 1) / 2) / max(width.max() - 1, 1) * 2
+    x = level / max(level.max(), 1) * 2 - 1
+    return np.stack([x, y], axis=1).astype(np.float32)
+
+
+LAYOUTS = {'spring': spring_layout, 'layered': layered_layout}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LAYOUT ENGINE
+# ─────────────────────────────────────────────────────────────────────────────
+class LayoutEngine:
+    """
+    Node positions per module hash, computed once and kept in a process-wide
+    LRU (plus .npy files under `root` when given, evicted least-recently-used
+    by mtime past max_bytes), and level-of-detail views built from them.
+    'auto' picks the spring layout up to spring_max nodes and the layered one
+    above.
+    """
+
+    def __init__(self, root: Optional[str] = None, method: str = 'auto', spring_max: int = 400,
+                 max_entries: int = 256, max_bytes: int = 64 << 20):
+        if method != 'auto' and method not in LAYOUTS:
+            raise ValueError(f"unknown layout {method!r}")
+        self.root, self.method, self.spring_max, self.max_entries = root, method, spring_max, max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pos: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = self.misses = 0
+
+    @classmethod
+    def default(cls) -> "LayoutEngine":
+        """Process-wide engine persisting under $ARMORIQ_CACHE_DIR/layouts"""
+        global _DEFAULT
+        if _DEFAULT is None:
+            with _DEFAULT_LOCK:
+                if _DEFAULT is None:
+                    _DEFAULT = cls(os.path.join(os.environ.get("ARMORIQ_CACHE_DIR") or
+                                                os.path.join(os.path.expanduser("~"), ".cache", "armoriq"), "layouts"))
+        return _DEFAULT
+
+    def method_for(self, nl: NetlistGraph) -> str:
+        return self.method if self.method != 'auto' else ('spring' if nl.num_nodes <= self.spring_max else 'layered')
+
+    def positions(self, module: VerilogModule) -> np.ndarray:
+        """(n, 2) float32 positions in netlist node order"""
+        nl = get_netlist(module)
+        method = self.method_for(nl)
+        key = f"{netlist_digest(nl)}-{method}"
+        with self._lock:
+            pos = self._pos.get(key)
+            if pos is not None:
+                self._pos.move_to_end(key); self.hits += 1
+                return pos
+        path = os.path.join(self.root, f"{key}.npy") if self.root else None
+        try:
+            pos = np.load(path) if path else None
+            if pos is not None:
+                os.utime(path)                             # LRU touch
+        except (OSError, ValueError):
+            pos = None
+        if pos is None or pos.shape != (nl.num_nodes, 2):
+            pos = LAYOUTS[method](nl)
+            if path:
+                self._save(path, pos)
+        with self._lock:
+            self.misses += 1
+            self._pos[key] = pos
+            while len(self._pos) > self.max_entries:
+                self._pos.popitem(last=False)
+        return pos
+
+    def _save(self, path: str, pos: np.ndarray):
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, pos)
+            os.replace(tmp, path)
+        except OSError:
+            return                                         # read-only cache dir: memory only
+        self.evict(keep=os.path.basename(path))
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        out = []
+        try:
+            names = os.listdir(self.root) if self.root else []
+        except OSError:
+            names = []
+        for fn in names:
+            if fn.endswith(".npy"):
+                try:
+                    stt = os.stat(os.path.join(self.root, fn))
+                    out.append((stt.st_mtime, stt.st_size, fn))
+                except OSError:
+                    pass
+        return out
+
+    def evict(self, keep: Optional[str] = None):
+        ents  = sorted(self.entries())
+        total = sum(sz for _, sz, _ in ents)
+        for _, sz, fn in ents:
+            if total <= self.max_bytes:
+                break
+            if fn == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.root, fn)); total -= sz
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop every layout, in memory and on disk"""
+        with self._lock:
+            self._pos.clear()
+        for _, _, fn in self.entries():
+            try: os.remove(os.path.join(self.root, fn))
+            except OSError: pass
+
+    def stats(self) -> Dict[str, int]:
+        ents = self.entries()
+        return {'entries': len(ents), 'bytes': sum(sz for _, sz, _ in ents), 'in_memory': len(self._pos),
+                'hits': self.hits, 'misses': self.misses}
+
+    def view(self, module: VerilogModule, highlight: Iterable[str] = (), label_max: int = 300, hops: int = 1,
+             collapse_above: int = 3000, grid: int = 48, cone_only: bool = False) -> Dict:
+        """
+        Level-of-detail draw lists for one module. Up to label_max nodes every
+        node is labelled; above it only highlighted nodes and their `hops`
+        fan-in / fan-out cone. Above collapse_above nodes everything outside
+        that cone is merged into grid×grid clusters (one marker per occupied
+        cell, edges between cells deduplicated); cone_only drops it entirely.
+        Returns node ids / positions / label mask, cluster centres / sizes and
+        edge segment arrays (NaN-separated, ready for a single line trace).
+        """
+        nl  = get_netlist(module)
+        pos = self.positions(module)
+        n   = nl.num_nodes
+        hl  = np.array(sorted(nl.index[h] for h in set(highlight) if h in nl.index), dtype=np.int64)
+        cone = extract_cone(nl, hl, hops) if hl.size else None
+        near = cone.mask() if cone else np.zeros(n, dtype=bool)
+        label = np.ones(n, dtype=bool) if n <= label_max else near
+
+        if cone_only and cone:
+            nodes = cone.nodes
+            src, dst = pos[nl.ei[0, cone.edges]], pos[nl.ei[1, cone.edges]]
+            cxy, csize = np.zeros((0, 2), np.float32), np.zeros(0, np.int64)
+        elif n <= collapse_above or near.all():            # nothing outside the cone to cluster
+            nodes = np.arange(n)
+            src, dst = pos[nl.ei[0]], pos[nl.ei[1]]
+            cxy, csize = np.zeros((0, 2), np.float32), np.zeros(0, np.int64)
+        else:
+            nodes = np.flatnonzero(near)
+            lo, hi = pos.min(axis=0), pos.max(axis=0)
+            cell = np.minimum(((pos - lo) / np.maximum(hi - lo, 1e-9) * grid).astype(np.int64), grid - 1)
+            cid  = cell[:, 0] * grid + cell[:, 1]
+            cid[near] = -1                                 # kept as individual nodes
+            occupied, inv = np.unique(cid[~near], return_inverse=True)
+            csize = np.bincount(inv, minlength=len(occupied))
+            cxy = np.stack([np.bincount(inv, weights=pos[~near, k], minlength=len(occupied)) / csize
+                            for k in (0, 1)], axis=1).astype(np.float32)
+            node_xy = pos.copy()                           # each collapsed node stands at its cluster centre
+            node_xy[~near] = cxy[inv]
+            key = np.where(near, np.arange(n), n + np.searchsorted(occupied, cid))
+            e = np.unique(np.stack([key[nl.ei[0]], key[nl.ei[1]]], axis=1), axis=0)
+            e = e[e[:, 0] != e[:, 1]]
+            src, dst = (np.where((k < n)[:, None], node_xy[np.minimum(k, n - 1)], cxy[np.maximum(k - n, 0)])
+                        for k in (e[:, 0], e[:, 1]))
+
+        seg = np.full((len(src) * 3, 2), np.nan, dtype=np.float32)
+        seg[0::3], seg[1::3] = src, dst
+        return {'nodes': nodes, 'xy': pos[nodes], 'label': label[nodes], 'highlight': np.isin(nodes, hl),
+                'cluster_xy': cxy, 'cluster_size': csize, 'edge_x': seg[:, 0], 'edge_y': seg[:, 1],
+                'num_nodes': n, 'num_edges': nl.num_edges, 'layout': self.method_for(nl),
+                'cone': cone.summary() if cone else None, 'table': get_signal_table(module)}
+
+
+_DEFAULT: Optional[LayoutEngine] = None
+_DEFAULT_LOCK = threading.Lock()
@@ -0,0 +1,323 @@
+"""Asynchronous MCP server registry, transports and the local stub server"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .structures import MCPServer
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MCP SERVER REGISTRY
+# ─────────────────────────────────────────────────────────────────────────────
+async def mcp_stub_handler(server_id: str, method: str, params: Dict, latency: float = 0.02) -> Dict:
+    """Stand-in tool implementation shared by the in-process transport and the local server"""
+    await asyncio.sleep(latency)
+    return {"status": "ok", "server": server_id, "method": method}
+
+
+class InProcessTransport:
+    """Calls mcp_stub_handler on the registry's own event loop (no I/O)"""
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+
+    async def request(self, server_id: str, method: str, params: Dict) -> Dict:
+        return await mcp_stub_handler(server_id, method, params, self.latency)
+
+    async def close(self):
+        pass
+
+
+class JsonLinesTransport:
+    """
+    One JSON object per line in each direction, {"id","server","method","params"}
+    out and {"id","result"|"error"} back. Requests are pipelined: many may be in
+    flight on the one stream and responses are matched by id.
+    """
+
+    def __init__(self):
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.next_id = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._opened: Optional[asyncio.Future] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def open(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        raise NotImplementedError
+
+    async def _open(self):
+        self._lock = asyncio.Lock()
+        self.reader, self.writer = await self.open()
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def _ensure_open(self):
+        if self._opened is None:                            # first caller opens, concurrent callers wait on it
+            self._opened = asyncio.ensure_future(self._open())
+        await asyncio.shield(self._opened)
+
+    async def _read_loop(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:                          # stray non-protocol output
+                    continue
+                fut = self.pending.pop(msg.get("id"), None)
+                if fut is not None and not fut.done():
+                    if "error" in msg:
+                        fut.set_exception(RuntimeError(msg["error"]))
+                    else:
+                        fut.set_result(msg.get("result", {}))
+        finally:
+            for fut in self.pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("MCP transport closed"))
+            self.pending.clear()
+
+    def _closed(self) -> bool:
+        return self._reader_task is None or self._reader_task.done()
+
+    async def request(self, server_id: str, method: str, params: Dict) -> Dict:
+        await self._ensure_open()
+        if self._closed():                                  # peer hung up: nothing would ever answer
+            raise ConnectionError("MCP transport closed")
+        self.next_id += 1
+        rid = self.next_id
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[rid] = fut
+        line = json.dumps({"id": rid, "server": server_id, "method": method, "params": params or {}},
+                          default=str) + "\n"
+        try:
+            async with self._lock:
+                self.writer.write(line.encode())
+                await self.writer.drain()
+        except Exception:
+            self.pending.pop(rid, None)
+            raise
+        if self._closed():                                  # reader exited during the write, after failing `pending`
+            self.pending.pop(rid, None)
+            raise ConnectionError("MCP transport closed")
+        return await fut
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+
+class StdioTransport(JsonLinesTransport):
+    """Spawns a local MCP server (`python -m armoriq mcp-serve stdio`) and talks over its pipes"""
+
+    def __init__(self, cmd: Optional[List[str]] = None):
+        super().__init__()
+        self.cmd = cmd or [sys.executable, "-m", "armoriq", "mcp-serve", "stdio"]
+        self.proc = None
+
+    async def open(self):
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.cmd, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return self.proc.stdout, self.proc.stdin
+
+    async def close(self):
+        await super().close()
+        if self.proc is not None and self.proc.returncode is None:
+            self.proc.terminate()
+            await self.proc.wait()
+
+
+class SocketTransport(JsonLinesTransport):
+    """Connects to a running `python -m armoriq mcp-serve tcp:PORT` server"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765):
+        super().__init__()
+        self.host, self.port = host, port
+
+    async def open(self):
+        return await asyncio.open_connection(self.host, self.port)
+
+
+async def _mcp_serve_stream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, latency: float):
+    """Server side of JsonLinesTransport: every request runs as its own task"""
+    lock, tasks = asyncio.Lock(), set()
+
+    async def handle(req: Dict):
+        try:
+            msg = {"id": req.get("id"),
+                   "result": await mcp_stub_handler(req["server"], req["method"], req.get("params", {}), latency)}
+        except Exception as e:
+            msg = {"id": req.get("id"), "error": f"{type(e).__name__}: {e}"}
+        async with lock:
+            writer.write((json.dumps(msg, default=str) + "\n").encode())
+            await writer.drain()
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        try:
+            req = json.loads(line)
+        except ValueError:
+            continue
+        t = asyncio.get_running_loop().create_task(handle(req))
+        tasks.add(t); t.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    writer.close()
+
+
+def mcp_serve(spec: str = "stdio", latency: float = 0.02):
+    """Run the local MCP server: spec is 'stdio' or 'tcp:PORT' / 'tcp:HOST:PORT'"""
+    async def stdio():
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        wt, wp = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+        await _mcp_serve_stream(reader, asyncio.StreamWriter(wt, wp, reader, loop), latency)
+
+    async def tcp(host: str, port: int):
+        server = await asyncio.start_server(lambda r, w: _mcp_serve_stream(r, w, latency), host, port)
+        async with server:
+            await server.serve_forever()
+
+    if spec == "stdio":
+        asyncio.run(stdio())
+    elif spec.startswith("tcp:"):
+        parts = spec.split(":")
+        host, port = (parts[1], int(parts[2])) if len(parts) == 3 else ("127.0.0.1", int(parts[1]))
+        asyncio.run(tcp(host, port))
+    else:
+        raise ValueError(f"Unknown MCP server spec: {spec}")
+
+
+class MCPServerRegistry:
+    """
+    Model Context Protocol server registry.
+    Each server exposes a specialized capability that AI agents call.
+
+    Calls run on a background asyncio loop: `acall` from coroutines, `call`
+    to block, `submit` to pipeline a call behind compute and `drain` to wait
+    for everything submitted. Each server admits at most `max_concurrency`
+    in-flight calls, and each call fails with an error result after `timeout`
+    seconds, so `call`, `drain` and `close` never wait on a dead transport.
+    """
+
+    def __init__(self, transport=None, max_concurrency: int = 8, timeout: float = 30.0):
+        self.servers: Dict[str, MCPServer] = {
+            "mcp-parse":    MCPServer("mcp-parse",    "ArmorIQ/RTL-Parser",          "Verilog tokenisation & AST extraction"),
+            "mcp-graph":    MCPServer("mcp-graph",    "ArmorIQ/Graph-Builder",        "Netlist → PyG graph construction"),
+            "mcp-gnn":      MCPServer("mcp-gnn",      "ArmorIQ/GNN-Inference",        "4-layer GAT trojan scoring"),
+            "mcp-stat":     MCPServer("mcp-stat",     "ArmorIQ/Statistical-Analyzer", "Structural anomaly & outlier detection"),
+            "mcp-golden":   MCPServer("mcp-golden",   "ArmorIQ/Golden-Reference",     "Golden-model diff & deviation scoring"),
+            "mcp-classify": MCPServer("mcp-classify", "ArmorIQ/HT-Classifier",        "Hybrid ensemble binary classification"),
+            "mcp-report":   MCPServer("mcp-report",   "ArmorIQ/Report-Generator",     "JSON/CSV/Markdown report synthesis"),
+            "mcp-monitor":  MCPServer("mcp-monitor",  "ArmorIQ/Live-Monitor",         "Real-time threat feed & dashboarding"),
+        }
+        self.call_log: List[Dict] = []
+        self.transport = transport or InProcessTransport()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[str, int] = defaultdict(int)
+        self._pending: List = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="mcp-loop", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    async def acall(self, server_id: str, method: str, params: Dict = None) -> Dict:
+        """MCP tool call; concurrent with other calls, bounded per server"""
+        if server_id not in self.servers:
+            return {"error": f"Unknown MCP server: {server_id}"}
+
+        srv = self.servers[server_id]
+        sem = self._sems.get(server_id)
+        if sem is None:
+            sem = self._sems[server_id] = asyncio.Semaphore(self.max_concurrency)
+        async with sem:
+            self._inflight[server_id] += 1
+            srv.status = "busy"
+            srv.requests_served += 1
+            srv.last_heartbeat = datetime.now().strftime("%H:%M:%S")
+            self.call_log.append({
+                "server": server_id,
+                "method": method,
+                "params": list(params.keys()) if params else [],
+                "ts": srv.last_heartbeat
+            })
+            try:
+                return await asyncio.wait_for(self.transport.request(server_id, method, params or {}), self.timeout)
+            except asyncio.TimeoutError:
+                return {"error": f"TimeoutError: no reply within {self.timeout}s", "server": server_id, "method": method}
+            except Exception as e:
+                return {"error": f"{type(e).__name__}: {e}", "server": server_id, "method": method}
+            finally:
+                self._inflight[server_id] -= 1
+                if not self._inflight[server_id]:
+                    srv.status = "online"
+
+    def submit(self, server_id: str, method: str, params: Dict = None):
+        """Start a call on the background loop and return its concurrent.futures.Future"""
+        fut = asyncio.run_coroutine_threadsafe(self.acall(server_id, method, params), self.loop)
+        self._pending.append(fut)
+        return fut
+
+    def call(self, server_id: str, method: str, params: Dict = None) -> Dict:
+        """Blocking MCP tool call"""
+        return asyncio.run_coroutine_threadsafe(self.acall(server_id, method, params), self.loop).result()
+
+    def drain(self, timeout: Optional[float] = None) -> List[Dict]:
+        """Wait for every submitted call; returns their results in submission order"""
+        pending, self._pending = self._pending, []
+        return [f.result(timeout) for f in pending]
+
+    def close(self):
+        if self._loop is None:
+            return
+        pending = list(self._pending)
+        try:
+            self.drain(self.timeout)
+        except Exception:                                  # bounded: whatever is still stuck is cancelled
+            for f in pending:
+                f.cancel()
+        try:
+            asyncio.run_coroutine_threadsafe(self.transport.close(), self._loop).result(self.timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def get_server_data(self) -> List[Dict]:
+        """Return server data as plain dicts for rendering"""
+        result = []
+        for srv in self.servers.values():
+            result.append({
+                "name": srv.name,
+                "capability": srv.capability,
+                "status": srv.status,
+                "requests": srv.requests_served,
+                "heartbeat": srv.last_heartbeat,
+            })
+        return result
@@ -0,0 +1,184 @@
+"""Process-wide registry of versioned GNN checkpoints"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .constants import MODEL_VERSION
+
+if TYPE_CHECKING:
+    from .engine import InferenceEngine
+    from .gnn import ArmorIQ_GNN
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MODEL REGISTRY
+# ─────────────────────────────────────────────────────────────────────────────
+DEFAULT_ARCH = {'input_dim': 48, 'hidden_dim': 256, 'num_layers': 4}
+
+
+class ModelRegistry:
+    """
+    Loads each checkpoint version at most once per process and hands every
+    caller (Streamlit sessions, pipeline threads, CLI) the same eval-mode
+    ArmorIQ_GNN. Checkpoints live at <root>/<version>.pt as
+    {'version', 'arch', 'state_dict'}; a version with no file on disk gets a
+    deterministic initialisation seeded from its name, so scores (and the
+    result cache) stay stable across processes. Torch is imported on the first
+    get(), never before. engine() wraps a version in an inference backend;
+    exported artifacts go to <root>/export/ keyed by checkpoint digest.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get("ARMORIQ_MODEL_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "armoriq", "models")
+        self._lock   = threading.Lock()
+        self._models: Dict[str, "ArmorIQ_GNN"] = {}
+        self._info:   Dict[str, Dict[str, Any]] = {}
+        self._digests: Dict[tuple, str] = {}
+        self._engines: Dict[tuple, "InferenceEngine"] = {}
+
+    @classmethod
+    def default(cls) -> "ModelRegistry":
+        """Process-wide registry over $ARMORIQ_MODEL_DIR"""
+        global _DEFAULT
+        if _DEFAULT is None:
+            with _DEFAULT_LOCK:
+                if _DEFAULT is None:
+                    _DEFAULT = cls()
+        return _DEFAULT
+
+    def path(self, version: str) -> str:
+        return os.path.join(self.root, f"{version}.pt")
+
+    def versions(self) -> List[str]:
+        """Checkpoint versions available on disk"""
+        try:
+            return sorted(fn[:-3] for fn in os.listdir(self.root) if fn.endswith(".pt"))
+        except FileNotFoundError:
+            return []
+
+    def fingerprint(self, version: str = MODEL_VERSION) -> str:
+        """version + checkpoint digest (or 'init'), for cache keys; hashes the file, does not load it"""
+        info = self._info.get(version)
+        if info is not None:
+            return info['fingerprint']
+        p = self.path(version)
+        try:
+            stt = os.stat(p)
+        except FileNotFoundError:
+            return f"{version}:init"
+        memo = (p, stt.st_mtime_ns, stt.st_size)
+        if memo not in self._digests:
+            h = hashlib.sha256()
+            with open(p, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    h.update(chunk)
+            self._digests[memo] = h.hexdigest()[:16]
+        return f"{version}:{self._digests[memo]}"
+
+    def loaded(self, version: str = MODEL_VERSION) -> bool:
+        return version in self._models
+
+    def get(self, version: str = MODEL_VERSION) -> "ArmorIQ_GNN":
+        """Shared eval-mode model for `version`, loading it on first use"""
+        m = self._models.get(version)
+        if m is not None:
+            self._info[version]['hits'] += 1
+            return m
+        with self._lock:
+            if version not in self._models:
+                self._models[version] = self._load(version)
+            else:
+                self._info[version]['hits'] += 1
+            return self._models[version]
+
+    def _load(self, version: str) -> "ArmorIQ_GNN":
+        t0 = time.perf_counter()
+        import torch
+        from .gnn import ArmorIQ_GNN
+        t_import = time.perf_counter() - t0
+
+        fp, p = self.fingerprint(version), self.path(version)
+        if os.path.exists(p):
+            ckpt = torch.load(p, map_location="cpu", weights_only=True)
+            if ckpt.get('version', version) != version:
+                raise ValueError(f"{p} holds version {ckpt.get('version')!r}, expected {version!r}")
+            arch = {**DEFAULT_ARCH, **ckpt.get('arch', {})}
+            model = ArmorIQ_GNN(**arch)
+            model.load_state_dict(ckpt['state_dict'])
+            source = p
+        else:
+            arch = dict(DEFAULT_ARCH)
+            seed = zlib.crc32(version.encode())
+            with torch.random.fork_rng(devices=[]):
+                torch.manual_seed(seed)
+                model = ArmorIQ_GNN(**arch)
+            source = f"init(seed={seed})"
+        model.eval()
+        for prm in model.parameters():
+            prm.requires_grad_(False)
+        self._info[version] = {'version': version, 'source': source, 'fingerprint': fp, 'arch': arch,
+                               'import_s': t_import, 'load_s': time.perf_counter() - t0,
+                               'params': sum(prm.numel() for prm in model.parameters()),
+                               'loaded_at': time.time(), 'hits': 0}
+        return model
+
+    def save(self, model: "ArmorIQ_GNN", version: str, arch: Optional[Dict[str, int]] = None) -> str:
+        """Write a checkpoint for `version` atomically; the next get() loads it"""
+        import torch
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                torch.save({'version': version, 'arch': {**DEFAULT_ARCH, **(arch or {})},
+                            'state_dict': model.state_dict()}, fh)
+            os.replace(tmp, self.path(version))
+        except Exception:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+        with self._lock:
+            self._models.pop(version, None); self._info.pop(version, None)
+            for k in [k for k in self._engines if k[0] == version]:
+                del self._engines[k]
+        return self.path(version)
+
+    def export_path(self, version: str, backend: str, quantize: bool = False) -> str:
+        from .engine import ENGINE_FORMAT, EXTENSIONS
+        digest = self.fingerprint(version).rsplit(":", 1)[1]
+        q = "-int8" if quantize else ""
+        return os.path.join(self.root, "export", f"{version}-{digest}-f{ENGINE_FORMAT}{q}.{EXTENSIONS[backend]}")
+
+    def engine(self, version: str = MODEL_VERSION, backend: str = "eager",
+               quantize: bool = False) -> "InferenceEngine":
+        """Shared inference engine for `version` on `backend`, exporting the artifact on first use"""
+        key = (version, backend, quantize)
+        e = self._engines.get(key)
+        if e is not None:
+            return e
+        from .engine import InferenceEngine
+        model = self.get(version)
+        with self._lock:
+            if key not in self._engines:
+                path = None if backend == "eager" else self.export_path(version, backend, quantize)
+                e = self._engines[key] = InferenceEngine(model, backend, path, quantize)
+                self._info[version].setdefault('engines', {})[backend + ("-int8" if quantize else "")] = \
+                    {'path': path, 'export_s': e.export_s, 'load_s': e.load_s}
+            return self._engines[key]
+
+    def info(self, version: str = MODEL_VERSION) -> Optional[Dict[str, Any]]:
+        """Load statistics of a loaded version: source, fingerprint, import_s, load_s, params, hits, engines"""
+        return self._info.get(version)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear(); self._info.clear(); self._engines.clear()
+
+
+_DEFAULT: Optional[ModelRegistry] = None
+_DEFAULT_LOCK = threading.Lock()
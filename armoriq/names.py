@@ -0,0 +1,118 @@
+"""Precompiled signal-name classification shared by the detector and graph builder"""
+
+import hashlib
+import json
+import re
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .netlist import NetlistGraph
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# NAME CLASSIFIER
+# ─────────────────────────────────────────────────────────────────────────────
+DEFAULT_NAME_FAMILIES: Dict[str, List[str]] = {
+    # StatisticalTrojanDetector: suspicious_names / rare_signals
+    'suspicious': [
+        r'trigger', r'payload', r'malicious', r'trojan', r'backdoor',
+        r'secret', r'hidden', r'rare', r'low_prob', r'attack',
+        r'leak', r'covert', r'kill', r'bypass', r'shadow', r'ghost'
+    ],
+    'counter': [r'cnt|counter|count'],
+    # EnhancedGraphBuilder: feature columns 14–22 and 36
+    'feature': [
+        r'temp|tmp|aux',r'cnt|counter',r'state|status|mode',r'enable|en\b|valid',
+        r'trigger|trig|fire',r'payload|data|secret',r'sel|mux|select',
+        r'flag|bit|indicator',r'leak|covert|kill',
+    ],
+    'indexed': [r'\d+$'],
+}
+
+
+class NameClassifier:
+    """
+    Matches signal names against every pattern of every family in one sweep.
+
+    Names are joined into one newline-separated blob (case-folded once when
+    the flags ask for re.I) and each precompiled pattern scans it once in C;
+    hits are mapped back to names with a searchsorted over the line starts.
+    A name's result is one uint64 per family whose bit k is set iff
+    `re.search(families[family][k], name, flags)` would hit. Per-name results
+    are memoised, so the vocabulary shared across designs (clk, rst, data, ...)
+    is classified once per process. Patterns must not match newlines.
+    """
+
+    MAX_PATTERNS = 64     # bits per family mask
+    MEMO_LIMIT   = 1 << 16
+
+    def __init__(self, families: Optional[Mapping[str, Sequence[str]]] = None, flags=re.I):
+        families = DEFAULT_NAME_FAMILIES if families is None else families
+        self.families = {f: list(p) for f, p in families.items()}
+        self.flags    = flags
+        for fam, pats in self.families.items():
+            if len(pats) > self.MAX_PATTERNS:
+                raise ValueError(f"family {fam!r} has {len(pats)} patterns (max {self.MAX_PATTERNS})")
+        # per pattern: (family index, bit, pattern on the raw blob, pattern on the folded blob or None)
+        # — re.I defeats re's literal fast-search, so lowercase-only patterns run case-sensitively on lower()
+        fold = bool(flags & re.I)
+        self._slots = [(fi, 1 << b, re.compile(p, flags | re.M),
+                        re.compile(p, (flags & ~re.I) | re.M) if fold and p == p.lower() else None)
+                       for fi, pats in enumerate(self.families.values()) for b, p in enumerate(pats)]
+        self._memo: Dict[str, tuple] = {}
+        # masks cached on a netlist are keyed by this digest, not the classifier object, so pickled
+        # modules (result cache, worker processes) carry their masks without the classifier and its memo
+        self.key = hashlib.blake2b(json.dumps(self.signature()).encode(), digest_size=8).hexdigest()
+
+    @classmethod
+    def default(cls) -> "NameClassifier":
+        """Process-wide classifier over DEFAULT_NAME_FAMILIES"""
+        global _DEFAULT
+        if _DEFAULT is None:
+            _DEFAULT = cls()
+        return _DEFAULT
+
+    def signature(self) -> Dict[str, List[str]]:
+        return {'families': self.families, 'flags': int(self.flags)}
+
+    def _scan(self, names: List[str]) -> List[tuple]:
+        """Per-name tuple of family masks, one sweep of the joined names per pattern"""
+        masks = np.zeros((len(names), len(self.families)), dtype=np.uint64)
+        if names:
+            blob   = '\n'.join(names)
+            folded = blob.lower() if blob.isascii() else None     # lower() must keep offsets
+            starts = np.cumsum([0] + [len(nm)+1 for nm in names[:-1]])
+            for fi, bit, raw, low in self._slots:
+                pc, text = (low, folded) if low is not None and folded is not None else (raw, blob)
+                pos = np.fromiter((m.start() for m in pc.finditer(text)), dtype=np.int64)
+                if pos.size:
+                    masks[np.searchsorted(starts, pos, side='right') - 1, fi] |= np.uint64(bit)
+        return [tuple(r) for r in masks.tolist()]
+
+    def classify(self, names: Sequence[str]) -> Dict[str, np.ndarray]:
+        """{family: uint64 mask per name}"""
+        memo = self._memo
+        todo = list(dict.fromkeys(nm for nm in names if nm not in memo))
+        if todo:
+            if len(memo) + len(todo) > self.MEMO_LIMIT:
+                memo.clear()
+            memo.update(zip(todo, self._scan(todo)))
+        rows = np.array([memo[nm] for nm in names], dtype=np.uint64).reshape(len(names), len(self.families))
+        return {fam: rows[:, i] for i, fam in enumerate(self.families)}
+
+    def masks(self, netlist: NetlistGraph) -> Dict[str, np.ndarray]:
+        """classify(netlist.names), computed once per netlist and pattern set"""
+        cached = netlist.__dict__.get('_name_masks')
+        if cached is None or cached[0] != self.key:
+            cached = (self.key, self.classify(netlist.names))
+            netlist.__dict__['_name_masks'] = cached
+        return cached[1]
+
+    def bits(self, masks: Dict[str, np.ndarray], family: str, width: Optional[int] = None) -> np.ndarray:
+        """Expand a family's masks to a (n, width) boolean matrix, column k = pattern k"""
+        width = len(self.families[family]) if width is None else width
+        return (masks[family][:, None] >> np.arange(width, dtype=np.uint64)) & np.uint64(1) != 0
+
+
+_DEFAULT: Optional[NameClassifier] = None
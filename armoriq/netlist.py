@@ -0,0 +1,178 @@
+"""CSR signal-dependency graph shared by the builder, detector and visualiser"""
+
+import re
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from .centrality import _bfs_levels, _csr_from_edges
+from .structures import VerilogModule
+
+if TYPE_CHECKING:
+    import networkx as nx
+    import torch
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# NETLIST GRAPH (CSR)
+# ─────────────────────────────────────────────────────────────────────────────
+EDGE_ASSIGN, EDGE_NONBLOCKING, EDGE_BLOCKING = 0, 1, 2
+_EXPR_KEYWORDS = {'if','else','case','default','begin','end','posedge','negedge'}
+
+
+def _expr_signals(expr: str) -> List[str]:
+    return [s for s in re.findall(r'\b[a-zA-Z_]\w*\b', expr) if s not in _EXPR_KEYWORDS]
+
+
+class NetlistGraph:
+    """
+    Compact signal-connectivity graph of one VerilogModule, shared by the
+    graph builder, the statistical detector and the netlist view.
+    Node ids follow `module.signals` order; edges are stored CSR-by-source,
+    with `etype` codes 0 = assign, 1 = non-blocking, 2 = blocking.
+    """
+
+    def __init__(self, names: List[str], src: np.ndarray, dst: np.ndarray, etype: np.ndarray):
+        n = len(names)
+        order = np.argsort(src, kind='stable')
+        self.names   = names
+        self.index   = {nm: i for i, nm in enumerate(names)}
+        # (2, E) int64 block; row 1 doubles as the CSR column array, so edge_index is a view
+        self.ei      = np.ascontiguousarray(np.stack([src[order], dst[order]]).astype(np.int64, copy=False))
+        self.etype   = etype[order].astype(np.int8, copy=False)
+        self.indptr  = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.ei[0], minlength=n), out=self.indptr[1:])
+        self.fanin   = np.bincount(self.ei[1], minlength=n)
+        self.fanout  = np.bincount(self.ei[0], minlength=n)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return self.ei.shape[1]
+
+    @property
+    def src(self) -> np.ndarray:
+        return self.ei[0]
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self.ei[1]
+
+    @classmethod
+    def from_module(cls, module: VerilogModule) -> "NetlistGraph":
+        names = list(module.signals)
+        idx = {nm: i for i, nm in enumerate(names)}
+        src, dst, et = [], [], []
+
+        def connect(lhs, rhs, code):
+            if lhs not in idx: return
+            for s in _expr_signals(rhs):
+                if s in idx:
+                    src.append(idx[s]); dst.append(idx[lhs]); et.append(code)
+
+        for tgt, expr in module.assignments:
+            connect(tgt, expr, EDGE_ASSIGN)
+        for block in module.always_blocks:
+            for lhs, rhs in re.findall(r'(\w+)\s*<=\s*([^;]+);', block):
+                connect(lhs, rhs, EDGE_NONBLOCKING)
+            for lhs, rhs in re.findall(r'(\w+)\s*=\s*([^;]+);', block):
+                connect(lhs, rhs, EDGE_BLOCKING)
+
+        return cls(names, np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64),
+                   np.array(et, dtype=np.int8))
+
+    def edge_index(self) -> "torch.Tensor":
+        """(2, E) LongTensor sharing memory with the netlist arrays"""
+        import torch
+        return torch.from_numpy(self.ei)
+
+    def edge_attr(self) -> "torch.Tensor":
+        import torch
+        return torch.from_numpy(self.etype.astype(np.float32)).unsqueeze(1)
+
+    def unique_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """CSR without parallel edges (DiGraph view) → (indptr, indices, row-of-each-edge)"""
+        if not hasattr(self, '_ucsr'):
+            self._ucsr = _csr_from_edges(self.ei[0], self.ei[1], self.num_nodes)
+        return self._ucsr
+
+    def csc(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Reverse index (CSR-by-destination, built once) → (indptr, `ei` column of each in-edge)"""
+        if not hasattr(self, '_csc'):
+            n = self.num_nodes
+            order = np.argsort(self.ei[1], kind='stable')
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(self.fanin, out=indptr[1:])
+            self._csc = (indptr, order)
+        return self._csc
+
+    def is_weakly_connected(self) -> bool:
+        n = self.num_nodes
+        if n == 0:
+            return False
+        und_ptr, und_idx, _ = _csr_from_edges(np.concatenate([self.ei[0], self.ei[1]]),
+                                              np.concatenate([self.ei[1], self.ei[0]]), n)
+        dist, _ = _bfs_levels(und_ptr, und_idx, 0, n)
+        return bool((dist >= 0).all())
+
+    def to_networkx(self) -> "nx.DiGraph":
+        import networkx as nx
+        G = nx.DiGraph()
+        G.add_nodes_from(self.names)
+        nm = self.names
+        G.add_edges_from((nm[s], nm[d]) for s, d in zip(self.ei[0].tolist(), self.ei[1].tolist()))
+        return G
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SIGNAL TABLE (columnar)
+# ─────────────────────────────────────────────────────────────────────────────
+SIGNAL_TYPE_CODES = {'input':0,'output':1,'wire':2,'reg':3,'inout':4}   # anything else → wire
+
+
+class SignalTable:
+    """
+    Column-per-attribute view of `module.signals` (same order as the netlist
+    node ids), so per-signal statistics are array expressions rather than
+    loops over VerilogSignal objects.
+    """
+
+    def __init__(self, module: VerilogModule, netlist: NetlistGraph):
+        sigs, n = list(module.signals.values()), len(module.signals)
+        self.netlist  = netlist
+        self.names    = netlist.names
+        self.width    = np.fromiter((s.width for s in sigs), dtype=np.int64, count=n)
+        self.kind     = np.fromiter((SIGNAL_TYPE_CODES.get(s.signal_type, 2) for s in sigs), dtype=np.int8, count=n)
+        self.is_clock = np.fromiter((s.is_clock for s in sigs), dtype=bool, count=n)
+        self.is_reset = np.fromiter((s.is_reset for s in sigs), dtype=bool, count=n)
+        self.fanin    = netlist.fanin
+        self.fanout   = netlist.fanout
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def is_kind(self, signal_type: str) -> np.ndarray:
+        return self.kind == SIGNAL_TYPE_CODES[signal_type]
+
+
+def get_signal_table(module: VerilogModule) -> SignalTable:
+    """Build (once) and cache the module's SignalTable"""
+    tab = module.__dict__.get('_signal_table')
+    if tab is None:
+        tab = SignalTable(module, get_netlist(module))
+        module.__dict__['_signal_table'] = tab
+    return tab
+
+
+def get_netlist(module: VerilogModule) -> NetlistGraph:
+    """Build (once) and cache the module's NetlistGraph; syncs per-signal fan-in/fan-out"""
+    nl = module.__dict__.get('_netlist')
+    if nl is None:
+        nl = NetlistGraph.from_module(module)
+        module.__dict__['_netlist'] = nl
+        for sig, fi, fo in zip(module.signals.values(), nl.fanin.tolist(), nl.fanout.tolist()):
+            sig.fanin, sig.fanout = fi, fo
+    return nl
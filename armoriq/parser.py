@@ -0,0 +1,680 @@
+"""Verilog front end: single-pass lexer + recursive-descent parser"""
+
+import re
+from collections import deque
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .structures import VerilogModule, VerilogSignal
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# VERILOG PARSER (single-pass lexer + recursive descent)
+# ─────────────────────────────────────────────────────────────────────────────
+class Token(NamedTuple):
+    kind: str       # ID | NUM | STR | SYS | MACRO | DEFINE | OP | EOF
+    text: str
+    start: int
+    end: int
+
+
+_TRIVIA = r'''
+    (?:\s+                                                  # trivia, consumed in front of each token:
+      | //[^\n]*                                            #   comments, whitespace and
+      | /\*[\s\S]*?(?:\*/|\Z)                               #   non-macro compiler directives
+      | `(?:include|timescale|default_nettype|resetall|celldefine|endcelldefine|undef|undefineall
+          |pragma|line|begin_keywords|end_keywords|unconnected_drive|nounconnected_drive)\b[^\n]*
+      | `(?:ifdef|ifndef|elsif)[ \t]+\w+
+      | `(?:else|endif)\b
+    )*'''
+
+_TOKEN_RE = re.compile(_TRIVIA + r'''
+    (?: (?P<DEFINE>`define[ \t]+(?:\\\n|[^\n])*)
+      | (?P<MACRO>`\w+)
+      | (?P<STR>"(?:\\.|[^"\\\n])*")
+      | (?P<ID>[A-Za-z_][\w$]*|\\\S+)
+      | (?P<SYS>\$\w+)
+      | (?P<NUM>(?:\d[\d_]*\s*)?'[sS]?[bBoOdDhH]\s*[0-9a-fA-FxXzZ?_]+|'[01xXzZ]|\d[\d_]*(?:\.\d[\d_]*)?(?:[eE][+-]?\d+)?)
+      | (?P<OP><<<|>>>|===|!==|<=|>=|==|!=|&&|\|\||<<|>>|\*\*|->|\+:|-:|::|~&|~\||~\^|\^~|[-+*/%<>=!~&|^?:;,.()\[\]{}@#'])
+      | (?P<END>\Z)
+      | (?P<ERR>.)
+    )
+''', re.X | re.S)
+
+
+_new_token = tuple.__new__       # skips NamedTuple's argument handling on the hot path
+
+
+def tokenize(text: str, pos: int = 0) -> Iterator[Token]:
+    """Lazily lex Verilog source from `pos`; comments, whitespace and non-macro directives are dropped"""
+    for m in _TOKEN_RE.finditer(text, pos):
+        kind = m.lastgroup
+        if kind == 'END':
+            break
+        if kind != 'ERR':
+            s, e = m.span(kind)
+            yield _new_token(Token, (kind, text[s:e], s, e))
+    yield Token('EOF', '', len(text), len(text))
+
+
+_DIRECTIONS  = {'input', 'output', 'inout'}
+_NET_TYPES   = {'wire', 'tri', 'tri0', 'tri1', 'wand', 'wor', 'triand', 'trior', 'uwire', 'supply0', 'supply1'}
+_VAR_TYPES   = {'reg', 'logic'}
+_DATA_KWS    = _NET_TYPES | _VAR_TYPES | {'var', 'signed', 'unsigned', 'integer', 'int', 'bit', 'byte',
+                                          'shortint', 'longint', 'real', 'time', 'string', 'vectored', 'scalared'}
+_ALWAYS_KWS  = {'always', 'always_ff', 'always_comb', 'always_latch'}
+_CASE_KWS    = {'case', 'casez', 'casex', 'randcase'}
+_BLOCK_ENDS  = {'function': 'endfunction', 'task': 'endtask', 'specify': 'endspecify',
+                'covergroup': 'endgroup', 'property': 'endproperty', 'sequence': 'endsequence',
+                'clocking': 'endclocking', 'class': 'endclass', 'checker': 'endchecker',
+                'interface': 'endinterface', 'package': 'endpackage', 'program': 'endprogram',
+                'primitive': 'endprimitive', 'config': 'endconfig', 'table': 'endtable'}
+_KEYWORDS    = (_DIRECTIONS | _DATA_KWS | _ALWAYS_KWS | _CASE_KWS | set(_BLOCK_ENDS) | set(_BLOCK_ENDS.values()) |
+                {'module', 'macromodule', 'endmodule', 'parameter', 'localparam', 'defparam', 'assign', 'initial',
+                 'final', 'generate', 'endgenerate', 'genvar', 'begin', 'end', 'if', 'else', 'for', 'while',
+                 'repeat', 'forever', 'do', 'foreach', 'endcase', 'default', 'fork', 'join', 'join_any',
+                 'join_none', 'posedge', 'negedge', 'or', 'wait', 'unique', 'unique0', 'priority',
+                 'typedef', 'import', 'export', 'event', 'realtime', 'assert', 'assume', 'cover', 'automatic',
+                 'static'})
+_CLOCK_RE    = re.compile(r'clk|clock', re.I)
+_RESET_RE    = re.compile(r'rst|reset', re.I)
+_OPEN, _CLOSE = {'(': ')', '[': ']', '{': '}'}, {')', ']', '}'}
+_DECL_TYPE   = {**{d: d for d in _DIRECTIONS}, **dict.fromkeys(_NET_TYPES, 'wire'), **dict.fromkeys(_VAR_TYPES, 'reg')}
+
+# Whole-item match for the two forms that make up most of a flat netlist body, `wire [7:0] a, b;`
+# and `assign y = a & b;`, so they skip the token stream. Only layouts whose token join is the raw
+# text qualify (single-space gaps, no comments/strings/macros/commas in the expression); anything
+# else fails the match and takes the recursive-descent path.
+_FAST_ITEM_RE = re.compile(_TRIVIA + r'''
+    (?: (?P<kw>''' + '|'.join(sorted(_DECL_TYPE, key=len, reverse=True)) + r''')(?![\w$])\s*
+        (?:\[\s*(?P<hi>\d+)\s*:\s*(?P<lo>\d+)\s*\]\s*)?
+        (?P<names>[A-Za-z_][\w$]*(?:\s*,\s*[A-Za-z_][\w$]*)*)\s*;
+      | assign\s+(?P<lhs>[A-Za-z_][\w$]*)\s*=(?!=)\s*(?P<expr>[\w ()\[\]{}:&|^~+\-*%<>=!?.@#']*?)\ *;
+    )''', re.X | re.A)
+
+
+def _join_tokens(toks: List[Token]) -> str:
+    """Source text of a token run with comments dropped and any gap collapsed to one space"""
+    out, prev = [], None
+    for t in toks:
+        if prev is not None and t.start > prev:
+            out.append(' ')
+        out.append(t.text); prev = t.end
+    return ''.join(out)
+
+
+class _ConstEval:
+    """Integer constant-expression evaluator for ranges (parameters, `defines, $clog2)"""
+    _BIN = {'||': 2, '&&': 3, '|': 4, '^': 5, '~^': 5, '^~': 5, '&': 6, '==': 7, '!=': 7, '===': 7, '!==': 7,
+            '<': 8, '<=': 8, '>': 8, '>=': 8, '<<': 9, '>>': 9, '<<<': 9, '>>>': 9,
+            '+': 10, '-': 10, '*': 11, '/': 11, '%': 11, '**': 12}
+
+    def __init__(self, toks: List[Token], lookup):
+        self.toks, self.i, self.lookup = toks, 0, lookup
+
+    def value(self) -> int:
+        v = self.expr(0)
+        if self.i != len(self.toks):
+            raise ValueError("trailing tokens")
+        return v
+
+    def peek(self) -> str:
+        return self.toks[self.i].text if self.i < len(self.toks) else ''
+
+    def take(self) -> Token:
+        if self.i >= len(self.toks):
+            raise ValueError("unexpected end of expression")
+        self.i += 1
+        return self.toks[self.i - 1]
+
+    def expr(self, min_prec: int) -> int:
+        v = self.unary()
+        while True:
+            op = self.peek()
+            if op == '?' and min_prec <= 1:
+                self.take(); a = self.expr(0)
+                if self.take().text != ':':
+                    raise ValueError("malformed ternary")
+                b = self.expr(1)
+                v = a if v else b
+                continue
+            prec = self._BIN.get(op)
+            if prec is None or prec < min_prec:
+                return v
+            self.take()
+            rhs = self.expr(prec if op == '**' else prec + 1)
+            v = self.apply(op, v, rhs)
+
+    @staticmethod
+    def apply(op: str, a: int, b: int) -> int:
+        if op in ('**', '<<', '<<<') and b > 4096:
+            raise ValueError("constant too large")
+        if op in ('/', '%'):
+            if b == 0:
+                raise ValueError("division by zero")
+            q = abs(a) // abs(b) * (1 if (a >= 0) == (b >= 0) else -1)
+            return q if op == '/' else a - q * b
+        if op in ('<<', '<<<'): return a << b
+        if op in ('>>', '>>>'): return a >> b
+        return {'||': lambda: int(bool(a) or bool(b)), '&&': lambda: int(bool(a) and bool(b)),
+                '|': lambda: a | b, '^': lambda: a ^ b, '~^': lambda: ~(a ^ b), '^~': lambda: ~(a ^ b),
+                '&': lambda: a & b, '==': lambda: int(a == b), '!=': lambda: int(a != b),
+                '===': lambda: int(a == b), '!==': lambda: int(a != b), '<': lambda: int(a < b),
+                '<=': lambda: int(a <= b), '>': lambda: int(a > b), '>=': lambda: int(a >= b),
+                '+': lambda: a + b, '-': lambda: a - b, '*': lambda: a * b, '**': lambda: a ** b}[op]()
+
+    def unary(self) -> int:
+        t = self.take()
+        if t.text == '(':
+            v = self.expr(0)
+            if self.take().text != ')':
+                raise ValueError("unbalanced parentheses")
+            return v
+        if t.text in ('-', '+', '~', '!'):
+            v = self.unary()
+            return {'-': -v, '+': v, '~': ~v, '!': int(not v)}[t.text]
+        if t.kind == 'NUM':
+            return self.number(t.text)
+        if t.kind in ('ID', 'MACRO'):
+            return self.lookup(t.text)
+        if t.kind == 'SYS' and t.text == '$clog2':
+            if self.take().text != '(':
+                raise ValueError("$clog2 without argument")
+            v = self.expr(0)
+            if self.take().text != ')':
+                raise ValueError("unbalanced $clog2")
+            return max(v - 1, 0).bit_length()
+        raise ValueError(f"not a constant: {t.text}")
+
+    @staticmethod
+    def number(text: str) -> int:
+        text = text.replace('_', '')
+        if "'" not in text:
+            return int(float(text)) if ('.' in text or 'e' in text.lower()) else int(text)
+        digits = re.sub(r'\s', '', text.split("'", 1)[1]).lstrip('sS')
+        base = {'b': 2, 'o': 8, 'd': 10, 'h': 16}.get(digits[:1].lower())
+        if base is None:
+            raise ValueError("unsized fill literal")
+        return int(digits[1:], base)
+
+
+class _ModuleBuilder:
+    """Accumulates one module's contents while the parser walks its items"""
+
+    def __init__(self, name: str, defines: Dict[str, str]):
+        self.name, self.defines = name, defines
+        self.signals: Dict[str, VerilogSignal] = {}
+        self.assignments: List[Tuple[str, str]] = []
+        self.always_blocks: List[str] = []
+        self.instances: List[str] = []
+        self.parameters: Dict[str, str] = {}
+        self._param_cache: Dict[str, Optional[int]] = {}
+
+    def add_signal(self, name: str, stype: str, width: int):
+        prev = self.signals.get(name)
+        if prev is not None and prev.signal_type in _DIRECTIONS and stype not in _DIRECTIONS:
+            prev.width = max(prev.width, width)       # non-ANSI `output q; reg q;` keeps the direction
+            return
+        self.signals[name] = VerilogSignal(name, stype, width,
+                                           bool(_CLOCK_RE.search(name)), bool(_RESET_RE.search(name)))
+
+    def lookup(self, ident: str) -> int:
+        if ident in self._param_cache:
+            v = self._param_cache[ident]
+            if v is None:
+                raise ValueError(f"unresolved constant {ident}")
+            return v
+        text = self.defines.get(ident[1:]) if ident.startswith('`') else self.parameters.get(ident)
+        if text is None:
+            raise ValueError(f"unknown identifier {ident}")
+        self._param_cache[ident] = None               # cycle guard; stays None if evaluation fails
+        v = _ConstEval([t for t in tokenize(text) if t.kind != 'EOF'], self.lookup).value()
+        self._param_cache[ident] = v
+        return v
+
+    def const(self, toks: List[Token]) -> Optional[int]:
+        try:
+            return _ConstEval(toks, self.lookup).value()
+        except (ValueError, KeyError, OverflowError, IndexError, RecursionError):
+            return None
+
+    def dims_width(self, dims: List[List[Token]]) -> int:
+        """Bit width of a stack of packed dimensions: product of |hi-lo|+1 (or N for [N])"""
+        width = 1
+        for d in dims:
+            depth, split = 0, None
+            for i, t in enumerate(d):
+                if t.text in _OPEN: depth += 1
+                elif t.text in _CLOSE: depth -= 1
+                elif t.text == ':' and depth == 0 and split is None: split = i
+            if split is None:
+                size = self.const(d)
+            else:
+                hi, lo = self.const(d[:split]), self.const(d[split+1:])
+                size = abs(hi - lo) + 1 if hi is not None and lo is not None else None
+            width *= size if size and size > 0 else 1
+        return width
+
+    def build(self) -> VerilogModule:
+        return VerilogModule(self.name, self.signals, self.assignments, self.always_blocks,
+                             self.instances, self.parameters)
+
+
+class _RecursiveDescent:
+    """Recursive-descent walk over the token stream; one VerilogModule per module region"""
+
+    def __init__(self, text: str):
+        self.text, self.tokens, self.pos = text, tokenize(text), 0    # pos: where the lexer resumes
+        self.buf: deque = deque()
+        self.defines: Dict[str, str] = {}
+        self.rec: Optional[List[Token]] = None
+        self.eof: Optional[Token] = None
+        self.consumed = 0
+
+    # ── token stream ──
+    def define(self, t: Token):
+        m = re.match(r'`define[ \t]+(\w+)(?:\([^)]*\))?[ \t]*((?:\\\n|[^\n])*)', t.text)
+        if m:
+            self.defines[m.group(1)] = m.group(2).replace('\\\n', ' ').strip()
+
+    def pull(self) -> Token:
+        """Next token straight from the lexer (records `defines, repeats EOF once exhausted)"""
+        if self.eof is not None:
+            return self.eof
+        t = next(self.tokens)
+        while t.kind == 'DEFINE':
+            self.define(t)
+            t = next(self.tokens)
+        if t.kind == 'EOF':
+            self.eof = t
+        self.pos = t.end
+        return t
+
+    def peek(self, k: int = 0) -> Token:
+        buf = self.buf
+        while len(buf) <= k:
+            t = self.pull()
+            if t.kind == 'EOF':
+                return t
+            buf.append(t)
+        return buf[k]
+
+    def next(self) -> Token:
+        t = self.buf.popleft() if self.buf else self.pull()
+        if t.kind != 'EOF':
+            self.consumed += 1
+            if self.rec is not None:
+                self.rec.append(t)
+        return t
+
+    def at(self, *texts: str) -> bool:
+        return self.peek().text in texts
+
+    def accept(self, text: str) -> bool:
+        if self.peek().text == text:
+            self.next(); return True
+        return False
+
+    def at_eof(self) -> bool:
+        return self.peek().kind == 'EOF'
+
+    def group(self) -> List[Token]:
+        """Consume a balanced (...) / [...] / {...} group; returns the inner tokens"""
+        opener = self.next()
+        inner, depth = [], 1
+        while not self.at_eof():
+            t = self.next()
+            if t.text in _OPEN: depth += 1
+            elif t.text in _CLOSE:
+                depth -= 1
+                if depth == 0:
+                    break
+            inner.append(t)
+        return inner if opener.text in _OPEN else []
+
+    def until(self, stops: Tuple[str, ...] = (';',), consume: bool = True) -> List[Token]:
+        """Tokens up to a depth-0 stop token (never running past endmodule)"""
+        out, depth, buf, tokens, stop = [], 0, self.buf, self.tokens, None
+        while True:
+            if buf:
+                t = buf.popleft()
+            elif self.eof is not None:
+                break
+            else:                                            # inlined pull(): this loop is the hot path
+                t = next(tokens)
+                if t.kind == 'DEFINE':
+                    self.define(t); continue
+                if t.kind == 'EOF':
+                    self.eof = t; break
+            x = t.text
+            if depth == 0 and (x in stops or x == 'endmodule'):
+                if consume and x != 'endmodule':
+                    stop = t
+                else:
+                    buf.appendleft(t)
+                break
+            if x in _OPEN: depth += 1
+            elif x in _CLOSE and depth: depth -= 1
+            out.append(t)
+        self.consumed += len(out) + (stop is not None)
+        if not buf and (stop or out):
+            self.pos = (stop or out[-1]).end
+        if self.rec is not None:
+            self.rec.extend(out)
+            if stop is not None:
+                self.rec.append(stop)
+        return out
+
+    def skip_to(self, end_kw: str):
+        while not self.at_eof() and not self.at(end_kw, 'endmodule'):
+            self.next()
+        self.accept(end_kw)
+
+    def label(self):
+        if self.accept(':'):
+            self.next()
+
+    @staticmethod
+    def split_commas(toks: List[Token]) -> List[List[Token]]:
+        parts, cur, depth = [], [], 0
+        for t in toks:
+            if t.text in _OPEN: depth += 1
+            elif t.text in _CLOSE: depth -= 1
+            if t.text == ',' and depth == 0:
+                parts.append(cur); cur = []
+            else:
+                cur.append(t)
+        if cur:
+            parts.append(cur)
+        return parts
+
+    # ── design units ──
+    def modules(self) -> Iterator[VerilogModule]:
+        while not self.at_eof():
+            t = self.next()
+            if t.text in ('module', 'macromodule'):
+                yield self.module()
+            elif t.text in _BLOCK_ENDS:
+                self.skip_to(_BLOCK_ENDS[t.text])
+
+    def module(self) -> VerilogModule:
+        while self.at('automatic', 'static'):
+            self.next()
+        name = self.next().text if self.peek().kind == 'ID' else "unknown"
+        mb = _ModuleBuilder(name, self.defines)
+        while self.at('import'):
+            self.until()
+        if self.accept('#') and self.at('('):
+            self.param_assignments(mb, self.group())
+        if self.at('('):
+            self.port_list(mb, self.group())
+        self.accept(';')
+        self.items(mb, ('endmodule',))
+        if self.accept('endmodule'):
+            self.label()
+        return mb.build()
+
+    def headerless(self) -> VerilogModule:
+        """Files without a module header: treat every item as belonging to 'unknown'"""
+        mb = _ModuleBuilder("unknown", self.defines)
+        while not self.at_eof():
+            self.items(mb, ('endmodule',))
+            self.accept('endmodule')
+        return mb.build()
+
+    def port_list(self, mb: _ModuleBuilder, toks: List[Token]):
+        direction, dims = None, []
+        for part in self.split_commas(toks):
+            if not part:
+                continue
+            i = 0
+            if part[0].text in _DIRECTIONS:
+                direction, dims, i = part[0].text, [], 1
+                while i < len(part) and (part[i].text in _DATA_KWS or part[i].text == '['):
+                    if part[i].text == '[':
+                        j = self.close_index(part, i)
+                        dims.append(part[i+1:j-1]); i = j
+                    else:
+                        i += 1
+            elif direction is None:
+                continue                                     # non-ANSI header: declared in the body
+            if i < len(part) and part[i].kind == 'ID' and part[i].text not in _KEYWORDS:
+                mb.add_signal(part[i].text, direction, mb.dims_width(dims))
+
+    # ── module items ──
+    def items(self, mb: _ModuleBuilder, stops: Tuple[str, ...]):
+        while True:
+            if not self.buf and self.eof is None and self.rec is None:
+                self.fast_items(mb)
+            if self.at_eof() or self.at(*stops) or self.at('endmodule'):
+                break
+            self.item(mb)
+
+    def fast_items(self, mb: _ModuleBuilder):
+        """Consume a run of plain declarations / continuous assigns straight from the text"""
+        text, pos = self.text, self.pos
+        while True:
+            m = _FAST_ITEM_RE.match(text, pos)
+            if m is None:
+                break
+            kw, hi, lo, names, lhs, expr = m.groups()
+            if kw is not None:
+                names = [nm.strip() for nm in names.split(',')] if ',' in names else [names]
+                if not _KEYWORDS.isdisjoint(names):
+                    break
+                width = abs(int(hi) - int(lo)) + 1 if hi is not None else 1
+                for nm in names:
+                    mb.add_signal(nm, _DECL_TYPE[kw], width)
+            else:
+                if lhs in _KEYWORDS or '  ' in expr:
+                    break
+                mb.assignments.append((lhs, expr))
+            pos = m.end()
+            self.consumed += 1
+        if pos != self.pos:
+            self.tokens, self.pos = tokenize(text, pos), pos
+
+    def item(self, mb: _ModuleBuilder):
+        t = self.peek(); x = t.text
+        if x in _DIRECTIONS:
+            self.next(); self.declaration(mb, x)
+        elif x in _NET_TYPES:
+            self.next(); self.declaration(mb, 'wire')
+        elif x in _VAR_TYPES:
+            self.next(); self.declaration(mb, 'reg')
+        elif x in ('parameter', 'localparam'):
+            self.param_assignments(mb, self.until())
+        elif x == 'assign':
+            self.next(); self.assign(mb)
+        elif x in _ALWAYS_KWS:
+            self.always(mb)
+        elif x in ('initial', 'final'):
+            self.next(); self.statement()
+        elif x == 'generate':
+            self.next(); self.items(mb, ('endgenerate',)); self.accept('endgenerate')
+        elif x == 'for':
+            self.next(); self.group(); self.generate_block(mb)
+        elif x == 'if':
+            self.next(); self.group(); self.generate_block(mb)
+            if self.accept('else'):
+                self.generate_block(mb)
+        elif x == 'case':
+            self.next(); self.group()
+            while not self.at_eof() and not self.at('endcase', 'endmodule'):
+                if self.accept('default'):
+                    self.accept(':')
+                else:
+                    self.until((':',))
+                self.generate_block(mb)
+            self.accept('endcase')
+        elif x == 'begin':
+            self.generate_block(mb)
+        elif x in _BLOCK_ENDS:
+            self.next(); self.skip_to(_BLOCK_ENDS[x])
+        elif x in (';', 'end', 'endgenerate', 'endcase', 'else', 'join', 'join_any', 'join_none'):
+            self.next()                                      # stray terminator
+        elif t.kind == 'ID' and x not in _KEYWORDS:
+            self.instance(mb)
+        else:
+            self.next(); self.until()
+
+    def generate_block(self, mb: _ModuleBuilder):
+        if self.accept('begin'):
+            self.label()
+            self.items(mb, ('end',))
+            self.accept('end'); self.label()
+        elif not self.at_eof() and not self.at('endmodule'):
+            self.item(mb)
+
+    @staticmethod
+    def close_index(toks: List[Token], i: int) -> int:
+        """Index just past the bracket group opened at toks[i]"""
+        opener, closer, depth, j = toks[i].text, _OPEN[toks[i].text], 1, i + 1
+        while j < len(toks) and depth:
+            depth += toks[j].text == opener
+            depth -= toks[j].text == closer
+            j += 1
+        return j
+
+    def declaration(self, mb: _ModuleBuilder, stype: str):
+        toks = self.until()
+        i, dims = 0, []
+        while i < len(toks):                                 # type keywords, strength, delay, packed dims
+            x = toks[i].text
+            if x in _DATA_KWS:
+                i += 1; continue
+            if x == '#':
+                i += 1
+                if i < len(toks) and toks[i].text != '(':
+                    i += 1; continue
+            if i < len(toks) and toks[i].text in ('(', '['):
+                j = self.close_index(toks, i)
+                if toks[i].text == '[':
+                    dims.append(toks[i+1:j-1])
+                i = j; continue
+            break
+        width = mb.dims_width(dims)
+        for part in self.split_commas(toks[i:]):
+            if not part or part[0].kind != 'ID':
+                continue
+            name = part[0].text
+            mb.add_signal(name, stype, width)
+            eq = next((k for k, t in enumerate(part) if t.text == '='), None)
+            if eq is not None and stype != 'reg':
+                mb.assignments.append((name, _join_tokens(part[eq+1:])))
+
+    def param_assignments(self, mb: _ModuleBuilder, toks: List[Token]):
+        for part in self.split_commas(toks):
+            eq = next((k for k, t in enumerate(part) if t.text == '='), None)
+            if eq is None or eq == 0 or part[eq-1].kind != 'ID':
+                continue
+            mb.parameters[part[eq-1].text] = _join_tokens(part[eq+1:])
+
+    def assign(self, mb: _ModuleBuilder):
+        if self.at('('):
+            self.group()                                     # drive strength
+        if self.accept('#'):
+            self.group() if self.at('(') else self.next()    # delay
+        for part in self.split_commas(self.until()):
+            eq = next((k for k, t in enumerate(part) if t.text == '='), None)
+            if eq is None:
+                continue
+            expr, depth = _join_tokens(part[eq+1:]), 0
+            for t in part[:eq]:                              # every base name in the lvalue
+                if t.text == '[': depth += 1
+                elif t.text == ']': depth -= 1
+                elif t.kind == 'ID' and depth == 0:
+                    mb.assignments.append((t.text, expr))
+
+    def always(self, mb: _ModuleBuilder):
+        self.rec = []
+        self.next()
+        self.statement()
+        mb.always_blocks.append(_join_tokens(self.rec))
+        self.rec = None
+
+    def instance(self, mb: _ModuleBuilder):
+        mtype = self.next().text
+        if self.accept('#'):
+            self.group() if self.at('(') else self.next()
+        while True:
+            if self.peek().kind == 'ID' and self.peek().text not in _KEYWORDS:
+                inst = self.next().text
+                while self.at('['):
+                    self.group()
+                if not self.at('('):
+                    break
+                self.group()
+                mb.instances.append(f"{mtype} {inst}")
+            elif self.at('('):
+                self.group()                                 # unnamed gate primitive
+            else:
+                break
+            if not self.accept(','):
+                break
+        self.until()
+
+    # ── procedural statements (only their extent matters) ──
+    def statement(self):
+        x = self.peek().text
+        if x in ('begin', 'fork'):
+            self.next(); self.label()
+            while not self.at_eof() and not self.at('end', 'join', 'join_any', 'join_none', 'endmodule'):
+                before = self.consumed
+                self.statement()
+                if self.consumed == before:
+                    self.next()                              # stray terminator: drop it and carry on
+            if not self.at('endmodule'):
+                self.next()
+            self.label()
+        elif x == 'if':
+            self.next(); self.group(); self.statement()
+            if self.accept('else'):
+                self.statement()
+        elif x in ('unique', 'unique0', 'priority'):
+            self.next(); self.statement()
+        elif x in _CASE_KWS:
+            self.next(); self.group(); self.accept('inside')
+            while not self.at_eof() and not self.at('endcase', 'endmodule'):
+                if self.accept('default'):
+                    self.accept(':')
+                else:
+                    self.until((':',))
+                self.statement()
+            self.accept('endcase')
+        elif x in ('for', 'while', 'repeat', 'foreach', 'wait'):
+            self.next(); self.group(); self.statement()
+        elif x == 'forever':
+            self.next(); self.statement()
+        elif x == 'do':
+            self.next(); self.statement(); self.accept('while'); self.group(); self.accept(';')
+        elif x in ('@', '#'):
+            self.next()
+            self.group() if self.at('(') else self.next()
+            self.statement()
+        elif x in ('end', 'endcase', 'join', 'join_any', 'join_none', 'endmodule', ''):
+            return                                           # malformed input: let the caller recover
+        else:
+            self.until()
+
+
+class CompetitionVerilogParser:
+    """
+    Single linear pass over the source: a streaming lexer feeding a
+    recursive-descent parser (ports, parameter/localparam, generate blocks,
+    multi-dimensional packed ranges, instances, always blocks). Runs of plain
+    declarations and continuous assigns are matched whole, without tokens.
+    """
+    VERSION = "lexer-rd/1"
+
+    def parse_modules(self, content: str) -> Iterator[VerilogModule]:
+        """Yield one VerilogModule per module … endmodule region, as soon as it is parsed"""
+        found = False
+        for mod in _RecursiveDescent(content).modules():
+            found = True
+            yield mod
+        if not found:
+            yield _RecursiveDescent(content).headerless()
+
+    def parse(self, content: str) -> VerilogModule:
+        """First module of the file (see parse_modules for the rest)"""
+        return next(self.parse_modules(content))
@@ -0,0 +1,89 @@
+"""JSON / CSV report synthesis shared by the dashboard export and the batch CLI"""
+
+import csv
+import io
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .structures import VerilogModule
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# REPORT
+# ─────────────────────────────────────────────────────────────────────────────
+REPORT_COLUMNS = ['file', 'module', 'verdict', 'hybrid_score', 'gnn_score', 'statistical_score',
+                  'confidence', 'ht_types', 'signals', 'anomaly_count', 'golden_reference', 'golden_distance',
+                  'similar_design', 'similar_distance', 'similar_verdict', 'near_duplicate',
+                  'cone_signals', 'cone_edges', 'cone_gnn_score']
+
+
+def build_report(modules: List[VerilogModule], predictions: List[Dict], fingerprints: List[Dict],
+                 monitor_summary: Dict, mcp_calls: int = 0) -> Dict:
+    total   = len(predictions)
+    trojans = sum(1 for p in predictions if p['prediction']==1)
+    return {
+        'platform': 'ArmorIQ™ v2.0',
+        'architecture': {'gnn': '4-layer GAT 256H', 'agents': 3, 'mcp_servers': 8},
+        'mcp_calls': mcp_calls,
+        'summary': {
+            'total': total, 'trojans': trojans, 'clean': total - trojans,
+            'critical': monitor_summary.get('critical', 0),
+            'avg_confidence': float(np.mean([p['confidence'] for p in predictions])) if predictions else 0.0
+        },
+        'designs': [{
+            'file': p.get('filename',m.name), 'module': m.name,
+            'verdict': 'HT-Infested' if p['prediction']==1 else 'HT-Free',
+            'hybrid_score': float(p['hybrid_score']),
+            'gnn_score': float(p['gnn_score']),
+            'statistical_score': float(p['statistical_score']),
+            'confidence': float(p['confidence']),
+            'ht_types': fp.get('ht_types',[]),
+            'signals': len(m.signals),
+            'anomaly_count': sum(len(v) if isinstance(v,list) else 0
+                                 for v in p['anomalies'].values()),
+            'golden_reference': p.get('golden', {}).get('reference'),
+            'golden_distance': p.get('golden', {}).get('distance'),
+            'similar_design': (p.get('similar') or [{}])[0].get('key'),
+            'similar_distance': (p.get('similar') or [{}])[0].get('distance'),
+            'similar_verdict': (p.get('similar') or [{}])[0].get('verdict'),
+            'near_duplicate': bool(p.get('near_duplicate')),
+            'cone_signals': (p.get('cone') or {}).get('signals'),
+            'cone_edges': (p.get('cone') or {}).get('edges'),
+            'cone_gnn_score': (p.get('cone') or {}).get('gnn_score'),
+        } for m,p,fp in zip(modules,predictions,fingerprints)]
+    }
+
+
+def browse_designs(designs: List[Dict], query: str = '', verdicts: Iterable[str] = (), ht_types: Iterable[str] = (),
+                   sort: Optional[str] = 'hybrid_score', descending: bool = True) -> List[int]:
+    """
+    Indices into report['designs'] matching a file / module substring, any of
+    `verdicts` and any of `ht_types`, ordered by hybrid_score, verdict
+    (infested first) or first HT type; ties fall back to hybrid score, then
+    upload order. sort=None keeps upload order.
+    """
+    q, vs, ts = query.strip().lower(), set(verdicts), set(ht_types)
+    idx = [i for i, d in enumerate(designs)
+           if (not q or q in d['file'].lower() or q in d['module'].lower())
+           and (not vs or d['verdict'] in vs) and (not ts or ts.intersection(d['ht_types']))]
+    sign = -1 if descending else 1
+    if sort == 'hybrid_score':
+        idx.sort(key=lambda i: sign * designs[i]['hybrid_score'])
+    elif sort == 'verdict':
+        idx.sort(key=lambda i: (designs[i]['verdict'] != 'HT-Infested', -designs[i]['hybrid_score']))
+    elif sort == 'ht_types':
+        idx.sort(key=lambda i: (min(designs[i]['ht_types'], default='~'), -designs[i]['hybrid_score']))
+    elif sort is not None:
+        raise ValueError(f"unknown sort key {sort!r}")
+    return idx
+
+
+def report_csv(report: Dict) -> str:
+    """One row per design, same columns as the JSON 'designs' list"""
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=REPORT_COLUMNS, lineterminator='\n')
+    w.writeheader()
+    for d in report['designs']:
+        w.writerow({k: str(v) if isinstance(v, list) else v for k, v in d.items()})
+    return buf.getvalue()
@@ -0,0 +1,147 @@
+"""End-to-end scan (cache → ingest → elaborate → agent pipeline) shared by the dashboard and the CLI"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .agents import AgentPipeline, AnalysisAgent, DetectionAgent, MonitorAgent
+from .cache import ResultCache
+from .detector import HybridTrojanDetectionSystem
+from .elaborate import DesignElaborator
+from .golden import Golden, GoldenStore
+from .graph import EnhancedGraphBuilder
+from .ingest import ingest_files
+from .mcp import MCPServerRegistry
+from .similarity import EmbeddingIndex
+from .structures import VerilogModule
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SCAN
+# ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class ScanResult:
+    elab: DesignElaborator
+    modules: List[VerilogModule] = field(default_factory=list)
+    graphs: List[Any] = field(default_factory=list)
+    filenames: List[str] = field(default_factory=list)
+    entries: List[Dict] = field(default_factory=list)               # per-module cache entry, aligned with modules
+    fresh: List[Tuple[str, List[Dict]]] = field(default_factory=list)  # (key, file entries) to store after scoring
+    errors: List[Tuple[str, str]] = field(default_factory=list)     # (file, message)
+    cached_files: int = 0
+    predictions: List[Dict] = field(default_factory=list)
+    fingerprints: List[Dict] = field(default_factory=list)
+    monitor: Dict = field(default_factory=dict)
+    agents: Tuple = ()
+    pipeline: Optional[AgentPipeline] = None
+
+
+def ingest_designs(files: List[Tuple[str, bytes]], builder: Optional[EnhancedGraphBuilder], detector: HybridTrojanDetectionSystem,
+                   mcp: MCPServerRegistry, cache: Optional[ResultCache] = None, workers: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> ScanResult:
+    """Cache lookup, parallel parse + graph build for misses, then elaboration across all files"""
+    if detector.statistical_only:                          # no GNN: skip graph building (and torch) entirely
+        builder = None
+    res = ScanResult(DesignElaborator(builder, detector.stat_det))
+    keys = [cache.key(b) for _, b in files] if cache else [None] * len(files)
+    per_file: List[Optional[List[Dict]]] = [cache.get(k) if cache else None for k in keys]
+    misses = [i for i, e in enumerate(per_file) if e is None]
+    res.cached_files = len(files) - len(misses)
+
+    for i in misses:
+        mcp.submit("mcp-parse", "tokenize", {"file": files[i][0]})
+    for i, r in zip(misses, ingest_files([files[i] for i in misses], builder, workers=workers, progress=progress)):
+        if r['error']:
+            res.errors.append((r['name'], r['error'])); continue
+        per_file[i] = r['entries']
+        if cache:
+            res.fresh.append((keys[i], r['entries']))
+        for e in r['entries']:
+            mcp.submit("mcp-graph", "build", {"nodes": len(e['module'].signals)})
+
+    for (name, _), file_entries in zip(files, per_file):
+        for e in file_entries or []:
+            mod = e['module']
+            res.elab.add(mod, name, e.get('analysis'))      # same-name variants are all scored
+            e['analysis'] = res.elab.analyze(mod)
+            res.graphs.append(e['analysis']['graph'])
+            res.modules.append(mod); res.filenames.append(name); res.entries.append(e)
+    return res
+
+
+def score_designs(res: ScanResult, detector: HybridTrojanDetectionSystem, mcp: MCPServerRegistry,
+                  cache: Optional[ResultCache] = None, golden: Optional[Golden] = None) -> ScanResult:
+    """Run the Detection → Analysis/Monitor pipeline and write fresh results back to the cache"""
+    det, ana, mon = DetectionAgent(mcp, detector), AnalysisAgent(mcp), MonitorAgent(mcp)
+    res.agents, res.pipeline = (det, ana, mon), AgentPipeline(det, ana, mon)
+    res.predictions, res.fingerprints, res.monitor = res.pipeline.run(
+        res.modules, res.graphs, golden,
+        [res.elab.analyze(m)['stats'] for m in res.modules],
+        [e.get('gnn') for e in res.entries], res.filenames)
+    if detector.index is not None:
+        new = index_designs(res, detector.index)
+        mcp.submit("mcp-classify", "index_embeddings", {"added": new, "indexed": len(detector.index)})
+    _store_fresh(res, cache)
+    mcp.drain()
+    return res
+
+
+def index_designs(res: ScanResult, index: EmbeddingIndex, source: str = 'scan', label: Optional[int] = None) -> int:
+    """
+    Record each scored design's embedding and verdict (or `label`) in the
+    similarity index, then save. Scans never overwrite labelled corpus entries.
+    """
+    rows = [(f"{fn}:{m.name}", p) for fn, m, p in zip(res.filenames, res.modules, res.predictions)
+            if p['embedding'] is not None]
+    if source == 'scan':
+        rows = [(k, p) for k, p in rows if index.source(k) in (None, 'scan')]
+    if not rows:
+        return 0
+    new = index.add_many([k for k, _ in rows], [p['embedding'] for _, p in rows],
+                         [p['prediction'] if label is None else label for _, p in rows],
+                         [p['hybrid_score'] for _, p in rows], source)
+    index.save()
+    return new
+
+
+def _store_fresh(res: ScanResult, cache: Optional[ResultCache]):
+    for p, e in zip(res.predictions, res.entries):
+        if p['gnn_logits'] is not None:
+            e['gnn'] = (p['gnn_logits'], p['embedding'])
+    for key, file_entries in res.fresh:
+        try:
+            cache.put(key, file_entries)
+        except Exception as e:
+            res.errors.append(("<cache>", f"write failed: {e}"))
+
+
+def ingest_golden(files: List[Tuple[str, bytes]], store: GoldenStore, builder: EnhancedGraphBuilder,
+                  detector: HybridTrojanDetectionSystem, mcp: MCPServerRegistry, cache: Optional[ResultCache] = None,
+                  workers: Optional[int] = None, progress: Optional[Callable[[int, int], None]] = None) -> ScanResult:
+    """Add known-clean designs to the golden store: structural features + GNN embedding per module, then save"""
+    res = ingest_designs(files, builder, detector, mcp, cache, workers, progress)
+    stats = [res.elab.analyze(m)['stats'] for m in res.modules]
+    preds = detector.predict_many(res.modules, res.graphs, None, stats, [e.get('gnn') for e in res.entries])
+    new = store.add_many([f"{fn}:{m.name}" for fn, m in zip(res.filenames, res.modules)],
+                         [detector.stat_det.compute_structural_features(m) for m in res.modules],
+                         [p['embedding'] for p in preds])
+    store.save()
+    mcp.submit("mcp-golden", "store_references", {"added": new, "updated": len(res.modules) - new,
+                                                  "references": len(store)})
+    res.predictions = preds
+    _store_fresh(res, cache)
+    mcp.drain()
+    return res
+
+
+def ingest_corpus(files: List[Tuple[str, bytes]], index: EmbeddingIndex, label: int, builder: EnhancedGraphBuilder,
+                  detector: HybridTrojanDetectionSystem, mcp: MCPServerRegistry, cache: Optional[ResultCache] = None,
+                  workers: Optional[int] = None, progress: Optional[Callable[[int, int], None]] = None) -> ScanResult:
+    """Add a labelled corpus (1 = known-trojan, 0 = known-clean) to the similarity index, then save"""
+    res = ingest_designs(files, builder, detector, mcp, cache, workers, progress)
+    stats = [res.elab.analyze(m)['stats'] for m in res.modules]
+    res.predictions = detector.predict_many(res.modules, res.graphs, None, stats, [e.get('gnn') for e in res.entries])
+    new = index_designs(res, index, 'trojan-corpus' if label else 'clean-corpus', label)
+    mcp.submit("mcp-classify", "index_embeddings", {"added": new, "indexed": len(index), "label": label})
+    _store_fresh(res, cache)
+    mcp.drain()
+    return res
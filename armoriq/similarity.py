@@ -0,0 +1,253 @@
+"""Persistent GNN-embedding index: top-k similar designs and near-duplicate detection"""
+
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import MODEL_VERSION
+from .golden import BruteForceIndex
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# APPROXIMATE INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+class IVFIndex:
+    """
+    Inverted-file approximate k-NN: k-means splits the vectors into nlist
+    cells, a query is compared exactly against the members of its nprobe
+    nearest cells only (default nlist ≈ 4√n, nprobe = nlist/16: about a
+    sixteenth of the vectors are scanned). Same search() contract as
+    BruteForceIndex; rows that could not be filled (fewer than k candidates
+    probed) get index -1. add() assigns new vectors to the existing cells
+    without retraining; passing saved `centroids` / `assign` skips training.
+    """
+
+    def __init__(self, vectors: np.ndarray, metric: str = 'cosine', nlist: Optional[int] = None,
+                 nprobe: Optional[int] = None, iters: int = 10, seed: int = 0,
+                 centroids: Optional[np.ndarray] = None, assign: Optional[np.ndarray] = None,
+                 trained_on: Optional[int] = None):
+        if metric not in ('l2', 'cosine'):
+            raise ValueError(f"unknown metric {metric!r}")
+        self.metric = metric
+        x = self._prep(vectors)
+        n = len(x)
+        if centroids is None:
+            centroids = self._train(x, nlist or int(np.clip(4 * np.sqrt(n), 16, 4096)), iters, seed)
+        self.nlist  = len(centroids)
+        self.nprobe = nprobe or max(8, self.nlist // 16)
+        self.quantizer  = BruteForceIndex(centroids, metric)
+        self.trained_on = trained_on or n
+        self.x, self.sq = np.zeros((0, x.shape[1]), np.float32), np.zeros(0, np.float32)
+        self.assign = np.zeros(0, np.int64)
+        self.add(x, assign, prepped=True)
+
+    def _train(self, x: np.ndarray, nlist: int, iters: int, seed: int) -> np.ndarray:
+        """Lloyd's k-means on a sample of at most 64 points per cell; empty cells are re-seeded"""
+        nlist  = min(nlist, max(len(x), 1))
+        rng    = np.random.default_rng(seed)
+        sample = x[rng.choice(len(x), min(len(x), 64 * nlist), replace=False)]
+        c = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iters):
+            a = BruteForceIndex(c, self.metric).search(sample, 1)[1][:, 0]
+            cnt = np.bincount(a, minlength=nlist)
+            c = np.zeros_like(c); np.add.at(c, a, sample)
+            empty = cnt == 0
+            c[~empty] /= cnt[~empty, None]
+            c[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        return c
+
+    def _prep(self, v: np.ndarray) -> np.ndarray:
+        x = np.ascontiguousarray(v, dtype=np.float32).reshape(len(v), -1)
+        if self.metric == 'cosine':
+            x = x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+        return x
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def add(self, vectors: np.ndarray, assign: Optional[np.ndarray] = None, prepped: bool = False):
+        x = vectors if prepped else self._prep(vectors)
+        if assign is None or len(assign) != len(x):
+            assign = self.quantizer.search(x, 1)[1][:, 0]
+        self.x = np.vstack([self.x, x])
+        self.sq = np.concatenate([self.sq, np.einsum('ij,ij->i', x, x)])
+        self.assign = np.concatenate([self.assign, np.asarray(assign, np.int64)])
+        self.order = np.argsort(self.assign, kind='stable')
+        self.offsets = np.searchsorted(self.assign[self.order], np.arange(self.nlist + 1))
+
+    def search(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """(distances, indices), each (m, k) sorted nearest-first; L2 distances are Euclidean"""
+        q = self._prep(np.asarray(queries).reshape(-1, self.x.shape[1]))
+        k = min(k, len(self))
+        dist = np.full((len(q), k), np.inf, np.float32)
+        idx  = np.full((len(q), k), -1, np.int64)
+        cells = self.quantizer.search(q, min(self.nprobe, self.nlist))[1]
+        for r, (qv, cs) in enumerate(zip(q, cells)):
+            cand = np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in cs])
+            if not len(cand):
+                continue
+            xc = self.x[cand]
+            d = 1.0 - xc @ qv if self.metric == 'cosine' else qv @ qv - 2.0 * (xc @ qv) + self.sq[cand]
+            kk = min(k, len(cand))
+            top = np.argpartition(d, kk - 1)[:kk] if kk < len(cand) else np.arange(len(cand))
+            top = top[np.argsort(d[top], kind='stable')]
+            dist[r, :kk], idx[r, :kk] = d[top], cand[top]
+        if self.metric == 'l2':
+            dist = np.sqrt(np.maximum(dist, 0.0))
+        return dist, idx
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# EMBEDDING INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+class EmbeddingIndex:
+    """
+    Every analysed design's pooled GNN embedding with its verdict and hybrid
+    score, plus labelled corpora (known-trojan / known-clean), keyed by
+    "file:module" (re-adding a key replaces it). Searches are exact cosine
+    (BruteForceIndex) up to ivf_threshold entries and IVFIndex beyond; the IVF
+    cells are retrained once the index has doubled since training. Stored as
+    one .npz per model version, written atomically, together with the IVF
+    cells so a reload does not retrain them.
+    """
+
+    FILENAME = "embeddings.npz"
+    SOURCES  = ('scan', 'trojan-corpus', 'clean-corpus')
+
+    def __init__(self, root: Optional[str] = None, model_version: str = MODEL_VERSION,
+                 ivf_threshold: int = 20000, nprobe: Optional[int] = None, duplicate_distance: float = 1e-3):
+        self.root = root or os.environ.get("ARMORIQ_INDEX_DIR") or \
+            os.path.join(os.path.expanduser("~"), ".cache", "armoriq", "embeddings")
+        self.model_version = model_version
+        self.ivf_threshold, self.nprobe = ivf_threshold, nprobe
+        self.duplicate_distance = duplicate_distance      # cosine distance below which a match is a near-duplicate
+        self._empty()
+        self.load()
+
+    def _empty(self):
+        self.keys: List[str] = []
+        self.embeddings: Optional[np.ndarray] = None      # (n, d) float32
+        self.verdicts = np.zeros(0, dtype=np.int8)
+        self.scores   = np.zeros(0, dtype=np.float32)
+        self.sources  = np.zeros(0, dtype=np.int8)        # index into SOURCES
+        self._index: Optional[Union[BruteForceIndex, IVFIndex]] = None
+        self._ivf: Optional[Dict[str, np.ndarray]] = None  # saved cells, used by the next index build
+        self._row: Dict[str, int] = {}
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.root, f"{self.model_version}-{self.FILENAME}")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ── persistence ──────────────────────────────────────────────────────────
+    def load(self):
+        try:
+            with np.load(self.path, allow_pickle=False) as z:
+                if json.loads(str(z['meta'])).get('model') != self.model_version:
+                    return                                  # embeddings from another model are meaningless
+                self.keys = z['keys'].tolist()
+                self.embeddings = z['embeddings'] if z['embeddings'].size else None
+                self.verdicts, self.scores, self.sources = z['verdicts'], z['scores'], z['sources']
+                self._ivf = {k: z[f'ivf_{k}'] for k in ('centroids', 'assign', 'trained_on')} \
+                    if 'ivf_centroids' in z.files else None
+        except FileNotFoundError:
+            return
+        self._row, self._index = {k: i for i, k in enumerate(self.keys)}, None
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        emb = self.embeddings if self.embeddings is not None else np.zeros((0, 0), np.float32)
+        ivf = self._index if isinstance(self._index, IVFIndex) and len(self._index) == len(self) else None
+        if ivf is not None:
+            self._ivf = {'centroids': ivf.quantizer.x, 'assign': ivf.assign, 'trained_on': np.array(ivf.trained_on)}
+        ivf = {f'ivf_{k}': v for k, v in self._ivf.items()} if self._ivf is not None else {}
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez(fh, keys=np.array(self.keys, dtype=str), embeddings=emb, verdicts=self.verdicts,
+                         scores=self.scores, sources=self.sources, **ivf,
+                         meta=np.array(json.dumps({'model': self.model_version, 'sources': list(self.SOURCES)})))
+            os.replace(tmp, self.path)
+        except Exception:
+            try: os.remove(tmp)
+            except OSError: pass
+            raise
+
+    def clear(self):
+        self._empty()
+        try: os.remove(self.path)
+        except OSError: pass
+
+    # ── ingestion ────────────────────────────────────────────────────────────
+    def add_many(self, keys: Sequence[str], embeddings: Sequence[np.ndarray], verdicts: Sequence[int],
+                 scores: Optional[Sequence[float]] = None, source: str = 'scan') -> int:
+        """Insert or replace designs in bulk (one reallocation per call); returns how many were new"""
+        if not len(keys):
+            return 0
+        emb = np.asarray(np.stack([np.asarray(e, np.float32).ravel() for e in embeddings]), np.float32)
+        if self.embeddings is not None and emb.shape[1] != self.embeddings.shape[1]:
+            raise ValueError(f"embedding dim {emb.shape[1]} != index dim {self.embeddings.shape[1]}")
+        scores = scores if scores is not None else [float(v) for v in verdicts]
+        src = self.SOURCES.index(source)
+        new = [k for k in dict.fromkeys(keys) if k not in self._row]
+        n0 = len(self.keys)
+        for k in new:
+            self._row[k] = len(self.keys); self.keys.append(k)
+        grow = len(self.keys) - n0
+        self.embeddings = np.vstack([self.embeddings if self.embeddings is not None else
+                                     np.zeros((0, emb.shape[1]), np.float32), np.zeros((grow, emb.shape[1]), np.float32)])
+        self.verdicts = np.concatenate([self.verdicts, np.zeros(grow, np.int8)])
+        self.scores   = np.concatenate([self.scores, np.zeros(grow, np.float32)])
+        self.sources  = np.concatenate([self.sources, np.zeros(grow, np.int8)])
+        rows = np.array([self._row[k] for k in keys])
+        self.embeddings[rows], self.verdicts[rows] = emb, np.asarray(verdicts, np.int8)
+        self.scores[rows], self.sources[rows] = np.asarray(scores, np.float32), src
+
+        if isinstance(self._index, IVFIndex) and len(new) == len(keys) and \
+                len(self.keys) < 2 * self._index.trained_on:
+            self._index.add(emb)                           # appended rows only: extend the cells in place
+        else:
+            self._index = None
+            if len(new) != len(keys):                      # replaced rows invalidate saved cell assignments
+                self._ivf = None
+        return len(new)
+
+    # ── lookup ───────────────────────────────────────────────────────────────
+    def source(self, key: str) -> Optional[str]:
+        i = self._row.get(key)
+        return None if i is None else self.SOURCES[self.sources[i]]
+
+    @property
+    def index(self) -> Union[BruteForceIndex, IVFIndex]:
+        if self._index is None:
+            ivf = self._ivf
+            if len(self) < self.ivf_threshold:
+                self._index = BruteForceIndex(self.embeddings, 'cosine')
+            elif ivf is not None and len(self) < 2 * int(ivf['trained_on']):
+                n = len(ivf['assign'])                     # rows added since the save are assigned now
+                self._index = IVFIndex(self.embeddings[:n], 'cosine', nprobe=self.nprobe, centroids=ivf['centroids'],
+                                       assign=ivf['assign'], trained_on=int(ivf['trained_on']))
+                if n < len(self):
+                    self._index.add(self.embeddings[n:])
+            else:
+                self._index = IVFIndex(self.embeddings, 'cosine', nprobe=self.nprobe)
+        return self._index
+
+    def search(self, embedding: np.ndarray, k: int = 5) -> List[Dict]:
+        """Most similar indexed designs: [{'key', 'distance', 'verdict', 'hybrid_score', 'source'}] nearest-first"""
+        if not self.keys or embedding is None:
+            return []
+        dist, idx = self.index.search(np.asarray(embedding, np.float32).ravel()[None], k)
+        return [{'key': self.keys[i], 'distance': max(float(d), 0.0), 'verdict': int(self.verdicts[i]),
+                 'hybrid_score': float(self.scores[i]), 'source': self.SOURCES[self.sources[i]]}
+                for d, i in zip(dist[0].tolist(), idx[0].tolist()) if i >= 0]
+
+    def summary(self) -> Dict:
+        return {'designs': len(self), 'index': type(self.index).__name__ if self.keys else None,
+                **{s: int((self.sources == i).sum()) for i, s in enumerate(self.SOURCES)},
+                'model': self.model_version, 'path': self.path}
@@ -0,0 +1,106 @@
+"""Rule-based structural anomaly detector"""
+
+import re
+from typing import Dict, Optional
+
+import numpy as np
+
+from .names import NameClassifier
+from .netlist import get_signal_table
+from .structures import VerilogModule
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# STATISTICAL DETECTOR
+# ─────────────────────────────────────────────────────────────────────────────
+class StatisticalTrojanDetector:
+    def __init__(self, names: Optional[NameClassifier] = None):
+        # 'suspicious' and 'counter' families; the default classifier is shared with the graph builder
+        self.names = names or NameClassifier.default()
+
+    @property
+    def suspicious_patterns(self):
+        return self.names.families['suspicious']
+
+    # per-hit score weights, in category order
+    WEIGHTS = {'suspicious_names': 0.40, 'unusual_widths': 0.15, 'high_fanout': 0.20,
+               'isolated_signals': 0.25, 'complex_logic': 0.30, 'rare_signals': 0.20}
+
+    @staticmethod
+    def _control_keywords(module: VerilogModule) -> np.ndarray:
+        """Per always block: [if|case count, if|case|for|while count], from one findall each"""
+        kc = module.__dict__.get('_control_keywords')
+        if kc is None:
+            kc = np.zeros((len(module.always_blocks), 2), dtype=np.int64)
+            for i, b in enumerate(module.always_blocks):
+                kw = re.findall(r'if|case|for|while', b)
+                kc[i] = (sum(1 for k in kw if k == 'if' or k == 'case'), len(kw))
+            module.__dict__['_control_keywords'] = kc
+        return kc
+
+    def compute_structural_features(self, module: VerilogModule) -> Dict[str, float]:
+        t = get_signal_table(module)
+        n = len(t)
+        f = {
+            'num_signals': n,
+            'num_assignments': len(module.assignments),
+            'num_always_blocks': len(module.always_blocks),
+            'num_instances': len(module.instances),
+        }
+        f['input_ratio']  = int(t.is_kind('input').sum())  / max(n, 1)
+        f['output_ratio'] = int(t.is_kind('output').sum()) / max(n, 1)
+        f['reg_ratio']    = int(t.is_kind('reg').sum())    / max(n, 1)
+        f['avg_fanin']  = np.mean(t.fanin)  if n else 0
+        f['max_fanin']  = np.max(t.fanin)   if n else 0
+        f['avg_fanout'] = np.mean(t.fanout) if n else 0
+        f['max_fanout'] = np.max(t.fanout)  if n else 0
+        f['avg_width']  = np.mean(t.width)  if n else 0
+        f['max_width']  = np.max(t.width)   if n else 0
+        f['logic_complexity'] = int(self._control_keywords(module)[:, 1].sum())
+        return f
+
+    def analyze(self, module: VerilogModule, golden_features: Optional[Dict] = None) -> Dict:
+        a = {k: [] for k in ['suspicious_names','unusual_widths','high_fanout',
+                              'isolated_signals','complex_logic','rare_signals','golden_deviation']}
+        a['score'] = 0.0
+
+        # one boolean mask per signal-level category over the columnar table
+        t  = get_signal_table(module)
+        nm = self.names.masks(t.netlist)
+        w, fi, fo = t.width, t.fanin, t.fanout
+        hits = {'suspicious_names': nm['suspicious'] != 0,
+                'rare_signals':     (nm['counter'] != 0) & (w > 16),
+                'isolated_signals': (fi == 0) & (fo == 0) & ~t.is_kind('input') & ~t.is_kind('output')}
+        if len(t):
+            mu, sd = w.mean(), w.std()
+            hits['unusual_widths'] = (w > mu + 2.5*sd) & (w > 8)
+        nz = fo[fo > 0]
+        if nz.size:
+            thr = np.percentile(nz, 90) if nz.size > 5 else 10
+            hits['high_fanout'] = (fo > thr) & (fo > 8)
+
+        names = t.names
+        for key, m in hits.items():
+            idx = np.flatnonzero(m)
+            if key == 'unusual_widths':
+                a[key] = [(names[i], v) for i, v in zip(idx.tolist(), w[idx].tolist())]
+            elif key == 'high_fanout':
+                a[key] = [(names[i], v) for i, v in zip(idx.tolist(), fo[idx].tolist())]
+            else:
+                a[key] = [names[i] for i in idx.tolist()]
+        ic = self._control_keywords(module)[:, 0]
+        a['complex_logic'] = ic[ic > 7].tolist()
+        a['score'] = sum(self.WEIGHTS[k] * len(a[k]) for k in self.WEIGHTS)
+
+        if golden_features:
+            cf = self.compute_structural_features(module)
+            for key in ['num_signals', 'num_assignments', 'logic_complexity']:
+                if key in golden_features and key in cf:
+                    dev = abs(cf[key] - golden_features[key]) / max(golden_features[key], 1)
+                    if dev > 0.20:
+                        a['golden_deviation'].append((key, dev)); a['score'] += 0.30*dev
+
+        a['score'] = min(a['score'], 1.0)
+        ni = sum(len(v) if isinstance(v, list) else 0 for v in a.values())
+        a['confidence'] = min(ni / 10.0, 1.0)
+        return a
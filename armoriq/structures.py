@@ -0,0 +1,50 @@
+"""Parsed-design and agent/MCP record types"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DATA STRUCTURES
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class VerilogSignal:
+    name: str
+    signal_type: str
+    width: int = 1
+    is_clock: bool = False
+    is_reset: bool = False
+    fanin: int = 0
+    fanout: int = 0
+    toggle_rate: float = 0.0
+
+
+@dataclass
+class VerilogModule:
+    name: str
+    signals: Dict[str, VerilogSignal]
+    assignments: List[Tuple[str, str]]
+    always_blocks: List[str]
+    instances: List[str] = field(default_factory=list)
+    parameters: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class AgentMessage:
+    agent_id: str
+    agent_name: str
+    timestamp: str
+    level: str      # ok | info | warn | alert
+    content: str
+    data: Any = None
+
+
+@dataclass
+class MCPServer:
+    server_id: str
+    name: str
+    capability: str
+    status: str = "online"   # online | busy | offline
+    requests_served: int = 0
+    last_heartbeat: str = ""
@@ -1,23 +1,24 @@
-
 import os
-import re
-import warnings
 import json
+import hashlib
 import time
-import uuid
-import asyncio
-import threading
-import queue
-from typing import Dict, List, Tuple, Optional, Any
-from collections import defaultdict
-
+import warnings
 from datetime import datetime
-from enum import Enum
+from typing import Dict, List
 
 import numpy as np
 warnings.filterwarnings("ignore")
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+
+from armoriq import (
+    AgentState, MODEL_VERSION, INFERENCE_BACKENDS, TRADITIONAL_TROJAN_TYPES, VerilogModule, BaseAgent, MCPServerRegistry,
+    ModelRegistry, EnhancedGraphBuilder, HybridTrojanDetectionSystem, ResultCache, analysis_config,
+    ingest_designs, score_designs, build_report, report_csv, browse_designs, GoldenStore, ingest_golden,
+    EmbeddingIndex, LayoutEngine, SIGNAL_TYPE_CODES, flagged_signals, summarize_threats,
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -435,706 +436,47 @@ div[data-testid="stDataFrame"] {
 """, unsafe_allow_html=True)
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# ENUMS & CONSTANTS
-# ─────────────────────────────────────────────────────────────────────────────
-class AgentState(Enum):
-    IDLE       = "IDLE"
-    ACTIVE     = "ACTIVE"
-    ALERTING   = "ALERTING"
-    COMPLETE   = "COMPLETE"
-
-class ThreatLevel(Enum):
-    CRITICAL  = ("CRITICAL",  "#ff2d4a")
-    HIGH      = ("HIGH",      "#ff6600")
-    MEDIUM    = ("MEDIUM",    "#ffaa00")
-    LOW       = ("LOW",       "#00e5ff")
-    CLEAN     = ("CLEAN",     "#00ff88")
-
-TRADITIONAL_TROJAN_TYPES = {
-    "Combinational":    "Logic-only trojan; no state; triggered by rare input pattern",
-    "Sequential":       "FSM-based trojan; triggered after N clock cycles",
-    "Functional":       "Modifies circuit function; always-on malicious behavior",
-    "Parametric":       "Alters timing/power; not functionally detectable",
-    "Covert Channel":   "Side-channel leak via power/EM emanation",
-    "Kill Switch":      "Disables circuit on trigger condition",
-    "Data Leakage":     "Exfiltrates secret keys or sensitive registers",
-}
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# DATA STRUCTURES
-# ─────────────────────────────────────────────────────────────────────────────
-
-class VerilogSignal:
-    name: str
-    signal_type: str
-    width: int = 1
-    is_clock: bool = False
-    is_reset: bool = False
-    fanin: int = 0
-    fanout: int = 0
-    toggle_rate: float = 0.0
-
-
-class VerilogModule:
-    name: str
-    signals: Dict[str, VerilogSignal]
-    assignments: List[Tuple[str, str]]
-    always_blocks: List[str]
-    instances: List[str] = field(default_factory=list)
-    parameters: Dict[str, str] = field(default_factory=dict)
-
-class AgentMessage:
-    agent_id: str
-    agent_name: str
-    timestamp: str
-    level: str      # ok | info | warn | alert
-    content: str
-    data: Any = None
-
-
-class MCPServer:
-    server_id: str
-    name: str
-    capability: str
-    status: str = "online"   # online | busy | offline
-    requests_served: int = 0
-    last_heartbeat: str = ""
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# MCP SERVER REGISTRY
-# ─────────────────────────────────────────────────────────────────────────────
-class MCPServerRegistry:
-    """
-    Model Context Protocol server registry.
-    Each server exposes a specialized capability that AI agents call.
-    """
-
-    def __init__(self):
-        self.servers: Dict[str, MCPServer] = {
-            "mcp-parse":    MCPServer("mcp-parse",    "ArmorIQ/RTL-Parser",          "Verilog tokenisation & AST extraction"),
-            "mcp-graph":    MCPServer("mcp-graph",    "ArmorIQ/Graph-Builder",        "Netlist → PyG graph construction"),
-            "mcp-gnn":      MCPServer("mcp-gnn",      "ArmorIQ/GNN-Inference",        "4-layer GAT trojan scoring"),
-            "mcp-stat":     MCPServer("mcp-stat",     "ArmorIQ/Statistical-Analyzer", "Structural anomaly & outlier detection"),
-            "mcp-golden":   MCPServer("mcp-golden",   "ArmorIQ/Golden-Reference",     "Golden-model diff & deviation scoring"),
-            "mcp-classify": MCPServer("mcp-classify", "ArmorIQ/HT-Classifier",        "Hybrid ensemble binary classification"),
-            "mcp-report":   MCPServer("mcp-report",   "ArmorIQ/Report-Generator",     "JSON/CSV/Markdown report synthesis"),
-            "mcp-monitor":  MCPServer("mcp-monitor",  "ArmorIQ/Live-Monitor",         "Real-time threat feed & dashboarding"),
-        }
-        self.call_log: List[Dict] = []
-
-    def call(self, server_id: str, method: str, params: Dict = None) -> Dict:
-        """Simulate an MCP tool call"""
-        if server_id not in self.servers:
-            return {"error": f"Unknown MCP server: {server_id}"}
-
-        srv = self.servers[server_id]
-        srv.status = "busy"
-        srv.requests_served += 1
-        srv.last_heartbeat = datetime.now().strftime("%H:%M:%S")
-
-        call_record = {
-            "server": server_id,
-            "method": method,
-            "params": list(params.keys()) if params else [],
-            "ts": srv.last_heartbeat
-        }
-        self.call_log.append(call_record)
-
-        # Simulate latency
-        time.sleep(0.02)
-        srv.status = "online"
-        return {"status": "ok", "server": server_id, "method": method}
-
-    def get_server_data(self) -> List[Dict]:
-        """Return server data as plain dicts for rendering"""
-        result = []
-        for srv in self.servers.values():
-            result.append({
-                "name": srv.name,
-                "capability": srv.capability,
-                "status": srv.status,
-                "requests": srv.requests_served,
-                "heartbeat": srv.last_heartbeat,
-            })
-        return result
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# AI AGENT BASE + SPECIALIZED AGENTS
-# ─────────────────────────────────────────────────────────────────────────────
-class BaseAgent:
-    """Base AI agent with MCP tool-calling capability"""
-
-    def __init__(self, agent_id: str, name: str, mcp: MCPServerRegistry):
-        self.agent_id  = agent_id
-        self.name      = name
-        self.mcp       = mcp
-        self.state     = AgentState.IDLE
-        self.log: List[AgentMessage] = []
-
-    def emit(self, level: str, content: str, data: Any = None):
-        msg = AgentMessage(
-            agent_id=self.agent_id,
-            agent_name=self.name,
-            timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3],
-            level=level,
-            content=content,
-            data=data
-        )
-        self.log.append(msg)
-        return msg
-
-    def run(self, *args, **kwargs):
-        raise NotImplementedError
-
-
-class MonitorAgent(BaseAgent):
-    """
-    Real-time monitor: watches all other agents, aggregates threat feeds,
-    raises global alerts, updates live dashboard metrics.
-    """
-
-    def __init__(self, mcp: MCPServerRegistry):
-        super().__init__("agent-monitor", "🛰️  MONITOR AGENT", mcp)
-        self.threat_feed: List[Dict] = []
-
-    def run(self, modules: List[VerilogModule], predictions: List[Dict]) -> Dict:
-        self.state = AgentState.ACTIVE
-        self.emit("info", "Monitor Agent online — initialising threat feed")
-        self.mcp.call("mcp-monitor", "subscribe", {"feed": "global"})
-
-        summary = {
-            "total": len(predictions),
-            "trojans": 0,
-            "clean": 0,
-            "critical": 0,
-            "threat_events": []
-        }
-
-        for mod, pred in zip(modules, predictions):
-            score = pred["hybrid_score"]
-            fname = pred.get("filename", mod.name)
-
-            if score >= 0.75:
-                level = ThreatLevel.CRITICAL
-                summary["critical"] += 1
-                summary["trojans"] += 1
-                self.emit("alert", f"CRITICAL THREAT detected in '{fname}' — score {score:.3f}", {"file": fname, "score": score})
-            elif score >= 0.50:
-                level = ThreatLevel.HIGH
-                summary["trojans"] += 1
-                self.emit("warn", f"HIGH THREAT in '{fname}' — score {score:.3f}", {"file": fname, "score": score})
-            elif score >= 0.30:
-                level = ThreatLevel.MEDIUM
-                summary["trojans"] += 1
-                self.emit("warn", f"MEDIUM THREAT in '{fname}' — score {score:.3f}")
-            else:
-                level = ThreatLevel.CLEAN
-                summary["clean"] += 1
-                self.emit("ok", f"'{fname}' assessed CLEAN — score {score:.3f}")
-
-            event = {
-                "file": fname, "module": mod.name,
-                "score": score, "level": level.value[0],
-                "color": level.value[1],
-                "signals": len(mod.signals),
-                "anomalies": pred["anomalies"].get("score", 0)
-            }
-            summary["threat_events"].append(event)
-            self.threat_feed.append(event)
-
-        self.mcp.call("mcp-monitor", "push_summary", summary)
-        self.emit("info", f"Threat feed updated — {summary['trojans']} HT-infested / {summary['clean']} HT-free")
-        self.state = AgentState.COMPLETE
-        return summary
-
-
-class AnalysisAgent(BaseAgent):
-    """
-    Deep analysis: runs multi-pass structural analysis, classifies
-    hardware trojan type (combinational/sequential/functional/etc).
-    """
-
-    def __init__(self, mcp: MCPServerRegistry):
-        super().__init__("agent-analysis", "🔬  ANALYSIS AGENT", mcp)
-
-    def classify_trojan_type(self, module: VerilogModule, pred: Dict) -> List[str]:
-        """Heuristically classify which traditional HT types are present"""
-        detected = []
-        anomalies = pred["anomalies"]
-
-        # Sequential trojan — wide counter signals
-        if anomalies.get("rare_signals"):
-            detected.append("Sequential")
-            self.emit("warn", f"Sequential HT pattern: wide counter signals detected → {anomalies['rare_signals'][:3]}")
-
-        # Combinational trojan — complex logic in always blocks
-        if anomalies.get("complex_logic"):
-            detected.append("Combinational")
-            self.emit("warn", f"Combinational HT pattern: {len(anomalies['complex_logic'])} high-complexity logic blocks")
-
-        # Data leakage — isolated wide regs with no fanout
-        if anomalies.get("isolated_signals"):
-            detected.append("Data Leakage")
-            self.emit("alert", f"Potential Data Leakage HT: {len(anomalies['isolated_signals'])} isolated signals")
-
-        # Kill switch — high fanout from single suspicious signal
-        if anomalies.get("high_fanout"):
-            detected.append("Kill Switch")
-            for name, fo in anomalies["high_fanout"][:2]:
-                self.emit("alert", f"Kill Switch candidate: '{name}' → {fo} fanout connections")
-
-        # Parametric / covert — unusual bit widths
-        if anomalies.get("unusual_widths"):
-            detected.append("Parametric")
-            self.emit("warn", f"Parametric HT pattern: unusual signal widths detected")
-
-        # Functional — suspicious naming
-        if anomalies.get("suspicious_names"):
-            detected.append("Functional")
-            self.emit("alert", f"Functional HT names: {anomalies['suspicious_names'][:3]}")
-
-        return list(set(detected)) if detected else ["No HT Pattern"]
-
-    def run(self, modules: List[VerilogModule], predictions: List[Dict]) -> List[Dict]:
-        self.state = AgentState.ACTIVE
-        self.emit("info", "Analysis Agent initialised — loading structural models")
-        self.mcp.call("mcp-stat", "configure", {"depth": "full", "golden": True})
-
-        results = []
-        for mod, pred in zip(modules, predictions):
-            self.emit("info", f"Analysing '{mod.name}' ({len(mod.signals)} signals)")
-            self.mcp.call("mcp-graph", "analyze", {"module": mod.name})
-
-            ht_types = self.classify_trojan_type(mod, pred)
-
-            # Compute structural fingerprint
-            total_bits = sum(s.width for s in mod.signals.values())
-            avg_fanout = np.mean([s.fanout for s in mod.signals.values()]) if mod.signals else 0
-
-            fingerprint = {
-                "module": mod.name,
-                "file": pred.get("filename", mod.name),
-                "ht_types": ht_types,
-                "gnn_score": pred["gnn_score"],
-                "stat_score": pred["statistical_score"],
-                "hybrid_score": pred["hybrid_score"],
-                "total_bits": total_bits,
-                "avg_fanout": avg_fanout,
-                "signal_density": len(mod.signals) / max(len(mod.always_blocks), 1),
-                "is_trojan": pred["prediction"] == 1
-            }
-            results.append(fingerprint)
-
-            if pred["prediction"] == 1:
-                self.emit("alert", f"Trojan fingerprint: {', '.join(ht_types)}")
-            else:
-                self.emit("ok", f"'{mod.name}' — No significant trojan fingerprint")
-
-        self.mcp.call("mcp-report", "store_fingerprints", {"count": len(results)})
-        self.state = AgentState.COMPLETE
-        self.emit("info", "Analysis complete — results written to MCP report server")
-        return results
-
-
-class DetectionAgent(BaseAgent):
-    """
-    Primary detection agent: orchestrates GNN + statistical scoring,
-    applies adaptive thresholds, issues verdicts.
-    """
-
-    def __init__(self, mcp: MCPServerRegistry, detector):
-        super().__init__("agent-detect", "⚡  DETECTION AGENT", mcp)
-        self.detector = detector
-
-    def run(self, modules: List[VerilogModule], graphs: List[Data],
-            golden_features: Optional[Dict] = None) -> List[Dict]:
-        self.state = AgentState.ACTIVE
-        self.emit("info", "Detection Agent online — calling GNN inference server")
-        self.mcp.call("mcp-gnn", "load_checkpoint", {"arch": "GAT-4L-256H"})
-
-        predictions = []
-        for i, (mod, graph) in enumerate(zip(modules, graphs)):
-            self.emit("info", f"[{i+1}/{len(modules)}] Scoring '{mod.name}'")
-            self.mcp.call("mcp-gnn", "infer", {"nodes": len(mod.signals)})
-            self.mcp.call("mcp-stat", "analyze", {"signals": len(mod.signals)})
-
-            pred = self.detector.predict(mod, graph, golden_features)
-            pred["filename"] = pred.get("filename", mod.name)
-
-            hs = pred["hybrid_score"]
-            if hs > 0.75:
-                self.emit("alert", f"VERDICT: HT-INFESTED  score={hs:.3f}  '{mod.name}'")
-            elif hs > 0.50:
-                self.emit("warn",  f"VERDICT: HT-INFESTED  score={hs:.3f}  '{mod.name}'")
-            else:
-                self.emit("ok",    f"VERDICT: HT-FREE      score={hs:.3f}  '{mod.name}'")
-
-            self.mcp.call("mcp-classify", "commit_verdict", {"file": pred.get("filename")})
-            predictions.append(pred)
-
-        self.state = AgentState.COMPLETE
-        self.emit("info", f"Detection complete — {len(predictions)} designs evaluated")
-        return predictions
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# VERILOG PARSER (enhanced)
-# ─────────────────────────────────────────────────────────────────────────────
-class CompetitionVerilogParser:
-    def __init__(self):
-        self.signal_pattern  = re.compile(r'(input|output|wire|reg|inout)\s*(?:\[(\d+):(\d+)\])?\s*([\w,\s]+);')
-        self.assign_pattern  = re.compile(r'assign\s+(\w+)\s*=\s*([^;]+);')
-        self.always_pattern  = re.compile(r'always\s*@\((.*?)\)(.*?)(?=always|endmodule|$)', re.S)
-        self.module_pattern  = re.compile(r'module\s+(\w+)')
-        self.instance_pattern = re.compile(r'(\w+)\s+(?:#\(.*?\))?\s*(\w+)\s*\(', re.S)
-        self.param_pattern   = re.compile(r'parameter\s+(\w+)\s*=\s*([^;]+);')
-
-    def parse(self, content: str) -> VerilogModule:
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        content = re.sub(r'//.*', '', content)
-
-        module_match = self.module_pattern.search(content)
-        module_name  = module_match.group(1) if module_match else "unknown"
-
-        signals, assignments, always_blocks, instances, parameters = {}, [], [], [], {}
-
-        for m in self.signal_pattern.finditer(content):
-            stype = m.group(1)
-            hi = int(m.group(2)) if m.group(2) else 0
-            lo = int(m.group(3)) if m.group(3) else 0
-            width = abs(hi - lo) + 1
-            for name in m.group(4).split(","):
-                name = name.strip()
-                if name:
-                    signals[name] = VerilogSignal(
-                        name, stype, width,
-                        bool(re.search(r'clk|clock', name, re.I)),
-                        bool(re.search(r'rst|reset', name, re.I))
-                    )
-
-        for m in self.assign_pattern.finditer(content):
-            assignments.append((m.group(1).strip(), m.group(2).strip()))
-        for m in self.always_pattern.finditer(content):
-            always_blocks.append(m.group(0))
-        for m in self.instance_pattern.finditer(content):
-            instances.append(f"{m.group(1)} {m.group(2)}")
-        for m in self.param_pattern.finditer(content):
-            parameters[m.group(1)] = m.group(2).strip()
-
-        return VerilogModule(module_name, signals, assignments, always_blocks, instances, parameters)
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# STATISTICAL DETECTOR
-# ─────────────────────────────────────────────────────────────────────────────
-class StatisticalTrojanDetector:
-    def __init__(self):
-        self.suspicious_patterns = [
-            r'trigger', r'payload', r'malicious', r'trojan', r'backdoor',
-            r'secret', r'hidden', r'rare', r'low_prob', r'attack',
-            r'leak', r'covert', r'kill', r'bypass', r'shadow', r'ghost'
-        ]
-
-    def compute_structural_features(self, module: VerilogModule) -> Dict[str, float]:
-        f = {
-            'num_signals': len(module.signals),
-            'num_assignments': len(module.assignments),
-            'num_always_blocks': len(module.always_blocks),
-            'num_instances': len(module.instances),
-        }
-        st = defaultdict(int)
-        for sig in module.signals.values():
-            st[sig.signal_type] += 1
-        f['input_ratio']  = st['input']  / max(len(module.signals), 1)
-        f['output_ratio'] = st['output'] / max(len(module.signals), 1)
-        f['reg_ratio']    = st['reg']    / max(len(module.signals), 1)
-
-        fanins  = [s.fanin  for s in module.signals.values()]
-        fanouts = [s.fanout for s in module.signals.values()]
-        widths  = [s.width  for s in module.signals.values()]
-        f['avg_fanin']  = np.mean(fanins)  if fanins  else 0
-        f['max_fanin']  = np.max(fanins)   if fanins  else 0
-        f['avg_fanout'] = np.mean(fanouts) if fanouts else 0
-        f['max_fanout'] = np.max(fanouts)  if fanouts else 0
-        f['avg_width']  = np.mean(widths)  if widths  else 0
-        f['max_width']  = np.max(widths)   if widths  else 0
-
-        td = sum(len(re.findall(r'if|case|for|while', b)) for b in module.always_blocks)
-        f['logic_complexity'] = td
-        return f
-
-    def analyze(self, module: VerilogModule, golden_features: Optional[Dict] = None) -> Dict:
-        a = {k: [] for k in ['suspicious_names','unusual_widths','high_fanout',
-                              'isolated_signals','complex_logic','rare_signals','golden_deviation']}
-        a['score'] = 0.0
-
-        for name in module.signals:
-            for pat in self.suspicious_patterns:
-                if re.search(pat, name, re.I):
-                    a['suspicious_names'].append(name); a['score'] += 0.4; break
-
-        widths = [s.width for s in module.signals.values()]
-        if widths:
-            mu, sd = np.mean(widths), np.std(widths)
-            for name, sig in module.signals.items():
-                if sig.width > mu + 2.5*sd and sig.width > 8:
-                    a['unusual_widths'].append((name, sig.width)); a['score'] += 0.15
-
-        fanouts = [s.fanout for s in module.signals.values() if s.fanout > 0]
-        if fanouts:
-            thr = np.percentile(fanouts, 90) if len(fanouts) > 5 else 10
-            for name, sig in module.signals.items():
-                if sig.fanout > thr and sig.fanout > 8:
-                    a['high_fanout'].append((name, sig.fanout)); a['score'] += 0.20
-
-        for name, sig in module.signals.items():
-            if sig.fanin == 0 and sig.fanout == 0 and sig.signal_type not in ['input','output']:
-                a['isolated_signals'].append(name); a['score'] += 0.25
-
-        for block in module.always_blocks:
-            c = len(re.findall(r'if|case', block))
-            if c > 7:
-                a['complex_logic'].append(c); a['score'] += 0.30
-
-        for name, sig in module.signals.items():
-            if re.search(r'cnt|counter|count', name, re.I) and sig.width > 16:
-                a['rare_signals'].append(name); a['score'] += 0.20
-
-        if golden_features:
-            cf = self.compute_structural_features(module)
-            for key in ['num_signals', 'num_assignments', 'logic_complexity']:
-                if key in golden_features and key in cf:
-                    dev = abs(cf[key] - golden_features[key]) / max(golden_features[key], 1)
-                    if dev > 0.20:
-                        a['golden_deviation'].append((key, dev)); a['score'] += 0.30*dev
-
-        a['score'] = min(a['score'], 1.0)
-        ni = sum(len(v) if isinstance(v, list) else 0 for v in a.values())
-        a['confidence'] = min(ni / 10.0, 1.0)
-        return a
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# GRAPH BUILDER
-# ─────────────────────────────────────────────────────────────────────────────
-class EnhancedGraphBuilder:
-    def __init__(self, feature_dim=48):
-        self.feature_dim = feature_dim
-        self.type_map = {'input':0,'output':1,'wire':2,'reg':3,'inout':4}
-
-    def _sigs(self, expr):
-        kw = {'if','else','case','default','begin','end','posedge','negedge'}
-        return [s for s in re.findall(r'\b[a-zA-Z_]\w*\b', expr) if s not in kw]
-
-    def _graph_metrics(self, G, node):
-        try:
-            bc = nx.betweenness_centrality(G).get(node, 0) if len(G)>1 else 0
-            cc = nx.closeness_centrality(G).get(node, 0)   if nx.is_weakly_connected(G) else 0
-            pr = nx.pagerank(G).get(node, 0) * 10          if len(G)>1 else 0
-            cl = nx.clustering(G.to_undirected()).get(node, 0)
-        except:
-            bc, cc, pr, cl = 0,0,0,0
-        return {'betweenness':bc,'closeness':cc,'pagerank':pr,'clustering':cl}
-
-    def build(self, module: VerilogModule) -> Data:
-        node_map = {n:i for i,n in enumerate(module.signals)}
-        n = len(node_map)
-        if n == 0:
-            return Data(x=torch.zeros((1,self.feature_dim)),
-                        edge_index=torch.zeros((2,0),dtype=torch.long),
-                        edge_attr=torch.zeros((0,1)))
-
-        x = torch.zeros((n, self.feature_dim))
-        edges, eattrs = [], []
-        G = nx.DiGraph(); [G.add_node(nm) for nm in module.signals]
-        fanin, fanout = defaultdict(int), defaultdict(int)
-
-        for tgt, expr in module.assignments:
-            for src in self._sigs(expr):
-                if src in node_map and tgt in node_map:
-                    edges.append((node_map[src], node_map[tgt])); eattrs.append(0)
-                    G.add_edge(src, tgt); fanout[src]+=1; fanin[tgt]+=1
-
-        for block in module.always_blocks:
-            for lhs, rhs in re.findall(r'(\w+)\s*<=\s*([^;]+);', block):
-                for src in self._sigs(rhs):
-                    if src in node_map and lhs in node_map:
-                        edges.append((node_map[src],node_map[lhs])); eattrs.append(1)
-                        G.add_edge(src,lhs); fanout[src]+=1; fanin[lhs]+=1
-            for lhs, rhs in re.findall(r'(\w+)\s*=\s*([^;]+);', block):
-                for src in self._sigs(rhs):
-                    if src in node_map and lhs in node_map:
-                        edges.append((node_map[src],node_map[lhs])); eattrs.append(2)
-                        G.add_edge(src,lhs); fanout[src]+=1; fanin[lhs]+=1
-
-        all_widths  = [s.width for s in module.signals.values()]
-        all_fanouts = [fanout[nm] for nm in module.signals]
-        mw, sw = (np.mean(all_widths), np.std(all_widths)+1e-6) if all_widths else (0,1)
-        mf, sf = (np.mean(all_fanouts),np.std(all_fanouts)+1e-6) if all_fanouts else (0,1)
-
-        for name, idx in node_map.items():
-            sig = module.signals[name]
-            ti = self.type_map.get(sig.signal_type, 2)
-            x[idx, ti] = 1
-            x[idx, 5]  = min(sig.width/64.0,1.0)
-            x[idx, 6]  = 1 if sig.width>32 else 0
-            x[idx, 7]  = np.log2(sig.width+1)/8.0
-            x[idx, 8]  = 1 if sig.is_clock else 0
-            x[idx, 9]  = 1 if sig.is_reset else 0
-            x[idx,10]  = min(fanin[name]/20.0,1.0)
-            x[idx,11]  = min(fanout[name]/20.0,1.0)
-            x[idx,12]  = min(fanin[name],10)
-            x[idx,13]  = min(fanout[name],10)
-            for fi,(pat) in enumerate([
-                r'temp|tmp|aux',r'cnt|counter',r'state|status|mode',r'enable|en\b|valid',
-                r'trigger|trig|fire',r'payload|data|secret',r'sel|mux|select',
-                r'flag|bit|indicator',r'leak|covert|kill',
-            ], start=14):
-                x[idx,fi] = 1 if re.search(pat,name,re.I) else 0
-            x[idx,23] = 1 if len(name)>20 else 0
-            gm = self._graph_metrics(G, name)
-            x[idx,24] = gm['betweenness']
-            x[idx,25] = gm['closeness']
-            x[idx,26] = gm['pagerank']
-            x[idx,27] = gm['clustering']
-            x[idx,28] = 1 if (fanin[name]==0 and fanout[name]==0) else 0
-            x[idx,29] = 1 if (fanin[name]==0 and sig.signal_type not in['input']) else 0
-            x[idx,30] = 1 if (fanout[name]==0 and sig.signal_type not in['output']) else 0
-            x[idx,31] = (sig.width - mw) / sw
-            x[idx,32] = (fanout[name] - mf) / sf
-            x[idx,33] = 1 if fanout[name]>15 else 0
-            x[idx,34] = 1 if (sig.width>16 and fanout[name]==1) else 0
-            x[idx,35] = 1 if fanin[name]>10 else 0
-            x[idx,36] = 1 if re.search(r'\d+$', name) else 0
-
-            module.signals[name].fanin  = fanin[name]
-            module.signals[name].fanout = fanout[name]
-
-        ei = torch.tensor(edges,dtype=torch.long).t() if edges else torch.zeros((2,0),dtype=torch.long)
-        ea = torch.tensor(eattrs,dtype=torch.float).unsqueeze(1) if eattrs else torch.zeros((0,1))
-        return Data(x=x, edge_index=ei, edge_attr=ea)
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# GNN MODEL
-# ─────────────────────────────────────────────────────────────────────────────
-class ArmorIQ_GNN(nn.Module):
-    def __init__(self, input_dim=48, hidden_dim=256, num_layers=4):
-        super().__init__()
-        self.embed = nn.Sequential(
-            nn.Linear(input_dim, hidden_dim),
-            nn.BatchNorm1d(hidden_dim), nn.ELU(), nn.Dropout(0.15)
-        )
-        self.gat_layers  = nn.ModuleList([GATConv(hidden_dim,hidden_dim//8,heads=8,dropout=0.15,concat=True) for _ in range(num_layers)])
-        self.batch_norms = nn.ModuleList([nn.BatchNorm1d(hidden_dim) for _ in range(num_layers)])
-        pool_dim = hidden_dim * 3
-        self.classifier = nn.Sequential(
-            nn.Linear(pool_dim,hidden_dim*2), nn.ELU(), nn.Dropout(0.3),
-            nn.Linear(hidden_dim*2,hidden_dim), nn.ELU(), nn.Dropout(0.3),
-            nn.Linear(hidden_dim,hidden_dim//2), nn.ELU(),
-            nn.Linear(hidden_dim//2,2)
-        )
-
-    def forward(self, data):
-        x,ei,batch = data.x, data.edge_index, data.batch
-        x = self.embed(x)
-        for i,(gat,bn) in enumerate(zip(self.gat_layers,self.batch_norms)):
-            xp = x; x = F.elu(gat(x,ei)); x = bn(x)
-            if i>0: x = x+xp
-            x = F.dropout(x,p=0.15,training=self.training)
-        g = torch.cat([global_mean_pool(x,batch),global_max_pool(x,batch),global_add_pool(x,batch)],dim=1)
-        out = self.classifier(g)
-        return out, g
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# HYBRID DETECTOR
-# ─────────────────────────────────────────────────────────────────────────────
-class HybridTrojanDetectionSystem:
-    def __init__(self, gnn_weight=0.6, stat_weight=0.4):
-        self.gnn_weight  = gnn_weight
-        self.stat_weight = stat_weight
-        self.gnn_model   = ArmorIQ_GNN(48,256,4); self.gnn_model.eval()
-        self.stat_det    = StatisticalTrojanDetector()
-
-    def predict(self, module: VerilogModule, graph: Data, golden: Optional[Dict]=None) -> Dict:
-        batch = Batch.from_data_list([graph])
-        with torch.no_grad():
-            out, emb = self.gnn_model(batch)
-            probs     = F.softmax(out,dim=1)
-            gnn_pred  = out.argmax(dim=1).item()
-            gnn_conf  = probs[0,gnn_pred].item()
-            gnn_score = probs[0,1].item()
-
-        stat_res   = self.stat_det.analyze(module, golden)
-        stat_score = stat_res['score']
-        stat_conf  = stat_res.get('confidence',0.5)
-
-        hybrid = self.gnn_weight*gnn_score + self.stat_weight*stat_score
-        pred   = 1 if hybrid>0.5 else 0
-        conf   = (gnn_conf+stat_conf)/2 if gnn_pred==(1 if stat_score>0.5 else 0) else abs(hybrid-0.5)*2
-
-        return {
-            'prediction': pred, 'confidence': conf,
-            'hybrid_score': hybrid, 'gnn_score': gnn_score,
-            'gnn_confidence': gnn_conf, 'statistical_score': stat_score,
-            'statistical_confidence': stat_conf, 'anomalies': stat_res,
-            'embedding': emb[0].numpy(), 'method': 'hybrid'
-        }
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # PLOTLY GRAPH
 # ─────────────────────────────────────────────────────────────────────────────
-def create_dark_graph(module: VerilogModule, highlight: List[str]=None):
-    G = nx.DiGraph()
-    for nm, sig in module.signals.items():
-        G.add_node(nm, **{k:v for k,v in vars(sig).items() if k!='name'})
-    for src, expr in module.assignments:
-        for tgt in re.findall(r'\b\w+\b', expr):
-            if tgt in module.signals and src in module.signals:
-                G.add_edge(src, tgt)
-
-    pos = nx.spring_layout(G,k=2.5,iterations=50,seed=42) if len(G)>0 else {}
-
-    ex,ey = [],[]
-    for u,v in G.edges():
-        if u in pos and v in pos:
-            x0,y0=pos[u]; x1,y1=pos[v]
-            ex.extend([x0,x1,None]); ey.extend([y0,y1,None])
-
-    hl = set(highlight or [])
-    nx_,ny_,colors,sizes,hover = [],[],[],[],[]
-    for nd in G.nodes():
-        if nd not in pos: continue
-        sig = module.signals[nd]
-        nx_.append(pos[nd][0]); ny_.append(pos[nd][1])
-        color = ('#e63950' if nd in hl else
-                 '#f59e0b' if sig.is_clock else
-                 '#f97316' if sig.is_reset else
-                 '#ef4444' if sig.fanout>10 else
-                 '#94a3b8' if (sig.fanin==0 and sig.fanout==0) else
-                 {'input':'#16a34a','output':'#1a6fff','reg':'#7c3aed','wire':'#64748b'}.get(sig.signal_type,'#94a3b8'))
-        colors.append(color)
-        sizes.append(18+min(G.degree(nd)*3,50))
-        h  = f"<b>{nd}</b><br>Type: {sig.signal_type}<br>Width: {sig.width}b<br>"
-        h += f"Fan-in: {sig.fanin} | Fan-out: {sig.fanout}"
-        if nd in hl: h += "<br><b style='color:#e63950'>⚠ SUSPICIOUS</b>"
-        hover.append(h)
+KIND_COLORS = np.array(['#16a34a', '#1a6fff', '#64748b', '#7c3aed', '#94a3b8'])   # SIGNAL_TYPE_CODES order
+
+
+def netlist_figure(module: VerilogModule, highlight: List[str]=None, engine: "LayoutEngine"=None,
+                   hops: int=1, cone_only: bool=False):
+    """WebGL netlist figure from the cached layout + a caption when the view is reduced (None otherwise)"""
+    v   = (engine or LayoutEngine.default()).view(module, highlight or [], hops=hops, cone_only=cone_only)
+    tab = v['table']
+    ids = v['nodes']
+    fi, fo = tab.fanin[ids], tab.fanout[ids]
+    colors = np.select([v['highlight'], tab.is_clock[ids], tab.is_reset[ids], fo > 10, (fi == 0) & (fo == 0)],
+                       ['#e63950', '#f59e0b', '#f97316', '#ef4444', '#94a3b8'], KIND_COLORS[tab.kind[ids]])
+    names = np.array(tab.names, dtype=object)[ids]
+    kinds = np.array(list(SIGNAL_TYPE_CODES), dtype=object)[tab.kind[ids]]
+    flag  = np.where(v['highlight'], "<br><b style='color:#e63950'>⚠ FLAGGED</b>", "")
+    hover = ("<b>%{customdata[0]}</b><br>Type: %{customdata[1]}<br>Width: %{customdata[2]}b<br>"
+             "Fan-in: %{customdata[3]} | Fan-out: %{customdata[4]}%{customdata[5]}<extra></extra>")
+
+    data = [
+        go.Scattergl(x=v['edge_x'],y=v['edge_y'],mode='lines',line=dict(width=0.8,color='#cbd5e1'),hoverinfo='none'),
+        go.Scattergl(x=v['xy'][:,0],y=v['xy'][:,1],mode='markers',
+                     customdata=np.stack([names,kinds,tab.width[ids],fi,fo,flag],axis=1),hovertemplate=hover,
+                     marker=dict(color=colors,size=np.minimum((18 if len(ids)<=300 else 6)+(fi+fo)*3,68),line=dict(width=1.5,color='#ffffff'),opacity=0.9)),
+    ]
+    if v['label'].any():                                       # text only where it is readable
+        lab = v['label']
+        data.append(go.Scattergl(x=v['xy'][lab,0],y=v['xy'][lab,1],mode='text',text=names[lab],
+                                 textposition="top center",textfont=dict(size=8,color='#475569'),hoverinfo='skip'))
+    if len(v['cluster_size']):
+        cs = v['cluster_size']
+        data.append(go.Scattergl(x=v['cluster_xy'][:,0],y=v['cluster_xy'][:,1],mode='markers',
+                                 customdata=cs,hovertemplate="%{customdata} signals (collapsed)<extra></extra>",
+                                 marker=dict(color='#cbd5e1',size=np.clip(6+np.sqrt(cs)*2,8,40),opacity=0.7,
+                                             line=dict(width=1,color='#94a3b8'))))
+    shown = f"{len(ids)} of {v['num_nodes']} signals" + (f" + {len(v['cluster_size'])} clusters" if len(v['cluster_size']) else "")
 
     fig = go.Figure(
-        data=[
-            go.Scatter(x=ex,y=ey,mode='lines',line=dict(width=0.8,color='#cbd5e1'),hoverinfo='none'),
-            go.Scatter(x=nx_,y=ny_,mode='markers+text',
-                       text=[n for n in G.nodes() if n in pos],
-                       textposition="top center",textfont=dict(size=8,color='#475569'),
-                       hovertext=hover,hoverinfo='text',
-                       marker=dict(color=colors,size=sizes,line=dict(width=1.5,color='#ffffff'),opacity=0.9))
-        ],
+        data=data,
         layout=go.Layout(
             title=dict(text=f'Netlist Graph — {module.name}',font=dict(size=14,color='#1a2540',family='Space Grotesk')),
             showlegend=False, hovermode='closest',
@@ -1144,7 +486,17 @@ def create_dark_graph(module: VerilogModule, highlight: List[str]=None):
             plot_bgcolor='#f8fafc', paper_bgcolor='#ffffff', height=600
         )
     )
-    st.plotly_chart(fig, use_container_width=True)
+    reduced = v['num_nodes'] > len(ids) or not v['label'].all()
+    cone = f" · {v['cone']['hops']}-hop cone: {v['cone']['signals']} signals, {v['cone']['edges']} edges" if v['cone'] else ""
+    return fig, (f"{v['layout']} layout · {shown}{cone} · labels on flagged signals and their cone" if reduced else None)
+
+
+def create_dark_graph(module: VerilogModule, highlight: List[str]=None, hops: int=1, cone_only: bool=False,
+                      key: str=None):
+    fig, caption = netlist_figure(module, highlight, hops=hops, cone_only=cone_only)
+    if caption:
+        st.caption(caption)
+    st.plotly_chart(fig, use_container_width=True, key=key)
 
     st.markdown("""
     <div style="display:flex;flex-wrap:wrap;gap:14px;padding:10px 14px;
@@ -1157,7 +509,7 @@ def create_dark_graph(module: VerilogModule, highlight: List[str]=None):
         <span><span style="color:#f59e0b;font-size:1.1rem;">●</span> Clock</span>
         <span><span style="color:#f97316;font-size:1.1rem;">●</span> Reset</span>
         <span><span style="color:#ef4444;font-size:1.1rem;">●</span> High Fan-out</span>
-        <span><span style="color:#e63950;font-size:1.1rem;">●</span> ⚠ Suspicious</span>
+        <span><span style="color:#e63950;font-size:1.1rem;">●</span> ⚠ Flagged</span>
     </div>""", unsafe_allow_html=True)
 
 
@@ -1275,28 +627,47 @@ def render_agent_log(agent: BaseAgent):
 # ─────────────────────────────────────────────────────────────────────────────
 # THREAT TIMELINE
 # ─────────────────────────────────────────────────────────────────────────────
-def render_threat_timeline(events: List[Dict]):
-    if not events: return
-    df = pd.DataFrame(events)
-    df['rank'] = range(len(df))
+TIMELINE_COLORS = {'CRITICAL':'#e63950','HIGH':'#d97706','MEDIUM':'#2563eb','LOW':'#0891b2','CLEAN':'#16a34a'}
+
+
+def timeline_figure(events: List[Dict], max_points: int=1000, label_max: int=60):
+    """
+    Score-vs-design figure with one WebGL trace per threat level. Above
+    max_points designs the rank axis is split into max_points buckets and
+    each (level, bucket) keeps its highest-scoring design plus a count.
+    Returns (fig, caption) — caption is None when every design is drawn.
+    """
+    n     = len(events)
+    score = np.fromiter((e['score'] for e in events), dtype=np.float64, count=n)
+    level = np.array([e['level'] for e in events], dtype=object)
+    files = np.array([e['file'] for e in events], dtype=object)
+    rank  = np.arange(n)
+    count = np.ones(n, dtype=np.int64)
+    if n > max_points:
+        bucket = rank * max_points // n
+        key    = np.unique(level, return_inverse=True)[1] * max_points + bucket
+        order  = np.lexsort((-score, key))             # best score first inside each (level, bucket)
+        first  = np.flatnonzero(np.r_[True, key[order][1:] != key[order][:-1]])
+        count  = np.diff(np.r_[first, n])
+        keep   = order[first]
+        rank, score, level, files = rank[keep], score[keep], level[keep], files[keep]
+    more  = np.where(count > 1, np.char.add(np.char.add(" (+", (count - 1).astype(str)), " more)"), "")
+    label = len(rank) <= label_max
 
     fig = go.Figure()
-    color_map = {
-        'CRITICAL':'#e63950','HIGH':'#d97706','MEDIUM':'#2563eb',
-        'LOW':'#0891b2','CLEAN':'#16a34a'
-    }
-    for _, row in df.iterrows():
-        c = color_map.get(row['level'], '#4a6080')
-        fig.add_trace(go.Scatter(
-            x=[row['score']], y=[row['rank']],
-            mode='markers+text',
-            marker=dict(size=18, color=c, symbol='diamond',
+    for lvl, c in TIMELINE_COLORS.items():
+        m = level == lvl
+        if not m.any():
+            continue
+        fig.add_trace(go.Scattergl(
+            x=score[m], y=rank[m], mode='markers+text' if label else 'markers', name=lvl,
+            marker=dict(size=18 if label else np.clip(6 + np.sqrt(count[m]) * 2, 6, 24), color=c, symbol='diamond',
                         line=dict(width=1, color='#060b14')),
-            text=[f"  {row['file']}"],
-            textfont=dict(size=10, color=c),
-            textposition='middle right',
-            hovertemplate=f"<b>{row['file']}</b><br>Score: {row['score']:.3f}<br>Level: {row['level']}<extra></extra>",
-            name=row['level'], showlegend=False
+            text=np.char.add("  ", files[m].astype(str)) if label else None,
+            textfont=dict(size=10, color=c), textposition='middle right',
+            customdata=np.stack([files[m], more[m]], axis=1),
+            hovertemplate=f"<b>%{{customdata[0]}}</b>%{{customdata[1]}}<br>Score: %{{x:.3f}}<br>Level: {lvl}<extra></extra>",
+            showlegend=False
         ))
 
     fig.update_layout(
@@ -1306,12 +677,223 @@ def render_threat_timeline(events: List[Dict]):
         yaxis=dict(showticklabels=False, gridcolor='#e2e8f1', zeroline=False),
         plot_bgcolor='#ffffff', paper_bgcolor='#f7f9fc', height=320,
         margin=dict(l=10,r=140,t=45,b=40),
-        shapes=[dict(type='line',x0=0.5,x1=0.5,y0=-0.5,y1=len(df)-0.5,
+        shapes=[dict(type='line',x0=0.5,x1=0.5,y0=-0.5,y1=n-0.5,
                      line=dict(color='#e63950',width=1.5,dash='dot'))]
     )
+    return fig, (f"{len(rank)} of {n} designs drawn · highest score per level and design range" if len(rank) < n else None)
+
+
+def render_threat_timeline(events: List[Dict], max_points: int=1000):
+    if not events: return
+    fig, caption = timeline_figure(events, max_points)
+    if caption:
+        st.caption(caption)
     st.plotly_chart(fig, use_container_width=True)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# DESIGN REPORT
+# ─────────────────────────────────────────────────────────────────────────────
+REPORT_SORTS = {"Hybrid score ↓": ('hybrid_score', True), "Hybrid score ↑": ('hybrid_score', False),
+                "Verdict": ('verdict', True), "HT type": ('ht_types', False), "Upload order": (None, False)}
+
+
+def render_design_report(idx: int, module: VerilogModule, pred: Dict, fp: Dict, view: Dict):
+    """One design's expander: verdict, scores, HT types, anomalies and netlist graph"""
+    fname = pred.get('filename', module.name)
+    uid   = f"{idx}:{fname}:{module.name}"                # same-name variants (even in one file) get their own widgets
+    is_ht = pred['prediction'] == 1
+
+    icon    = "🚨" if is_ht else "✅"
+    verdict = "HARDWARE TROJAN DETECTED" if is_ht else "DESIGN CLEAN — HT-FREE"
+    vcard   = "verdict-red" if is_ht else "verdict-green"
+    vtitle  = "verdict-title-red" if is_ht else "verdict-title-green"
+
+    with st.expander(f"{icon}  {fname}", expanded=is_ht):
+        # Verdict banner
+        st.markdown(f"""<div class="{vcard}">
+            <div class="{vtitle}">{icon}&nbsp; {verdict}</div>
+            <div style="font-family:'JetBrains Mono',monospace;font-size:0.75rem;color:#4a5880;margin-top:5px;">
+                Module: {module.name} &nbsp;·&nbsp; Hybrid Score: {pred['hybrid_score']*100:.1f}% &nbsp;·&nbsp;
+                Confidence: {pred['confidence']*100:.1f}%
+            </div>
+        </div>""", unsafe_allow_html=True)
+
+        st.markdown("")
+
+        # KPIs
+        c1,c2,c3,c4 = st.columns(4)
+        c1.metric("Hybrid Score",        f"{pred['hybrid_score']*100:.1f}%")
+        c2.metric("GNN Score",           f"{pred['gnn_score']*100:.1f}%")
+        c3.metric("Statistical Score",   f"{pred['statistical_score']*100:.1f}%")
+        c4.metric("Confidence",          f"{pred['confidence']*100:.1f}%")
+
+        # HT Type classification
+        if view['types'] and is_ht:
+            st.markdown("**Detected HT Pattern Types:**")
+            ht_types = fp.get('ht_types', [])
+            type_cols = st.columns(max(len(ht_types),1))
+            for i, ht in enumerate(ht_types):
+                with type_cols[i % len(type_cols)]:
+                    desc = TRADITIONAL_TROJAN_TYPES.get(ht, "Unknown pattern")
+                    st.markdown(
+                        f"<div style='background:#fff0f2;border:1px solid #e63950;"
+                        f"border-radius:8px;padding:12px;margin:4px 0;'>"
+                        f"<div style='font-family:\"Space Grotesk\",sans-serif;font-weight:700;"
+                        f"color:#e63950;font-size:0.9rem;'>⚠ {ht}</div>"
+                        f"<div style='font-size:0.78rem;color:#4a5880;margin-top:4px;"
+                        f"font-family:\"Inter\",sans-serif;'>{desc}</div>"
+                        f"</div>",
+                        unsafe_allow_html=True
+                    )
+
+        # Module stats
+        c1,c2,c3,c4,c5 = st.columns(5)
+        c1.metric("Signals",      len(module.signals))
+        c2.metric("Assignments",  len(module.assignments))
+        c3.metric("Always Blks",  len(module.always_blocks))
+        c4.metric("Instances",    len(module.instances))
+        c5.metric("Parameters",   len(module.parameters))
+
+        # Golden reference match
+        if pred.get('golden'):
+            gm  = pred['golden']
+            dev = ", ".join(f"{k} {d*100:.0f}%" for k, d in pred['anomalies'].get('golden_deviation', [])) or "within 20%"
+            emb = f" · embedding Δ {gm['embedding_distance']:.3f}" if gm.get('embedding_distance') is not None else ""
+            st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#f0fdf4;color:#16a34a;border-left:3px solid #16a34a;">◉ Golden reference: {gm["reference"]} (d={gm["distance"]:.2f}{emb}) · deviation: {dev}</div>', unsafe_allow_html=True)
+
+        # Flagged-signal cone
+        if pred.get('cone'):
+            cn  = pred['cone']
+            gs  = f" · cone GNN {cn['gnn_score']*100:.1f}%" if cn.get('gnn_score') is not None else ""
+            st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fff7ed;color:#c2410c;border-left:3px solid #c2410c;">◎ {cn["hops"]}-hop cone around {cn["seeds"]} flagged signal(s): {cn["signals"]} signals ({cn["fraction"]*100:.0f}% of design), {cn["edges"]} edges{gs}</div>', unsafe_allow_html=True)
+
+        # Similar designs from the embedding index
+        if pred.get('similar'):
+            nd  = pred.get('near_duplicate')
+            top = " · ".join(f"{s['key']} ({'HT' if s['verdict'] else 'clean'}, d={s['distance']:.3f})"
+                             for s in pred['similar'][:3])
+            col = "#dc2626" if nd and nd['verdict'] else "#1a6fff"
+            tag = f"Near-duplicate of {nd['key']} — " if nd else "Similar designs: "
+            st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#eff6ff;color:{col};border-left:3px solid {col};">≈ {tag}{top}</div>', unsafe_allow_html=True)
+
+        # Anomaly panel
+        if view['anomaly'] and pred['statistical_score'] > 0:
+            st.markdown("**Anomaly Breakdown:**")
+            a = pred['anomalies']
+            cats = []
+            for label, key, sev in [
+                ("Suspicious Names","suspicious_names","CRITICAL"),
+                ("Unusual Widths","unusual_widths","MEDIUM"),
+                ("High Fan-out","high_fanout","HIGH"),
+                ("Isolated Signals","isolated_signals","HIGH"),
+                ("Complex Logic","complex_logic","MEDIUM"),
+                ("Rare Signals","rare_signals","MEDIUM"),
+            ]:
+                v = a.get(key,[])
+                if isinstance(v,list) and v:
+                    cats.append({'Category':label,'Count':len(v),'Severity':sev})
+
+            if cats:
+                adf = pd.DataFrame(cats)
+                fig = px.bar(adf,x='Category',y='Count',color='Severity',
+                             color_discrete_map={'CRITICAL':'#e63950','HIGH':'#d97706','MEDIUM':'#1a6fff'},
+                             title='Anomaly Distribution')
+                fig.update_layout(plot_bgcolor='#ffffff', paper_bgcolor='#f7f9fc',
+                                  font=dict(color='#1a2540', family='Inter'),
+                                  height=280, margin=dict(t=40,b=20))
+                st.plotly_chart(fig, use_container_width=True, key=f"anom_{uid}")
+
+            col1,col2 = st.columns(2)
+            with col1:
+                if a.get('suspicious_names'):
+                    st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fff0f2;color:#e63950;border-left:3px solid #e63950;">⚠ Suspicious names: {", ".join(a["suspicious_names"][:5])}</div>', unsafe_allow_html=True)
+                if a.get('high_fanout'):
+                    for nm,fo in a['high_fanout'][:3]:
+                        st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fffbeb;color:#d97706;border-left:3px solid #d97706;">Fan-out {nm}: {fo}</div>', unsafe_allow_html=True)
+            with col2:
+                if a.get('isolated_signals'):
+                    st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#eff6ff;color:#1a6fff;border-left:3px solid #1a6fff;">Isolated: {", ".join(a["isolated_signals"][:5])}</div>', unsafe_allow_html=True)
+                if a.get('unusual_widths'):
+                    for nm,w in a['unusual_widths'][:3]:
+                        st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fffbeb;color:#d97706;border-left:3px solid #d97706;">Width outlier {nm}: {w}b</div>', unsafe_allow_html=True)
+
+        # Netlist graph
+        if view['graph']:
+            st.markdown("**Netlist Signal Dependency Graph:**")
+            hl = flagged_signals(pred['anomalies']) if is_ht else []
+            create_dark_graph(module, hl, max(view['cone_hops'], 1), view['cone_only'] and view['cone_hops'] > 0,
+                              key=f"net_{uid}")
+
+        # Signal table
+        if st.checkbox(f"Signal detail table", key=f"sig_{uid}"):
+            sdf = pd.DataFrame([{
+                'Signal': nm, 'Type': s.signal_type, 'Width': s.width,
+                'Fan-in': s.fanin, 'Fan-out': s.fanout,
+                'Clock': '✓' if s.is_clock else '',
+                'Reset': '✓' if s.is_reset else '',
+                'Flag': '⚠' if nm in (pred['anomalies'].get('suspicious_names',[])) else ''
+            } for nm,s in module.signals.items()])
+            st.dataframe(sdf, use_container_width=True, hide_index=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ANALYSIS STORE
+# ─────────────────────────────────────────────────────────────────────────────
+def analysis_key(files, **config) -> str:
+    """Uploads + every setting that changes parse / graph / score / agent results (not weights or display)"""
+    h = hashlib.blake2b(digest_size=16)
+    for f in files:
+        h.update(f.name.encode()); h.update(hashlib.blake2b(f.getvalue(), digest_size=16).digest())
+    h.update(repr(sorted(config.items())).encode())
+    return h.hexdigest()
+
+
+def run_analysis(files, gnn_w, stat_w, model_version, backend, int8, threads, index, golden, cone_hops,
+                 cone_rescore, use_cache, clear_cache, ingest_workers) -> Dict:
+    """Compute phase: parse, build graphs, score and run the agents → session store entry"""
+    t0       = time.perf_counter()
+    mcp      = MCPServerRegistry()
+    builder  = EnhancedGraphBuilder(48)
+    detector = HybridTrojanDetectionSystem(gnn_weight=gnn_w, stat_weight=stat_w, model_version=model_version,
+                                           backend=backend, quantize=int8, index=index, cone_hops=cone_hops,
+                                           cone_rescore=cone_rescore)
+    if not detector.statistical_only and threads:
+        from armoriq.engine import configure_threads     # imports torch; only when the GNN runs
+        configure_threads(threads, 1)
+
+    cache    = ResultCache(config=analysis_config(builder, detector)) if use_cache else None
+    t_init   = time.perf_counter() - t0
+    if cache and clear_cache:
+        cache.clear(); LayoutEngine.default().clear()
+
+    # ── PARSING ──────────────────────────────────────────────────────────────
+    prog = st.progress(0)
+    sta  = st.empty()
+
+    def on_progress(done: int, total: int):
+        prog.progress(done / total)
+        sta.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.82rem;color:#1a6fff;padding:6px 0;">◉ Parsed {done}/{total} file(s) · {len(files)-total} cached</div>', unsafe_allow_html=True)
+
+    scan = ingest_designs([(f.name, f.getvalue()) for f in files], builder, detector, mcp, cache,
+                          ingest_workers or None, on_progress)
+    notes = [("error", f"Parse error — {name}: {err}") for name, err in scan.errors]
+    notes += [("info", f"Module '{name}' in {fname} is also defined in {scan.elab.origin[name]}: "
+                       f"both are scored, instances resolve to the first definition")
+              for name, fname in scan.elab.duplicates]
+    prog.empty(); sta.empty()
+
+    # ── RUN AGENTS ───────────────────────────────────────────────────────────
+    if scan.modules:
+        with st.spinner("🤖 AI Agents running…"):
+            n_err = len(scan.errors)
+            score_designs(scan, detector, mcp, cache, golden)
+            notes += [("warning", f"Result cache {err}") for _, err in scan.errors[n_err:]]
+    mcp.close()
+    return {'scan': scan, 'detector': detector, 'mcp': mcp, 'notes': notes, 'weights': (gnn_w, stat_w),
+            'gnn': not detector.statistical_only, 't_init': t_init, 'compute_s': time.perf_counter() - t0}
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN APPLICATION
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1338,6 +920,16 @@ def main():
         method = st.radio("Detection Engine", ["Hybrid (GNN + Statistical)", "GNN Only", "Statistical Only"], index=0)
         gnn_w  = st.slider("GNN Weight", 0.0, 1.0, 0.6, 0.1) if "Hybrid" in method else (1.0 if "GNN" in method else 0.0)
         stat_w = 1.0 - gnn_w
+        versions = [MODEL_VERSION] + [v for v in ModelRegistry.default().versions() if v != MODEL_VERSION]
+        model_version = st.selectbox("GNN Checkpoint", versions, disabled=gnn_w == 0,
+                                     help="Versioned checkpoints from $ARMORIQ_MODEL_DIR; loaded once per process")
+        backend = st.selectbox("Inference Backend", list(INFERENCE_BACKENDS), disabled=gnn_w == 0,
+                               help="Eager PyTorch, traced TorchScript or ONNX Runtime; exports are built once")
+        int8    = st.checkbox("Int8 Quantization", value=False, disabled=gnn_w == 0,
+                              help="Dynamic int8 weights for the GNN's linear layers")
+        threads = st.number_input("Torch Threads", 0, os.cpu_count() or 1, max(1, (os.cpu_count() or 1) // 2),
+                                  disabled=gnn_w == 0,
+                                  help="Intra-op threads for GNN inference; leave cores for the agent pipeline (0 = torch default)")
 
         st.markdown("---")
         st.markdown("**Visualisation**")
@@ -1346,9 +938,37 @@ def main():
         show_agents  = st.checkbox("AI Agent Logs",        value=True)
         show_mcp     = st.checkbox("MCP Server Registry",  value=True)
         show_types   = st.checkbox("HT Type Taxonomy",     value=True)
+        timeline_max = st.number_input("Timeline Points", 50, 100000, 1000, step=50,
+                                       help="Designs drawn individually on the threat timeline; above it they are bucketed")
+        cone_hops    = st.slider("Cone Hops", 0, 4, 2,
+                                 help="Fan-in / fan-out steps kept around flagged signals (0 = no cone)")
+        cone_only    = st.checkbox("Cone-only Graph", value=False, disabled=cone_hops == 0,
+                                   help="Draw only the cone around flagged signals; keeps large designs interactive")
+        cone_rescore = st.checkbox("Cone GNN Re-scoring", value=False, disabled=gnn_w == 0 or cone_hops == 0,
+                                   help="Also score the flagged-signal cone subgraph with the GNN")
 
         st.markdown("---")
-        use_golden = st.checkbox("Golden Model Reference", value=False)
+        use_golden = st.checkbox("Golden Model Reference", value=False,
+                                 help="Score each design's deviation from its nearest known-clean reference")
+        golden = GoldenStore(model_version=model_version) if use_golden else None
+        if golden is not None:
+            golden_files = st.file_uploader("Known-clean reference designs", type=["v","vh"],
+                                            accept_multiple_files=True, key="golden_upload")
+            g1, g2 = st.columns(2)
+            add_golden   = g1.button("Add to Store", disabled=not golden_files)
+            clear_golden = g2.button("Clear Store", disabled=not len(golden))
+            golden_msg   = st.empty()
+            golden_msg.caption(f"{len(golden)} reference design(s) in golden store")
+        use_index = st.checkbox("Similarity Index", value=False, disabled=gnn_w == 0,
+                                help="Match each design's GNN embedding against previously analysed designs")
+        index = EmbeddingIndex(model_version=model_version) if use_index and gnn_w > 0 else None
+        if index is not None:
+            st.caption(f"{len(index)} design(s) in embedding index")
+        use_cache  = st.checkbox("Result Cache", value=True, help="Reuse parse/graph/GNN results for unchanged files")
+        clear_cache = st.button("Clear Result Cache", disabled=not use_cache,
+                                help="Also drops the cached netlist layouts")
+        ingest_workers = st.number_input("Ingestion Workers", 0, os.cpu_count() or 1, 0,
+                                         help="Parser/graph-builder processes (0 = one per core)")
 
         st.markdown("---")
         st.markdown('<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.72rem;color:#8898b0;text-transform:uppercase;letter-spacing:0.1em;margin-bottom:6px;">Architecture</div>', unsafe_allow_html=True)
@@ -1368,6 +988,25 @@ def main():
 │   └── Monitor Agent 🛰️
 └── GNN: 4-layer GAT (256H)""", language="text")
 
+    # ── GOLDEN STORE ─────────────────────────────────────────────────────────
+    if golden is not None and clear_golden:
+        golden.clear()
+        golden_msg.caption("Golden store cleared")
+    if golden is not None and add_golden:
+        g_mcp = MCPServerRegistry()
+        try:
+            with st.spinner("Ingesting golden references…"):
+                g_det = HybridTrojanDetectionSystem(gnn_weight=gnn_w, stat_weight=stat_w,
+                                                    model_version=model_version, backend=backend,
+                                                    quantize=int8)
+                g_res = ingest_golden([(f.name, f.getvalue()) for f in golden_files], golden,
+                                      EnhancedGraphBuilder(48), g_det, g_mcp, None, ingest_workers or None)
+        finally:
+            g_mcp.close()
+        for name, err in g_res.errors:
+            st.sidebar.error(f"Golden reference {name}: {err}")
+        golden_msg.caption(f"{len(golden)} reference design(s) in golden store (+{len(g_res.modules)})")
+
     # ── FILE UPLOAD ──────────────────────────────────────────────────────────
     st.markdown('<div class="sec-header">Upload RTL Designs</div>', unsafe_allow_html=True)
     files = st.file_uploader("Upload Verilog RTL (.v / .vh)", type=["v","vh"], accept_multiple_files=True)
@@ -1397,49 +1036,42 @@ def main():
         st.dataframe(df_tax, use_container_width=True, hide_index=True)
         return
 
-    # ── INITIALISE ───────────────────────────────────────────────────────────
-    mcp      = MCPServerRegistry()
-    parser   = CompetitionVerilogParser()
-    builder  = EnhancedGraphBuilder(48)
-    detector = HybridTrojanDetectionSystem(gnn_weight=gnn_w, stat_weight=stat_w)
-
-    det_agent  = DetectionAgent(mcp, detector)
-    ana_agent  = AnalysisAgent(mcp)
-    mon_agent  = MonitorAgent(mcp)
-
-    # ── PARSING ──────────────────────────────────────────────────────────────
-    modules, graphs = [], []
-    prog = st.progress(0)
-    sta  = st.empty()
-
-    for idx, f in enumerate(files):
-        sta.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.82rem;color:#1a6fff;padding:6px 0;">◉ Parsing {f.name}…</div>', unsafe_allow_html=True)
-        prog.progress((idx+1)/len(files))
-        try:
-            content = f.read().decode("utf-8", errors="ignore")
-            mod = parser.parse(content)
-            mcp.call("mcp-parse", "tokenize", {"file": f.name})
-            modules.append(mod)
-            mcp.call("mcp-graph", "build", {"nodes": len(mod.signals)})
-            graphs.append(builder.build(mod))
-        except Exception as e:
-            st.error(f"Parse error — {f.name}: {e}")
-
-    prog.empty(); sta.empty()
-
+    # ── ANALYSIS (session store) ─────────────────────────────────────────────
+    # compute (parse → graphs → scores → agents) only when the uploads or a result-changing setting change;
+    # display toggles just re-render, and a weight change re-blends the stored scores
+    key = analysis_key(files, model_version=model_version, backend=backend, int8=int8, index=index is not None,
+                       golden=len(golden) if golden is not None else None, cone_hops=cone_hops,
+                       cone_rescore=cone_rescore)
+    store = st.session_state.get("analysis")
+    fresh = store is None or store['key'] != key or clear_cache or (gnn_w > 0 and not store['gnn'])
+    if fresh:
+        st.session_state["analysis"] = None                # drop the old results before computing new ones
+        store = run_analysis(files, gnn_w, stat_w, model_version, backend, int8, threads, index, golden,
+                             cone_hops, cone_rescore, use_cache, clear_cache, ingest_workers)
+        store['key'] = key
+        st.session_state["analysis"] = store
+    for kind, msg in store['notes']:
+        getattr(st, kind)(msg)
+    scan, detector, mcp = store['scan'], store['detector'], store['mcp']
+    elab, modules = scan.elab, scan.modules
     if not modules:
         st.error("No designs could be parsed."); return
 
-    # ── RUN AGENTS ───────────────────────────────────────────────────────────
-    with st.spinner("🤖 AI Agents running…"):
-        predictions  = det_agent.run(modules, graphs, None if not use_golden else {})
-        for i,p in enumerate(predictions):
-            p['filename'] = files[i].name
-
-        fingerprints = ana_agent.run(modules, predictions)
-        monitor_sum  = mon_agent.run(modules, predictions)
+    predictions, fingerprints, monitor_sum = scan.predictions, scan.fingerprints, scan.monitor
+    reweighted = (gnn_w, stat_w) != store['weights']
+    if reweighted:
+        predictions  = [HybridTrojanDetectionSystem.reblend(p, gnn_w, stat_w) for p in predictions]
+        fingerprints = [{**fp, 'hybrid_score': p['hybrid_score'], 'is_trojan': p['prediction'] == 1}
+                        for fp, p in zip(fingerprints, predictions)]
+        monitor_sum  = summarize_threats(modules, predictions)
+    det_agent, ana_agent, mon_agent = scan.agents
+    pipeline = scan.pipeline
+    t_init   = store['t_init']
 
     st.success(f"✅ Analysis complete — {len(modules)} design(s) processed by 3 AI agents via {len(mcp.call_log)} MCP calls")
+    if not fresh:
+        st.caption(f"Served from this session's analysis store ({store['compute_s']:.2f}s to compute)"
+                   + (f" · re-blended at GNN weight {gnn_w:.1f} from stored scores" if reweighted else ""))
 
     # ── GLOBAL KPI BAR ───────────────────────────────────────────────────────
     st.markdown('<div class="sec-header">Global Threat Summary</div>', unsafe_allow_html=True)
@@ -1456,9 +1088,27 @@ def main():
     k4.metric("Critical Threats", crit)
     k5.metric("Avg Confidence",  f"{avg_conf*100:.1f}%")
 
+    # ── DESIGN HIERARCHY ─────────────────────────────────────────────────────
+    if any(m.instances for m in modules):
+        st.markdown('<div class="sec-header">Design Hierarchy</div>', unsafe_allow_html=True)
+        rows = []
+        for top in elab.tops():
+            r = elab.rollup(top)
+            rows.append({
+                'Top': top, 'File': elab.origin[top],
+                'Instances': r['instances'], 'Unique Modules': len(r['counts']) + 1,
+                'Flattened Signals': r['signals'], 'Worst Sub-design': r['worst'],
+                'Worst Stat %': r['score']*100, 'Unresolved': ", ".join(r['unresolved'][:5]),
+            })
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        with st.expander("🌳 Instance tree"):
+            tree = [f"{'  '*d}{name}" + (f" ×{k}" if k > 1 else "")
+                    for top in elab.tops() for d, name, k in elab.hierarchy(top)]
+            st.code("\n".join(tree[:2000]), language=None)
+
     # ── THREAT TIMELINE ──────────────────────────────────────────────────────
     st.markdown('<div class="sec-header">Threat Timeline</div>', unsafe_allow_html=True)
-    render_threat_timeline(monitor_sum['threat_events'])
+    render_threat_timeline(monitor_sum['threat_events'], timeline_max)
 
     # ── AGENT LOGS ───────────────────────────────────────────────────────────
     if show_agents:
@@ -1467,6 +1117,26 @@ def main():
         with ac1: render_agent_log(det_agent)
         with ac2: render_agent_log(ana_agent)
         with ac3: render_agent_log(mon_agent)
+        with st.expander("⏱ Agent Pipeline Metrics"):
+            pm = pipeline.metrics
+            st.dataframe(pd.DataFrame([{
+                'Stage': k.title(), 'Items': m['items'], 'Busy s': round(m['busy_s'], 3),
+                'Items/s': round(m['items_per_s'], 1), 'Idle s': round(m['wait_s'], 3),
+                'Backpressure s': round(m['blocked_put_s'], 3), 'Max Queue': m['max_depth'],
+                'First Result s': round(m['first_s'] or 0.0, 3), 'Max Latency s': round(m['max_latency_s'], 3),
+            } for k, m in pm.items() if isinstance(m, dict)]), use_container_width=True, hide_index=True)
+            st.caption(f"Wall {pm['wall_s']:.3f}s vs {pm['serial_s']:.3f}s of summed stage work")
+            mi = detector.models.info(detector.model_version) if not detector.statistical_only else None
+            if mi:
+                mode = detector.backend + ("-int8" if detector.quantize else "")
+                eng  = mi.get('engines', {}).get(mode, {})
+                exp  = f" (exported in {eng['export_s']:.2f}s)" if eng.get('export_s') else ""
+                st.caption(f"GNN {mi['version']} ({mi['source']}) · {mode} backend{exp} · "
+                           f"loaded once per process in {mi['load_s']:.2f}s "
+                           f"(torch import {mi['import_s']:.2f}s) · reused {mi['hits']}× · last analysis: "
+                           f"init {t_init*1e3:.1f} ms + model {detector.model_wait_s*1e3:.1f} ms")
+            else:
+                st.caption(f"Statistical-only: GNN not loaded · last analysis: init {t_init*1e3:.1f} ms")
 
     # ── MCP SERVER STATUS ────────────────────────────────────────────────────
     if show_mcp:
@@ -1477,120 +1147,25 @@ def main():
             st.dataframe(cdf, use_container_width=True, hide_index=True)
 
     # ── INDIVIDUAL DESIGNS ───────────────────────────────────────────────────
+    report = build_report(modules, predictions, fingerprints, monitor_sum, len(mcp.call_log))
     st.markdown('<div class="sec-header">Individual Design Reports</div>', unsafe_allow_html=True)
 
-    for module, pred, fp in zip(modules, predictions, fingerprints):
-        fname = pred.get('filename', module.name)
-        is_ht = pred['prediction'] == 1
-
-        icon    = "🚨" if is_ht else "✅"
-        verdict = "HARDWARE TROJAN DETECTED" if is_ht else "DESIGN CLEAN — HT-FREE"
-        vcard   = "verdict-red" if is_ht else "verdict-green"
-        vtitle  = "verdict-title-red" if is_ht else "verdict-title-green"
-
-        with st.expander(f"{icon}  {fname}", expanded=is_ht):
-            # Verdict banner
-            st.markdown(f"""<div class="{vcard}">
-                <div class="{vtitle}">{icon}&nbsp; {verdict}</div>
-                <div style="font-family:'JetBrains Mono',monospace;font-size:0.75rem;color:#4a5880;margin-top:5px;">
-                    Module: {module.name} &nbsp;·&nbsp; Hybrid Score: {pred['hybrid_score']*100:.1f}% &nbsp;·&nbsp;
-                    Confidence: {pred['confidence']*100:.1f}%
-                </div>
-            </div>""", unsafe_allow_html=True)
-
-            st.markdown("")
-
-            # KPIs
-            c1,c2,c3,c4 = st.columns(4)
-            c1.metric("Hybrid Score",        f"{pred['hybrid_score']*100:.1f}%")
-            c2.metric("GNN Score",           f"{pred['gnn_score']*100:.1f}%")
-            c3.metric("Statistical Score",   f"{pred['statistical_score']*100:.1f}%")
-            c4.metric("Confidence",          f"{pred['confidence']*100:.1f}%")
-
-            # HT Type classification
-            if show_types and is_ht:
-                st.markdown("**Detected HT Pattern Types:**")
-                ht_types = fp.get('ht_types', [])
-                type_cols = st.columns(max(len(ht_types),1))
-                for i, ht in enumerate(ht_types):
-                    with type_cols[i % len(type_cols)]:
-                        desc = TRADITIONAL_TROJAN_TYPES.get(ht, "Unknown pattern")
-                        st.markdown(
-                            f"<div style='background:#fff0f2;border:1px solid #e63950;"
-                            f"border-radius:8px;padding:12px;margin:4px 0;'>"
-                            f"<div style='font-family:\"Space Grotesk\",sans-serif;font-weight:700;"
-                            f"color:#e63950;font-size:0.9rem;'>⚠ {ht}</div>"
-                            f"<div style='font-size:0.78rem;color:#4a5880;margin-top:4px;"
-                            f"font-family:\"Inter\",sans-serif;'>{desc}</div>"
-                            f"</div>",
-                            unsafe_allow_html=True
-                        )
-
-            # Module stats
-            c1,c2,c3,c4,c5 = st.columns(5)
-            c1.metric("Signals",      len(module.signals))
-            c2.metric("Assignments",  len(module.assignments))
-            c3.metric("Always Blks",  len(module.always_blocks))
-            c4.metric("Instances",    len(module.instances))
-            c5.metric("Parameters",   len(module.parameters))
-
-            # Anomaly panel
-            if show_anomaly and pred['statistical_score'] > 0:
-                st.markdown("**Anomaly Breakdown:**")
-                a = pred['anomalies']
-                cats = []
-                for label, key, sev in [
-                    ("Suspicious Names","suspicious_names","CRITICAL"),
-                    ("Unusual Widths","unusual_widths","MEDIUM"),
-                    ("High Fan-out","high_fanout","HIGH"),
-                    ("Isolated Signals","isolated_signals","HIGH"),
-                    ("Complex Logic","complex_logic","MEDIUM"),
-                    ("Rare Signals","rare_signals","MEDIUM"),
-                ]:
-                    v = a.get(key,[])
-                    if isinstance(v,list) and v:
-                        cats.append({'Category':label,'Count':len(v),'Severity':sev})
-
-                if cats:
-                    adf = pd.DataFrame(cats)
-                    fig = px.bar(adf,x='Category',y='Count',color='Severity',
-                                 color_discrete_map={'CRITICAL':'#e63950','HIGH':'#d97706','MEDIUM':'#1a6fff'},
-                                 title='Anomaly Distribution')
-                    fig.update_layout(plot_bgcolor='#ffffff', paper_bgcolor='#f7f9fc',
-                                      font=dict(color='#1a2540', family='Inter'),
-                                      height=280, margin=dict(t=40,b=20))
-                    st.plotly_chart(fig, use_container_width=True)
-
-                col1,col2 = st.columns(2)
-                with col1:
-                    if a.get('suspicious_names'):
-                        st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fff0f2;color:#e63950;border-left:3px solid #e63950;">⚠ Suspicious names: {", ".join(a["suspicious_names"][:5])}</div>', unsafe_allow_html=True)
-                    if a.get('high_fanout'):
-                        for nm,fo in a['high_fanout'][:3]:
-                            st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fffbeb;color:#d97706;border-left:3px solid #d97706;">Fan-out {nm}: {fo}</div>', unsafe_allow_html=True)
-                with col2:
-                    if a.get('isolated_signals'):
-                        st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#eff6ff;color:#1a6fff;border-left:3px solid #1a6fff;">Isolated: {", ".join(a["isolated_signals"][:5])}</div>', unsafe_allow_html=True)
-                    if a.get('unusual_widths'):
-                        for nm,w in a['unusual_widths'][:3]:
-                            st.markdown(f'<div style="font-family:\'JetBrains Mono\',monospace;font-size:0.78rem;padding:5px 10px;border-radius:4px;margin:3px 0;background:#fffbeb;color:#d97706;border-left:3px solid #d97706;">Width outlier {nm}: {w}b</div>', unsafe_allow_html=True)
-
-            # Netlist graph
-            if show_graph:
-                st.markdown("**Netlist Signal Dependency Graph:**")
-                hl = pred['anomalies'].get('suspicious_names',[]) if is_ht else []
-                create_dark_graph(module, hl)
-
-            # Signal table
-            if st.checkbox(f"Signal detail table", key=f"sig_{fname}"):
-                sdf = pd.DataFrame([{
-                    'Signal': nm, 'Type': s.signal_type, 'Width': s.width,
-                    'Fan-in': s.fanin, 'Fan-out': s.fanout,
-                    'Clock': '✓' if s.is_clock else '',
-                    'Reset': '✓' if s.is_reset else '',
-                    'Flag': '⚠' if nm in (pred['anomalies'].get('suspicious_names',[])) else ''
-                } for nm,s in module.signals.items()])
-                st.dataframe(sdf, use_container_width=True, hide_index=True)
+    designs = report['designs']
+    f1,f2,f3,f4,f5 = st.columns([3,2,3,2,1])
+    query    = f1.text_input("Search", placeholder="file or module name", key="rb_query")
+    verdicts = f2.multiselect("Verdict", ["HT-Infested","HT-Free"], key="rb_verdict")
+    types    = f3.multiselect("HT Type", sorted({t for d in designs for t in d['ht_types']}), key="rb_types")
+    sort     = f4.selectbox("Sort by", list(REPORT_SORTS), key="rb_sort")
+    per_page = f5.number_input("Per page", 1, 1000, 10, key="rb_per_page")
+    order    = browse_designs(designs, query, verdicts, types, *REPORT_SORTS[sort])
+    pages    = max(1, -(-len(order) // per_page))
+    page     = min(st.number_input("Page", 1, pages, 1, key="rb_page"), pages) if pages > 1 else 1
+    lo, hi   = (page - 1) * per_page, min(page * per_page, len(order))
+    st.caption(f"{len(order)} of {len(designs)} design(s) match · page {page} of {pages} · showing {min(lo+1, hi)}–{hi}")
+    view = {'types': show_types, 'anomaly': show_anomaly, 'graph': show_graph,
+            'cone_hops': cone_hops, 'cone_only': cone_only}
+    for i in order[lo:hi]:                                 # widgets / figures only for the designs in view
+        render_design_report(i, modules[i], predictions[i], fingerprints[i], view)
 
     # ── COMPARATIVE DASHBOARD ────────────────────────────────────────────────
     if len(modules) > 1:
@@ -1628,28 +1203,6 @@ def main():
     st.markdown('<div class="sec-header">Export</div>', unsafe_allow_html=True)
     ex1,ex2 = st.columns(2)
 
-    report = {
-        'platform': 'ArmorIQ™ v2.0',
-        'architecture': {'gnn': '4-layer GAT 256H', 'agents': 3, 'mcp_servers': 8},
-        'mcp_calls': len(mcp.call_log),
-        'summary': {
-            'total': total, 'trojans': trojans, 'clean': clean,
-            'critical': crit, 'avg_confidence': float(avg_conf)
-        },
-        'designs': [{
-            'file': p.get('filename',m.name), 'module': m.name,
-            'verdict': 'HT-Infested' if p['prediction']==1 else 'HT-Free',
-            'hybrid_score': float(p['hybrid_score']),
-            'gnn_score': float(p['gnn_score']),
-            'statistical_score': float(p['statistical_score']),
-            'confidence': float(p['confidence']),
-            'ht_types': fp.get('ht_types',[]),
-            'signals': len(m.signals),
-            'anomaly_count': sum(len(v) if isinstance(v,list) else 0
-                                 for v in p['anomalies'].values()),
-        } for m,p,fp in zip(modules,predictions,fingerprints)]
-    }
-
     with ex1:
         st.download_button("📄 Download JSON Report",
             data=json.dumps(report,indent=2),
@@ -1657,9 +1210,8 @@ def main():
             mime="application/json")
     with ex2:
         if len(predictions)>1:
-            cdf = pd.DataFrame(report['designs'])
             st.download_button("📊 Download CSV Results",
-                data=cdf.to_csv(index=False),
+                data=report_csv(report),
                 file_name=f"armoriq_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv")
 
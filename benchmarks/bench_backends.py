@@ -0,0 +1,86 @@
+"""
+GNN inference backend benchmark and parity check: eager vs TorchScript vs ONNX Runtime.
+
+    python benchmarks/bench_backends.py --signals 10 50 200 1000 --designs 32
+
+Exports the model into a temporary ModelRegistry, then for each graph size
+scores the same synthetic designs with every backend: single-graph latency
+(median ms), batched throughput (graphs/s) and the max |Δ| of logits and
+embeddings against eager. Fails if any backend drifts beyond --tol.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (INFERENCE_BACKENDS, CompetitionVerilogParser,   # noqa: E402
+                     EnhancedGraphBuilder, ModelRegistry)
+from torch_geometric.data import Batch                           # noqa: E402
+
+
+def timed(fn, repeat):
+    ts = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(); ts.append(time.perf_counter() - t0)
+    return ts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--signals", type=int, nargs="+", default=[10, 50, 200, 1000], help="signals per design")
+    ap.add_argument("--designs", type=int, default=32, help="designs per size (batched throughput)")
+    ap.add_argument("--repeat", type=int, default=20, help="single-graph latency samples")
+    ap.add_argument("--backends", nargs="+", choices=INFERENCE_BACKENDS, default=list(INFERENCE_BACKENDS))
+    ap.add_argument("--tol", type=float, default=1e-3)
+    args = ap.parse_args()
+    warnings.filterwarnings("ignore")
+
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    with tempfile.TemporaryDirectory() as root:
+        reg = ModelRegistry(root)
+        engines = {}
+        for b in args.backends:
+            engines[b] = reg.engine(backend=b)
+            e = engines[b]
+            print(f"{b:>12}: export {e.export_s:.3f}s, load {e.load_s - e.export_s:.3f}s"
+                  f"{', ' + str(os.path.getsize(e.path) >> 10) + ' KiB' if e.path else ''}")
+        eager = engines.get("eager") or reg.engine()
+
+        print(f"\n{'signals':>8} {'nodes':>7} {'backend':>12} {'lat ms':>8} {'graphs/s':>9} {'speedup':>8} "
+              f"{'|Δlogit|':>9} {'|Δemb|':>9}")
+        worst = 0.0
+        for n in args.signals:
+            graphs = [builder.build(parser.parse(synthetic_rtl(n, seed=i, name=f"d{i}"))) for i in range(args.designs)]
+            one, many = Batch.from_data_list(graphs[:1]), Batch.from_data_list(graphs)
+            ref_out, ref_emb = eager(many)
+            base = None
+            for b, e in engines.items():
+                e(one)                                     # warm-up (lazy init, allocator)
+                lat = statistics.median(timed(lambda: e(one), args.repeat))
+                thr = len(graphs) / min(timed(lambda: e(many), 3))
+                out, emb = e(many)
+                d_out = (out - ref_out).abs().max().item()
+                d_emb = ((emb - ref_emb).abs() / ref_emb.abs().clamp(min=1)).max().item()
+                worst = max(worst, d_out, d_emb)
+                base = base or thr
+                print(f"{n:>8} {graphs[0].num_nodes:>7} {b:>12} {lat*1e3:>8.2f} {thr:>9.1f} {thr/base:>7.2f}x "
+                      f"{d_out:>9.1e} {d_emb:>9.1e}")
+        if worst > args.tol:
+            sys.exit(f"parity FAILED: max |Δ| {worst:.2e} > {args.tol}")
+        print(f"\nparity OK (max |Δ| {worst:.1e}, torch {torch.__version__}, {torch.get_num_threads()} thread(s), "
+              f"numpy {np.__version__})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Graph-builder centrality scaling benchmark.
+
+    python benchmarks/bench_centrality.py --sizes 250 500 1000 2000
+    python benchmarks/bench_centrality.py --compare --sizes 1000 3000
+
+Times EnhancedGraphBuilder.build end-to-end and the per-module centrality
+pass on its own, for synthetic netlists of increasing signal count.
+With --compare, prints the approx-vs-exact accuracy/latency report of
+CentralityEngine for each size instead (the synthetic netlists have several
+weakly connected components, so closeness is compared per component; a
+metric that is constant on the exact path is flagged rather than scored).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (CompetitionVerilogParser,                   # noqa: E402
+                     EnhancedGraphBuilder, CentralityEngine,
+                     get_netlist)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--mode", choices=["auto", "exact", "approx"], default="auto")
+    ap.add_argument("--pivots", type=int, default=128)
+    ap.add_argument("--compare", action="store_true", help="approx vs exact accuracy/latency report")
+    args = ap.parse_args()
+
+    parser = CompetitionVerilogParser()
+    engine = CentralityEngine(mode=args.mode, pivots=args.pivots)
+    builder = EnhancedGraphBuilder(48, centrality=engine)
+
+    if args.compare:
+        for n in args.sizes:
+            nl = get_netlist(parser.parse(synthetic_rtl(n, seed=n)))
+            rep = engine.compare(nl)
+            lat, g = rep.pop("_latency"), rep.pop("_graph")
+            print(f"\n{n} signals, {g['components']} weak component(s) — exact {lat['exact_s']:.3f}s  "
+                  f"approx {lat['approx_s']:.3f}s  speedup {lat['speedup']:.1f}x")
+            print(f"  {'metric':<12} {'nonzero':>8} {'max|err|':>10} {'spearman':>9} {'top-10%':>8}")
+            for key, r in rep.items():
+                tail = ("   constant in exact: not compared" if r['trivial'] else
+                        f" {r['spearman']:>9.3f} {r['top_decile_overlap']:>8.2f}")
+                print(f"  {key:<12} {r['nonzero']:>8.2f} {r['max_abs_err']:>10.4f}{tail}")
+        return
+
+    print(f"{'signals':>8} {'edges':>8} {'mode':>7} {'build (s)':>10} {'centrality (s)':>15}")
+    for n in args.sizes:
+        mod = parser.parse(synthetic_rtl(n, seed=n))
+        nl = get_netlist(mod)
+        best_build = best_cent = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter(); builder.build(mod)
+            best_build = min(best_build, time.perf_counter() - t0)
+
+            t0 = time.perf_counter(); builder._graph_metrics(nl)
+            best_cent = min(best_cent, time.perf_counter() - t0)
+        print(f"{nl.num_nodes:>8} {nl.num_edges:>8} {engine.last_mode:>7} "
+              f"{best_build:>10.3f} {best_cent:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Flagged-signal cone benchmark and parity check: CSR/CSC extraction vs NetworkX ego graphs.
+
+    python benchmarks/bench_cone.py --signals 500 5000 50000 --hops 1 2 3 --seeds 4
+
+For each synthetic design size (one injected counter-trigger HT) extracts the
+k-hop fan-in / fan-out cone around a fixed number of seeds and around every
+flagged signal, and compares node and edge sets with the union of NetworkX
+ego graphs on the graph and its reverse (the reference). Reports the one-off
+reverse-index build, per-query time, cone size and the points the cone-only
+netlist view draws against the full view. Fails on any mismatch.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import inject_trojan, synthetic_rtl                    # noqa: E402
+from armoriq import (CompetitionVerilogParser, LayoutEngine,         # noqa: E402
+                     StatisticalTrojanDetector, extract_cone, flagged_signals, get_netlist)
+
+
+def reference_cone(G, Gr, seeds, hops, direction='both'):
+    """Union of ego graphs (successors / predecessors) → (node names, induced edge set)"""
+    import networkx as nx
+    nodes = set()
+    for s in seeds:
+        if direction in ('in', 'both'):
+            nodes |= set(nx.ego_graph(Gr, s, radius=hops))
+        if direction in ('out', 'both'):
+            nodes |= set(nx.ego_graph(G, s, radius=hops))
+    return nodes, set(G.subgraph(nodes).edges())
+
+
+def timed(fn, repeat):
+    ts = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); out = fn(); ts.append(time.perf_counter() - t0)
+    return statistics.median(ts), out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--signals", type=int, nargs="+", default=[500, 5000, 50000])
+    ap.add_argument("--hops", type=int, nargs="+", default=[1, 2, 3])
+    ap.add_argument("--seeds", type=int, default=4, help="fixed seed count (besides the flagged-signal cone)")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    warnings.filterwarnings("ignore")
+
+    parser, stat = CompetitionVerilogParser(), StatisticalTrojanDetector()
+    rng = np.random.default_rng(0)
+    print(f"{'signals':>8} {'edges':>8} {'seeds':>7} {'hops':>4} {'csc ms':>7} {'cone ms':>8} {'nx ms':>9} "
+          f"{'speedup':>8} {'cone n':>7} {'cone e':>7} {'view pts':>9} {'full pts':>9}")
+    bad = 0
+    for n in args.signals:
+        mod = parser.parse(inject_trojan(synthetic_rtl(n, seed=n, name=f"d{n}"), seed=n))
+        nl  = get_netlist(mod)
+        t0  = time.perf_counter(); nl.csc(); t_csc = time.perf_counter() - t0
+        G   = nl.to_networkx(); Gr = G.reverse(copy=False)
+        flagged = flagged_signals(stat.analyze(mod))
+        fixed = [nl.names[i] for i in rng.choice(nl.num_nodes, min(args.seeds, nl.num_nodes), replace=False)]
+        layouts = LayoutEngine()
+        for label, seeds in ((str(len(fixed)), fixed), (f"{len(flagged)}f", flagged)):
+            for k in args.hops:
+                t_cone, cone = timed(lambda: extract_cone(nl, seeds, k), args.repeat)
+                t_ref, (ref_nodes, ref_edges) = timed(lambda: reference_cone(G, Gr, seeds, k), 1 if n > 5000 else args.repeat)
+                ei = nl.ei[:, cone.edges]
+                got_edges = {(nl.names[a], nl.names[b]) for a, b in zip(ei[0].tolist(), ei[1].tolist())}
+                if set(cone.names) != ref_nodes or got_edges != ref_edges:
+                    bad += 1
+                    print(f"MISMATCH at {n} signals, {label} seeds, {k} hops: "
+                          f"{len(set(cone.names) ^ ref_nodes)} nodes, {len(got_edges ^ ref_edges)} edges differ")
+                v = layouts.view(mod, seeds, hops=k, cone_only=True)
+                full = nl.num_nodes + nl.num_edges
+                print(f"{n:>8} {nl.num_edges:>8} {label:>7} {k:>4} {t_csc*1e3:>7.2f} {t_cone*1e3:>8.3f} "
+                      f"{t_ref*1e3:>9.2f} {t_ref/max(t_cone, 1e-9):>7.1f}x {cone.num_nodes:>7} {cone.num_edges:>7} "
+                      f"{len(v['xy']) + len(v['edge_x']) // 3:>9} {full:>9}")
+    if bad:
+        sys.exit(f"parity FAILED: {bad} cone(s) differ from the NetworkX reference")
+    print("\nparity OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Node-feature construction benchmark and parity check.
+
+    python benchmarks/bench_features.py --sizes 1000 5000 20000
+
+Compares the column-wise EnhancedGraphBuilder.build against the previous
+cell-by-cell construction (kept below as `reference_features`) and fails
+loudly if the two feature matrices differ. Both paths first run once untimed on
+a design of the first size, so one-off import / warm-up cost is not in the
+first row.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (CompetitionVerilogParser,                   # noqa: E402
+                     EnhancedGraphBuilder, get_netlist)
+
+
+def reference_features(builder, module):
+    """Cell-by-cell feature fill as shipped before vectorisation (centralities excluded)"""
+    nl = get_netlist(module)
+    fanin  = dict(zip(nl.names, nl.fanin.tolist()))
+    fanout = dict(zip(nl.names, nl.fanout.tolist()))
+    x = torch.zeros((nl.num_nodes, builder.feature_dim))
+    all_widths  = [s.width for s in module.signals.values()]
+    all_fanouts = [fanout[nm] for nm in module.signals]
+    mw, sw = np.mean(all_widths), np.std(all_widths)+1e-6
+    mf, sf = np.mean(all_fanouts), np.std(all_fanouts)+1e-6
+    for idx, (name, sig) in enumerate(module.signals.items()):
+        x[idx, builder.type_map.get(sig.signal_type, 2)] = 1
+        x[idx, 5]  = min(sig.width/64.0,1.0)
+        x[idx, 6]  = 1 if sig.width>32 else 0
+        x[idx, 7]  = np.log2(sig.width+1)/8.0
+        x[idx, 8]  = 1 if sig.is_clock else 0
+        x[idx, 9]  = 1 if sig.is_reset else 0
+        x[idx,10]  = min(fanin[name]/20.0,1.0)
+        x[idx,11]  = min(fanout[name]/20.0,1.0)
+        x[idx,12]  = min(fanin[name],10)
+        x[idx,13]  = min(fanout[name],10)
+        for fi, pat in enumerate(builder.name_patterns, start=14):
+            x[idx,fi] = 1 if re.search(pat,name,re.I) else 0
+        x[idx,23] = 1 if len(name)>20 else 0
+        x[idx,28] = 1 if (fanin[name]==0 and fanout[name]==0) else 0
+        x[idx,29] = 1 if (fanin[name]==0 and sig.signal_type not in['input']) else 0
+        x[idx,30] = 1 if (fanout[name]==0 and sig.signal_type not in['output']) else 0
+        x[idx,31] = (sig.width - mw) / sw
+        x[idx,32] = (fanout[name] - mf) / sf
+        x[idx,33] = 1 if fanout[name]>15 else 0
+        x[idx,34] = 1 if (sig.width>16 and fanout[name]==1) else 0
+        x[idx,35] = 1 if fanin[name]>10 else 0
+        x[idx,36] = 1 if re.search(r'\d+$', name) else 0
+    return x
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = ap.parse_args()
+
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    builder._graph_metrics = lambda nl: {k: np.zeros(nl.num_nodes, dtype=np.float32)   # features only
+                                         for k in ('betweenness', 'closeness', 'pagerank', 'clustering')}
+    warm = parser.parse(synthetic_rtl(args.sizes[0], seed=0))  # untimed: lazy imports, first-call setup
+    reference_features(builder, warm); builder.build(warm)
+    print(f"{'signals':>8} {'cell-wise (s)':>14} {'column-wise (s)':>16} {'speedup':>8}  parity")
+    for n in args.sizes:
+        mod = parser.parse(synthetic_rtl(n, seed=n))
+        get_netlist(mod)
+        t0 = time.perf_counter(); ref = reference_features(builder, mod); t_ref = time.perf_counter() - t0
+        t0 = time.perf_counter(); new = builder.build(mod).x;            t_new = time.perf_counter() - t0
+        ok = torch.equal(ref, new)
+        print(f"{n:>8} {t_ref:>14.3f} {t_new:>16.4f} {t_ref / t_new:>7.1f}x  {'OK' if ok else 'MISMATCH'}")
+        if not ok:
+            raise SystemExit(f"feature mismatch at {n} signals: max |Δ| = {(ref - new).abs().max():.3g}")
+
+
+if __name__ == "__main__":
+    main()
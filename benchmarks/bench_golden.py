@@ -0,0 +1,82 @@
+"""
+Golden-reference nearest-neighbour benchmark and parity check.
+
+    python benchmarks/bench_golden.py --refs 1000 10000 100000 --queries 200
+
+Fills a temporary GoldenStore with random structural feature vectors and
+times GoldenStore.nearest against a Python scan over per-reference dicts
+(same log1p distance), failing if the chosen reference ever differs.
+Also reports save/load time of the on-disk store.
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from armoriq import GOLDEN_FEATURES, GoldenStore                 # noqa: E402
+
+
+def random_features(rng, n):
+    scale = np.array([2000, 1000, 50, 20, 1, 1, 1, 5, 40, 5, 60, 16, 256, 200], dtype=np.float64)
+    v = rng.random((n, len(GOLDEN_FEATURES))) * scale
+    v[:, [0, 1, 2, 3, 8, 10, 12, 13]] = np.round(v[:, [0, 1, 2, 3, 8, 10, 12, 13]])
+    return [dict(zip(GOLDEN_FEATURES, row.tolist())) for row in v]
+
+
+def reference_nearest(refs, f):
+    best, bd = None, math.inf
+    for key, rf in refs:
+        d = math.sqrt(sum((math.log1p(max(f[k], 0.0)) - math.log1p(max(rf[k], 0.0))) ** 2 for k in GOLDEN_FEATURES))
+        if d < bd:
+            best, bd = key, d
+    return best, bd
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--refs", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--dim", type=int, default=256, help="embedding width stored with each reference")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    queries = random_features(rng, args.queries)
+    print(f"{'refs':>8} {'add s':>7} {'save s':>7} {'load s':>7} {'scan ms/q':>10} {'index ms/q':>11} {'speedup':>8}  parity")
+    for n in args.refs:
+        with tempfile.TemporaryDirectory() as root:
+            feats = random_features(rng, n)
+            keys  = [f"ref{i}.v:ref{i}" for i in range(n)]
+            store = GoldenStore(root)
+            t0 = time.perf_counter()
+            store.add_many(keys, feats, rng.standard_normal((n, args.dim)).astype(np.float32))
+            t_add = time.perf_counter() - t0
+            t0 = time.perf_counter(); store.save(); t_save = time.perf_counter() - t0
+            t0 = time.perf_counter(); store = GoldenStore(root); t_load = time.perf_counter() - t0
+
+            store.nearest(queries[0])                       # build the index outside the timed loop
+            t0 = time.perf_counter()
+            got = [store.nearest(q)[0] for q in queries]
+            t_idx = (time.perf_counter() - t0) / len(queries)
+
+            sub = queries[:max(1, min(len(queries), 2_000_000 // n))]   # keep the Python scan bounded
+            refs = list(zip(keys, feats))
+            t0 = time.perf_counter()
+            ref = [reference_nearest(refs, q) for q in sub]
+            t_ref = (time.perf_counter() - t0) / len(sub)
+
+            ok = all(g['reference'] == r[0] or abs(g['distance'] - r[1]) < 1e-9 for g, r in zip(got, ref))
+            print(f"{n:>8} {t_add:>7.3f} {t_save:>7.3f} {t_load:>7.3f} {t_ref*1e3:>10.3f} {t_idx*1e3:>11.3f} "
+                  f"{t_ref/t_idx:>7.0f}x  {'OK' if ok else 'FAIL'}")
+            if not ok:
+                sys.exit(f"parity FAILED at {n} references")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Batched GNN inference benchmark and parity check.
+
+    python benchmarks/bench_inference.py --designs 200 --signals 10 200 --max-nodes 4096
+
+Scores the same set of synthetic designs once through per-design
+HybridTrojanDetectionSystem.predict and once through predict_many, reports
+designs/s for both, and fails if any score drifts beyond --tol.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (CompetitionVerilogParser,                   # noqa: E402
+                     EnhancedGraphBuilder, HybridTrojanDetectionSystem)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=200)
+    ap.add_argument("--signals", type=int, nargs=2, default=[10, 200], help="min/max signals per design")
+    ap.add_argument("--max-nodes", type=int, nargs="+", default=[1024, 4096, 50000])
+    ap.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = default)")
+    ap.add_argument("--tol", type=float, default=1e-4)
+    args = ap.parse_args()
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    rng = np.random.default_rng(0)
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    modules = [parser.parse(synthetic_rtl(int(rng.integers(*args.signals)), seed=i, name=f"d{i}"))
+               for i in range(args.designs)]
+    graphs = [builder.build(m) for m in modules]
+    det = HybridTrojanDetectionSystem()
+    stats = [det.stat_det.analyze(m) for m in modules]   # statistics are shared; time the GNN only
+    print(f"{len(graphs)} designs, {sum(g.num_nodes for g in graphs)} nodes, "
+          f"{sum(g.num_edges for g in graphs)} edges")
+
+    t0 = time.perf_counter()
+    ref = [det.predict(m, g, None, s) for m, g, s in zip(modules, graphs, stats)]
+    t_single = time.perf_counter() - t0
+    print(f"{'max_nodes':>10} {'batches':>8} {'s':>8} {'designs/s':>10} {'speedup':>8} {'max |Δscore|':>13}")
+    print(f"{'single':>10} {len(graphs):>8} {t_single:>8.3f} {len(graphs)/t_single:>10.1f} {1.0:>8.2f} {0.0:>13.2e}")
+
+    worst = 0.0
+    for cap in args.max_nodes:
+        det.max_nodes_per_batch = cap
+        t0 = time.perf_counter()
+        got = det.predict_many(modules, graphs, None, stats)
+        t = time.perf_counter() - t0
+        err = max(max(abs(a['gnn_score'] - b['gnn_score']),
+                      float(np.abs(a['embedding'] - b['embedding']).max() / (np.abs(a['embedding']).max() + 1e-9)))
+                  for a, b in zip(ref, got))
+        worst = max(worst, err)
+        print(f"{cap:>10} {det.last_batches:>8} {t:>8.3f} {len(graphs)/t:>10.1f} {t_single/t:>8.2f} {err:>13.2e}")
+    if worst > args.tol:
+        sys.exit(f"parity FAILED: max deviation {worst:.2e} > {args.tol}")
+    print("parity OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Parallel ingestion scaling benchmark.
+
+    python benchmarks/bench_ingest.py --files 200 --signals 200 2000 --workers 1 2 4 8 16 32 64
+
+Runs ingest_files (parse + graph build + statistics per file) on a batch of
+synthetic RTL files with a growing worker pool, reports files/s and speedup
+over the in-process baseline, and checks that every pool size returns the
+same modules in the same order.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import EnhancedGraphBuilder, ingest_files           # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--files", type=int, default=64)
+    ap.add_argument("--signals", type=int, nargs=2, default=[200, 2000], help="min/max signals per file")
+    ap.add_argument("--workers", type=int, nargs="+",
+                    default=sorted({w for w in (1, 2, 4, 8, 16, 32, 64) if w <= (os.cpu_count() or 1)}))
+    ap.add_argument("--start-method", choices=["fork", "spawn", "forkserver"], default=None)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    files = [(f"f{i}.v", synthetic_rtl(int(rng.integers(*args.signals)), seed=i, name=f"top{i}").encode())
+             for i in range(args.files)]
+    mb = sum(len(b) for _, b in files) / 1e6
+    builder = EnhancedGraphBuilder(48)
+    print(f"{args.files} files, {mb:.2f} MB, {os.cpu_count()} cores")
+    print(f"{'workers':>8} {'s':>8} {'files/s':>9} {'MB/s':>7} {'speedup':>8}")
+
+    base, ref = None, None
+    for w in args.workers:
+        t0 = time.perf_counter()
+        res = ingest_files(files, builder, workers=w, mp_context=args.start_method, min_parallel=2)
+        t = time.perf_counter() - t0
+        errs = [r for r in res if r['error']]
+        if errs:
+            sys.exit(f"{len(errs)} file(s) failed, first: {errs[0]['name']}: {errs[0]['error']}")
+        sig = [(r['name'], [e['module'].name for e in r['entries']],
+                [e['analysis']['graph'].num_edges for e in r['entries']]) for r in res]
+        if ref is None:
+            ref = sig
+        elif sig != ref:
+            sys.exit(f"workers={w}: results differ from workers={args.workers[0]}")
+        base = base or t
+        print(f"{w:>8} {t:>8.2f} {args.files/t:>9.1f} {mb/t:>7.2f} {base/t:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
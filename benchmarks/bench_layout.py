@@ -0,0 +1,79 @@
+"""
+Netlist-view benchmark: cold / cached layout time and figure payload vs the original spring view.
+
+    python benchmarks/bench_layout.py --signals 50 300 1000 5000 20000
+
+For each synthetic design size, builds the dashboard's netlist figure
+(armoriq_ht_detection.netlist_figure over a fresh LayoutEngine) cold and
+then from the layout cache, and compares against the original view — a
+NetworkX rebuild + 50-iteration spring_layout + one labelled SVG Scatter —
+on wall time and serialized figure size (what is shipped to the browser).
+The original is skipped above --reference-max signals.
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import plotly.graph_objects as go
+
+warnings.filterwarnings("ignore")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import CompetitionVerilogParser, LayoutEngine, get_netlist   # noqa: E402
+from armoriq_ht_detection import netlist_figure                  # noqa: E402
+
+
+def reference_figure(module, highlight):
+    import networkx as nx
+    G = get_netlist(module).to_networkx()
+    pos = nx.spring_layout(G, k=2.5, iterations=50, seed=42) if len(G) > 0 else {}
+    ex, ey = [], []
+    for u, v in G.edges():
+        x0, y0 = pos[u]; x1, y1 = pos[v]
+        ex.extend([x0, x1, None]); ey.extend([y0, y1, None])
+    hl = set(highlight)
+    nx_, ny_, hover = [], [], []
+    for nd in G.nodes():
+        sig = module.signals[nd]
+        nx_.append(pos[nd][0]); ny_.append(pos[nd][1])
+        h = f"<b>{nd}</b><br>Type: {sig.signal_type}<br>Width: {sig.width}b<br>Fan-in: {sig.fanin} | Fan-out: {sig.fanout}"
+        hover.append(h + ("<br><b style='color:#e63950'>⚠ SUSPICIOUS</b>" if nd in hl else ""))
+    return go.Figure(data=[
+        go.Scatter(x=ex, y=ey, mode='lines', line=dict(width=0.8, color='#cbd5e1'), hoverinfo='none'),
+        go.Scatter(x=nx_, y=ny_, mode='markers+text', text=list(G.nodes()), hovertext=hover, hoverinfo='text',
+                   marker=dict(size=[18 + min(G.degree(n) * 3, 50) for n in G.nodes()]))])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--signals", type=int, nargs="+", default=[50, 300, 1000, 5000, 20000])
+    ap.add_argument("--reference-max", type=int, default=5000)
+    args = ap.parse_args()
+
+    parser = CompetitionVerilogParser()
+    print(f"{'signals':>8} {'layout':>8} {'ref s':>7} {'cold s':>7} {'cached s':>9} {'ref KiB':>8} {'new KiB':>8} "
+          f"{'drawn':>6} {'labels':>7} {'clusters':>9}")
+    for n in args.signals:
+        mod = parser.parse(synthetic_rtl(n, seed=n))
+        hl = [s for s in mod.signals if s.startswith(("trigger", "payload"))]
+        eng = LayoutEngine()
+        t0 = time.perf_counter(); netlist_figure(mod, hl, eng); t_cold = time.perf_counter() - t0
+        t0 = time.perf_counter(); fig, _ = netlist_figure(mod, hl, eng); t_warm = time.perf_counter() - t0
+        v = eng.view(mod, hl)
+        kib = len(fig.to_json()) / 1024
+        if n <= args.reference_max:
+            t0 = time.perf_counter(); ref = reference_figure(mod, hl); t_ref = time.perf_counter() - t0
+            ref_kib = f"{len(ref.to_json()) / 1024:>8.0f}"; t_ref = f"{t_ref:>7.3f}"
+        else:
+            ref_kib, t_ref = f"{'-':>8}", f"{'-':>7}"
+        print(f"{len(mod.signals):>8} {v['layout']:>8} {t_ref} {t_cold:>7.3f} {t_warm:>9.4f} {ref_kib} {kib:>8.0f} "
+              f"{len(v['nodes']):>6} {int(v['label'].sum()):>7} {len(v['cluster_size']):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+MCP registry call-overhead benchmark.
+
+    python benchmarks/bench_mcp.py --designs 100 --concurrency 1 8 64 --transport inproc
+
+Issues the detection loop's per-design tool calls (infer / analyze /
+commit_verdict) for N designs, once as blocking `call`s and once pipelined
+through `submit` + `drain`, and reports wall time per pattern.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from armoriq import (MCPServerRegistry, InProcessTransport,      # noqa: E402
+                     StdioTransport, SocketTransport)
+
+CALLS = [("mcp-gnn", "infer"), ("mcp-stat", "analyze"), ("mcp-classify", "commit_verdict")]
+
+
+def make_transport(spec, latency):
+    if spec == "inproc":
+        return InProcessTransport(latency)
+    if spec == "stdio":
+        return StdioTransport()
+    host, port = spec.split(":")[1:] if spec.count(":") == 2 else ("127.0.0.1", spec.split(":")[1])
+    return SocketTransport(host, int(port))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=100)
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64], help="per-server in-flight limit")
+    ap.add_argument("--transport", default="inproc", help="inproc | stdio | tcp:[HOST:]PORT")
+    ap.add_argument("--latency", type=float, default=0.02, help="stub latency for inproc")
+    args = ap.parse_args()
+
+    n = args.designs * len(CALLS)
+    print(f"{n} calls over {args.transport}")
+    print(f"{'pattern':>10} {'limit':>6} {'s':>8} {'calls/s':>9}")
+    for limit in args.concurrency:
+        for pattern in ("call", "submit"):
+            reg = MCPServerRegistry(make_transport(args.transport, args.latency), max_concurrency=limit)
+            reg.call("mcp-monitor", "ping")                    # start loop / connect outside the timing
+            t0 = time.perf_counter()
+            for i in range(args.designs):
+                for srv, method in CALLS:
+                    (reg.call if pattern == "call" else reg.submit)(srv, method, {"design": i})
+            errors = [r for r in reg.drain() if "error" in r]
+            t = time.perf_counter() - t0
+            reg.close()
+            if errors:
+                sys.exit(f"{len(errors)} failed call(s), first: {errors[0]['error']}")
+            print(f"{pattern:>10} {limit:>6} {t:>8.3f} {n/t:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
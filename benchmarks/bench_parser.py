@@ -0,0 +1,87 @@
+"""
+Verilog front-end throughput benchmark.
+
+    python benchmarks/bench_parser.py --sizes 2000 20000 100000 --ports 1000 4000
+
+Reports MB/s of CompetitionVerilogParser on synthetic flat RTL of growing
+size, next to the multi-regex parser it replaced (kept below as
+`LegacyRegexParser`, output not used). Most of a flat netlist body is plain
+`wire`/`reg` declarations and `assign`s, which the parser matches whole; the
+always blocks and port list go through the token stream. The --ports case
+is a wide non-ANSI port list whose names contain "reg": the legacy signal
+regex backtracks over it quadratically while the lexer stays linear.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import CompetitionVerilogParser                     # noqa: E402
+
+
+class LegacyRegexParser:
+    """The pre-lexer front end: two comment-stripping passes plus six whole-file regex scans"""
+
+    def __init__(self):
+        self.signal_pattern  = re.compile(r'(input|output|wire|reg|inout)\s*(?:\[(\d+):(\d+)\])?\s*([\w,\s]+);')
+        self.assign_pattern  = re.compile(r'assign\s+(\w+)\s*=\s*([^;]+);')
+        self.always_pattern  = re.compile(r'always\s*@\((.*?)\)(.*?)(?=always|endmodule|$)', re.S)
+        self.module_pattern  = re.compile(r'module\s+(\w+)')
+        self.instance_pattern = re.compile(r'(\w+)\s+(?:#\(.*?\))?\s*(\w+)\s*\(', re.S)
+        self.param_pattern   = re.compile(r'parameter\s+(\w+)\s*=\s*([^;]+);')
+
+    def parse(self, content):
+        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+        content = re.sub(r'//.*', '', content)
+        self.module_pattern.search(content)
+        for pat in (self.signal_pattern, self.assign_pattern, self.always_pattern,
+                    self.instance_pattern, self.param_pattern):
+            for _ in pat.finditer(content):
+                pass
+
+
+def throughput(parse, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter(); parse(text)
+        best = min(best, time.perf_counter() - t0)
+    return len(text.encode()) / 1e6 / best, best
+
+
+def wide_ports(n):
+    return "module m(" + ",\n".join(f"  cfg_reg_{i}" for i in range(n)) + ");\nendmodule\n"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--ports", type=int, nargs="*", default=[1000, 2000], help="wide port-list sizes")
+    ap.add_argument("--no-legacy", action="store_true")
+    args = ap.parse_args()
+
+    parser, legacy = CompetitionVerilogParser(), LegacyRegexParser()
+    print(f"{'signals':>8} {'MB':>7} {'lexer+RD MB/s':>14} {'legacy MB/s':>12}")
+    for n in args.sizes:
+        text = synthetic_rtl(n, seed=n)
+        mb = len(text.encode()) / 1e6
+        new_mbs, _ = throughput(parser.parse, text, args.repeat)
+        old = "-" if args.no_legacy else f"{throughput(legacy.parse, text, args.repeat)[0]:.2f}"
+        print(f"{n:>8} {mb:>7.2f} {new_mbs:>14.2f} {old:>12}")
+    if args.ports:
+        print(f"\n{'ports':>8} {'MB':>7} {'lexer+RD s':>14} {'legacy s':>12}")
+    for n in args.ports:
+        text = wide_ports(n)
+        new_s = throughput(parser.parse, text, args.repeat)[1]
+        old = "-" if args.no_legacy else f"{throughput(legacy.parse, text, 1)[1]:.3f}"
+        print(f"{n:>8} {len(text) / 1e6:>7.3f} {new_s:>14.3f} {old:>12}")
+
+
+if __name__ == "__main__":
+    main()
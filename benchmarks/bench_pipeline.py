@@ -0,0 +1,82 @@
+"""
+Agent pipeline benchmark.
+
+    python benchmarks/bench_pipeline.py --designs 200 --maxsize 1 8 64
+
+Runs Detection → Analysis → Monitor over the same synthetic designs once as
+three back-to-back batch agents and once through AgentPipeline, checks that
+both produce the same fingerprints and threat summary, and prints wall time,
+time to first fingerprint and per-stage throughput / backpressure.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (CompetitionVerilogParser, EnhancedGraphBuilder, # noqa: E402
+                     HybridTrojanDetectionSystem, MCPServerRegistry,
+                     DetectionAgent, AnalysisAgent, MonitorAgent, AgentPipeline)
+
+
+def agents(det):
+    mcp = MCPServerRegistry()
+    return mcp, DetectionAgent(mcp, det), AnalysisAgent(mcp), MonitorAgent(mcp)
+
+
+def strip(fps):
+    return [{k: v for k, v in fp.items() if k != "avg_fanout"} for fp in fps]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=200)
+    ap.add_argument("--signals", type=int, nargs=2, default=[10, 200])
+    ap.add_argument("--maxsize", type=int, nargs="+", default=[1, 8, 64], help="queue bound per edge")
+    ap.add_argument("--max-nodes", type=int, default=1024, help="GNN mini-batch size (smaller = earlier verdicts)")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    modules = [parser.parse(synthetic_rtl(int(rng.integers(*args.signals)), seed=i, name=f"d{i}"))
+               for i in range(args.designs)]
+    graphs = [builder.build(m) for m in modules]
+    det = HybridTrojanDetectionSystem(max_nodes_per_batch=args.max_nodes)
+    stats = [det.stat_det.analyze(m) for m in modules]
+
+    mcp, d, a, mo = agents(det)
+    t0 = time.perf_counter()
+    preds = d.run(modules, graphs, None, stats)
+    t_det = time.perf_counter() - t0
+    ref_fp = a.run(modules, preds)
+    ref_sum = mo.run(modules, preds)
+    t_seq = time.perf_counter() - t0
+    mcp.close()
+    print(f"sequential: wall {t_seq:.3f}s, first fingerprint after {t_det:.3f}s")
+
+    print(f"{'maxsize':>8} {'wall s':>8} {'first fp s':>11} {'det/s':>8} {'ana/s':>8} {'mon/s':>8} "
+          f"{'bp s':>7} {'max q':>6}")
+    for size in args.maxsize:
+        mcp, d, a, mo = agents(det)
+        pipe = AgentPipeline(d, a, mo, maxsize=size)
+        _, fps, summary = pipe.run(modules, graphs, None, stats)
+        mcp.close()
+        if strip(fps) != strip(ref_fp) or summary["threat_events"] != ref_sum["threat_events"]:
+            sys.exit(f"maxsize={size}: pipeline output differs from sequential agents")
+        m = pipe.metrics
+        bp = m['analysis']['blocked_put_s'] + m['monitor']['blocked_put_s']
+        mq = max(m['analysis']['max_depth'], m['monitor']['max_depth'])
+        print(f"{size:>8} {m['wall_s']:>8.3f} {m['analysis']['first_s']:>11.3f} "
+              f"{m['detection']['items_per_s']:>8.1f} {m['analysis']['items_per_s']:>8.1f} "
+              f"{m['monitor']['items_per_s']:>8.1f} {bp:>7.3f} {mq:>6}")
+    print("outputs match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Dynamic int8 quantization benchmark: accuracy delta, latency and model size per backend.
+
+    python benchmarks/bench_quantize.py --designs 200 --signals 10 300 --threads 1 2
+    python benchmarks/bench_quantize.py --eval-csv labels.csv --model-dir ~/.cache/armoriq/models
+
+Scores a labelled evaluation set (by default synthetic designs, half of them
+with an injected counter-trigger HT; or `file,label` rows from --eval-csv)
+through every backend in fp32 and int8. Reports hybrid / GNN-only accuracy,
+the int8 − fp32 accuracy delta, max |Δ gnn_score|, verdict flips, ms per
+design and the serialized model size.
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import inject_trojan, synthetic_rtl                    # noqa: E402
+from armoriq import (INFERENCE_BACKENDS, CompetitionVerilogParser,  # noqa: E402
+                     EnhancedGraphBuilder, HybridTrojanDetectionSystem, ModelRegistry, configure_threads)
+
+
+def eval_set(args):
+    if args.eval_csv:
+        with open(args.eval_csv, newline="") as fh:
+            rows = [(r[0], int(r[1])) for r in csv.reader(fh) if r and r[0] != "file"]
+        return [(open(f, encoding="utf-8", errors="replace").read(), y) for f, y in rows]
+    rng = np.random.default_rng(0)
+    out = []
+    for i in range(args.designs):
+        rtl = synthetic_rtl(int(rng.integers(*args.signals)), seed=i, name=f"d{i}")
+        out.append((inject_trojan(rtl, seed=i), 1) if i % 2 else (rtl, 0))
+    return out
+
+
+def model_kib(engine) -> float:
+    if engine.path:
+        return os.path.getsize(engine.path) / 1024
+    buf = io.BytesIO(); torch.save(engine.model.state_dict(), buf)
+    return buf.tell() / 1024
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=200, help="synthetic designs (every other one HT-infested)")
+    ap.add_argument("--signals", type=int, nargs=2, default=[10, 300], help="min/max signals per design")
+    ap.add_argument("--eval-csv", help="labelled set instead of synthetic designs: rows of file,label (1 = HT)")
+    ap.add_argument("--model-dir", help="ModelRegistry root (default: temporary → seeded init)")
+    ap.add_argument("--backends", nargs="+", choices=INFERENCE_BACKENDS, default=list(INFERENCE_BACKENDS))
+    ap.add_argument("--threads", type=int, nargs="+", default=[1], help="intra-op thread counts to sweep")
+    ap.add_argument("--interop-threads", type=int, default=1)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    warnings.filterwarnings("ignore")
+
+    data = eval_set(args)
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    modules = [parser.parse(rtl) for rtl, _ in data]
+    labels  = np.array([y for _, y in data])
+    graphs  = [builder.build(m) for m in modules]
+    stats   = [HybridTrojanDetectionSystem(gnn_weight=0).stat_det.analyze(m) for m in modules]
+    print(f"{len(modules)} designs ({labels.sum()} HT), {sum(g.num_nodes for g in graphs)} nodes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reg = ModelRegistry(args.model_dir or tmp)
+        print(f"{'threads':>7} {'backend':>12} {'mode':>5} {'KiB':>7} {'ms/design':>10} {'acc':>6} {'gnn acc':>8} "
+              f"{'Δacc':>6} {'max|Δgnn|':>10} {'flips':>6}")
+        for nt in args.threads:
+            th = configure_threads(nt, args.interop_threads)
+            for b in args.backends:
+                base = None
+                for q in (False, True):
+                    det = HybridTrojanDetectionSystem(models=reg, backend=b, quantize=q)
+                    det.engine                             # export / quantize outside the timed loop
+                    ts = []
+                    for _ in range(args.repeat):
+                        t0 = time.perf_counter()
+                        preds = det.predict_many(modules, graphs, None, stats)
+                        ts.append(time.perf_counter() - t0)
+                    verdict = np.array([p['prediction'] for p in preds])
+                    gnn = np.array([p['gnn_score'] for p in preds])
+                    acc, gacc = (verdict == labels).mean(), ((gnn > 0.5) == labels).mean()
+                    if base is None:
+                        base = (verdict, gnn, acc)
+                    print(f"{th['intra']:>7} {b:>12} {'int8' if q else 'fp32':>5} {model_kib(det.engine):>7.0f} "
+                          f"{min(ts)/len(modules)*1e3:>10.3f} {acc:>6.3f} {gacc:>8.3f} {acc - base[2]:>+6.3f} "
+                          f"{np.abs(gnn - base[1]).max():>10.2e} {int((verdict != base[0]).sum()):>6}")
+
+
+if __name__ == "__main__":
+    main()
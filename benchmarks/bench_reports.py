@@ -0,0 +1,128 @@
+"""
+Design-report browser benchmark: dashboard rerun latency with every report rendered vs one page.
+
+    python benchmarks/bench_reports.py --designs 500 --signals 40 --per-page 10 --variants 2
+
+Drives the Streamlit app headlessly (streamlit.testing AppTest) with
+--designs synthetic uploads (every other one HT-infested), plus --variants
+trojaned copies of clean designs in files of their own that redefine the
+same module name, and a fresh result cache. Checks that every file is scored
+once (a same-name variant is a design of its own), then times reruns: all designs on one page (what the unpaginated
+report loop rendered), a single page, the next page, a verdict filter, a
+search and a re-sort. Reports wall time, expanders and Plotly charts built per rerun, and
+checks that each page holds the expected designs in browse order.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import inject_trojan, synthetic_rtl                    # noqa: E402
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "armoriq_ht_detection.py")
+
+
+def timed_run(at, timeout):
+    t0 = time.perf_counter()
+    at.run(timeout=timeout)
+    if at.exception:
+        sys.exit(f"app raised: {at.exception[0].value}")
+    return time.perf_counter() - t0
+
+
+def shown(at):
+    """File names of the report expanders on screen (icon + two spaces + name)"""
+    return [e.label.split("  ", 1)[1] for e in at.expander if e.label.startswith(("🚨", "✅"))]
+
+
+def expected_report(files):
+    """The dashboard's default analysis of the same uploads, via the headless scan path"""
+    from armoriq import EnhancedGraphBuilder, HybridTrojanDetectionSystem, MCPServerRegistry, InProcessTransport
+    from armoriq import build_report, ingest_designs, score_designs
+    mcp = MCPServerRegistry(InProcessTransport(latency=0.0))
+    try:
+        det = HybridTrojanDetectionSystem()
+        res = score_designs(ingest_designs([(n, b) for n, b, _ in files], EnhancedGraphBuilder(48), det, mcp), det, mcp)
+    finally:
+        mcp.close()
+    return build_report(res.modules, res.predictions, res.fingerprints, res.monitor)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=500)
+    ap.add_argument("--signals", type=int, default=40, help="signals per synthetic design")
+    ap.add_argument("--per-page", type=int, default=10)
+    ap.add_argument("--variants", type=int, default=2, help="extra files redefining a clean design's module, trojaned")
+    ap.add_argument("--timeout", type=float, default=1800)
+    args = ap.parse_args()
+    warnings.filterwarnings("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ARMORIQ_CACHE_DIR"] = tmp
+        from streamlit.testing.v1 import AppTest
+        from armoriq import browse_designs
+        from armoriq_ht_detection import REPORT_SORTS
+
+        files = []
+        for i in range(args.designs):
+            rtl = synthetic_rtl(args.signals, seed=i, name=f"d{i}")
+            files.append((f"d{i:04d}.v", (inject_trojan(rtl, seed=i) if i % 2 else rtl).encode(), "text/plain"))
+        for i in range(0, min(2 * args.variants, args.designs), 2):
+            rtl = synthetic_rtl(args.signals, seed=i, name=f"d{i}")
+            files.append((f"d{i:04d}_variant.v", inject_trojan(rtl, seed=i).encode(), "text/plain"))
+        designs = expected_report(files)['designs']
+        scored = sorted(d['file'] for d in designs)
+        if scored != sorted(n for n, _, _ in files):
+            sys.exit(f"{len(files)} file(s) uploaded but {len(scored)} design(s) scored")
+        for n, _, _ in files[args.designs:]:
+            base, var = (next(d for d in designs if d['file'] == f) for f in (n.replace("_variant", ""), n))
+            print(f"{base['module']}: {base['file']} {base['hybrid_score']:.3f} · {var['file']} {var['hybrid_score']:.3f}")
+
+        at = AppTest.from_file(APP, default_timeout=args.timeout)
+        at.run()
+        at.file_uploader[0].set_value(files)
+        t_cold = timed_run(at, args.timeout)
+        print(f"{len(files)} designs · cold analysis + first page {t_cold:.2f}s")
+        print(f"{'rerun':>19} {'wall s':>8} {'expanders':>10} {'charts':>7} {'page ok':>8}")
+
+        steps = [
+            ("all on one page", "rb_per_page", len(files)),
+            ("one page",        "rb_per_page", args.per_page),
+            ("next page",       "rb_page", 2),
+            ("filter HT-Infested", "rb_verdict", ["HT-Infested"]),
+            ("search 'd001'",   "rb_query", "d001"),
+            ("sort by verdict", "rb_sort", "Verdict"),
+        ]
+        bad = 0
+        for name, key, value in steps:
+            _widget(at, key).set_value(value)
+            t = timed_run(at, args.timeout)
+            ss = at.session_state
+            per, page = ss["rb_per_page"], (ss["rb_page"] if "rb_page" in ss else 1)
+            order = browse_designs(designs, ss["rb_query"], ss["rb_verdict"], ss["rb_types"], *REPORT_SORTS[ss["rb_sort"]])
+            want = [designs[i]['file'] for i in order[(page - 1) * per:page * per]]
+            ok = shown(at) == want
+            bad += not ok
+            print(f"{name:>19} {t:>8.2f} {len(at.expander):>10} {len(at.get('plotly_chart')):>7} {'✓' if ok else '✗':>8}")
+        if bad:
+            sys.exit(f"{bad} rerun(s) showed the wrong designs")
+
+
+def _widget(at, key):
+    for kind in ("number_input", "multiselect", "selectbox", "text_input"):
+        try:
+            return getattr(at, kind)(key=key)
+        except KeyError:
+            pass
+    raise KeyError(key)
+
+
+if __name__ == "__main__":
+    main()
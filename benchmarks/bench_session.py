@@ -0,0 +1,114 @@
+"""
+Session-store benchmark: dashboard rerun latency for display toggles and weight changes vs a full recompute.
+
+    python benchmarks/bench_session.py --designs 500 --signals 40 --weights 0.3 0.8 0.0
+
+Drives the Streamlit app headlessly (streamlit.testing AppTest) over
+--designs synthetic uploads (every other one HT-infested), then times reruns
+that only touch presentation (a sidebar checkbox, a per-design signal table),
+GNN-weight changes (re-blended from the stored scores) and, as the reference,
+the same weights with the session store dropped (parse → score → agents
+again, as every rerun used to). Checks that the re-blended KPIs match the
+recomputed ones, and that HybridTrojanDetectionSystem.reblend reproduces a
+fresh predict_many at each weight for every design (weight 0: the
+statistical-only prediction, GNN score and method included).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import inject_trojan, synthetic_rtl                    # noqa: E402
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "armoriq_ht_detection.py")
+
+
+def timed_run(at, timeout):
+    t0 = time.perf_counter()
+    at.run(timeout=timeout)
+    if at.exception:
+        sys.exit(f"app raised: {at.exception[0].value}")
+    return time.perf_counter() - t0
+
+
+def kpis(at):
+    return [(m.label, m.value) for m in at.metric[:5]]
+
+
+def reblend_parity(files, weights):
+    """max |Δ| of hybrid / GNN score and confidence, verdict or method flips: reblend vs a fresh detector per weight"""
+    from armoriq import CompetitionVerilogParser, EnhancedGraphBuilder, HybridTrojanDetectionSystem
+    parser, builder = CompetitionVerilogParser(), EnhancedGraphBuilder(48)
+    modules = [parser.parse(b.decode()) for _, b, _ in files]
+    graphs  = [builder.build(m) for m in modules]
+    base = HybridTrojanDetectionSystem().predict_many(modules, graphs)
+    worst, flips = 0.0, 0
+    for w in weights:
+        ref = HybridTrojanDetectionSystem(gnn_weight=w, stat_weight=1 - w).predict_many(modules, graphs)
+        for p, r in zip(base, ref):
+            q = HybridTrojanDetectionSystem.reblend(p, w, 1 - w)
+            worst = max(worst, abs(q['hybrid_score'] - r['hybrid_score']), abs(q['confidence'] - r['confidence']),
+                        abs(q['gnn_score'] - r['gnn_score']))
+            flips += q['prediction'] != r['prediction'] or q['method'] != r['method']
+    return worst, flips
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, default=500)
+    ap.add_argument("--signals", type=int, default=40, help="signals per synthetic design")
+    ap.add_argument("--weights", type=float, nargs="+", default=[0.3, 0.8, 0.0],
+                    help="GNN weights to switch to, in order (0 after a hybrid one re-blends to statistical only)")
+    ap.add_argument("--timeout", type=float, default=1800)
+    args = ap.parse_args()
+    warnings.filterwarnings("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["ARMORIQ_CACHE_DIR"] = tmp
+        from streamlit.testing.v1 import AppTest
+
+        files = []
+        for i in range(args.designs):
+            rtl = synthetic_rtl(args.signals, seed=i, name=f"d{i}")
+            files.append((f"d{i:04d}.v", (inject_trojan(rtl, seed=i) if i % 2 else rtl).encode(), "text/plain"))
+
+        at = AppTest.from_file(APP, default_timeout=args.timeout)
+        at.run()
+        at.file_uploader[0].set_value(files)
+        t_cold = timed_run(at, args.timeout)
+        print(f"{args.designs} designs · cold analysis {t_cold:.2f}s")
+        print(f"{'rerun':>26} {'wall s':>8} {'recompute s':>12} {'speedup':>8} {'KPIs match':>11}")
+
+        def step(name, act, reference=True):
+            act()
+            t = timed_run(at, args.timeout)
+            got = kpis(at)
+            t_ref, same = float("nan"), None
+            if reference:                                  # same widgets, session store dropped
+                at.session_state["analysis"] = None
+                t_ref = timed_run(at, args.timeout)
+                same = kpis(at) == got
+            print(f"{name:>26} {t:>8.2f} {t_ref:>12.2f} {t_ref / t:>7.1f}x {'' if same is None else '✓' if same else '✗':>11}")
+            return same is not False
+
+        ok = step("toggle 'Netlist Graph'",
+                  lambda: next(c for c in at.sidebar.checkbox if c.label == "Netlist Graph").set_value(False))
+        ok &= step("signal detail table",
+                   lambda: next(c for c in at.checkbox if (c.key or "").startswith("sig_")).set_value(True))
+        for w in args.weights:
+            ok &= step(f"GNN weight → {w:.1f}",
+                       lambda: next(sl for sl in at.sidebar.slider if sl.label == "GNN Weight").set_value(w))
+        worst, flips = reblend_parity(files, args.weights)
+        print(f"\nreblend vs fresh predict_many: max |Δ| {worst:.1e}, {flips} verdict / method flip(s)")
+        if not ok or worst > 1e-4 or flips:
+            sys.exit("parity FAILED")
+
+
+if __name__ == "__main__":
+    main()
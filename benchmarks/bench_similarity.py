@@ -0,0 +1,83 @@
+"""
+Embedding-index benchmark: brute force vs IVF latency, recall and near-duplicate detection.
+
+    python benchmarks/bench_similarity.py --sizes 1000 10000 100000 --queries 200 --k 5
+
+Fills a temporary EmbeddingIndex with clustered random 768-dim embeddings
+(designs from a few families look alike) and, per size, times single-design
+search through the exact BruteForceIndex and the IVFIndex the store switches
+to past its threshold. Reports recall@k of IVF against the exact result, the
+near-duplicate hit rate for lightly perturbed copies of stored designs, and
+add/save/load time. Fails if the exact index misses a near-duplicate.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from armoriq import BruteForceIndex, EmbeddingIndex, IVFIndex     # noqa: E402
+
+
+def embeddings(rng, n, dim, families=64):
+    centres = rng.standard_normal((families, dim)).astype(np.float32) * 3
+    return centres[rng.integers(0, families, n)] + rng.standard_normal((n, dim)).astype(np.float32)
+
+
+def per_query(index, queries, k):
+    index.search(queries[:1], k)                           # warm-up
+    t0 = time.perf_counter()
+    out = [index.search(q[None], k)[1][0] for q in queries]
+    return (time.perf_counter() - t0) / len(queries), out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--dim", type=int, default=768, help="pooled GNN embedding width (mean ‖ max ‖ add)")
+    ap.add_argument("--k", type=int, default=5)
+    ap.add_argument("--nprobe", type=int, default=None, help="IVF cells probed (default nlist/16)")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'designs':>8} {'add s':>6} {'save s':>7} {'load s':>7} {'build s':>8} {'exact ms':>9} {'ivf ms':>7} "
+          f"{'speedup':>8} {'recall@k':>9} {'dup exact':>10} {'dup ivf':>8}")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as root:
+            emb = embeddings(rng, n, args.dim)
+            store = EmbeddingIndex(root)
+            t0 = time.perf_counter()
+            store.add_many([f"d{i}.v:d{i}" for i in range(n)], emb, rng.integers(0, 2, n), source='scan')
+            t_add = time.perf_counter() - t0
+            t0 = time.perf_counter(); store.save(); t_save = time.perf_counter() - t0
+            t0 = time.perf_counter(); store = EmbeddingIndex(root); t_load = time.perf_counter() - t0
+
+            queries = embeddings(rng, args.queries, args.dim)
+            exact = BruteForceIndex(store.embeddings, 'cosine')
+            t0 = time.perf_counter()
+            ivf = IVFIndex(store.embeddings, 'cosine', nprobe=args.nprobe)
+            t_build = time.perf_counter() - t0
+            t_exact, ref = per_query(exact, queries, args.k)
+            t_ivf, got = per_query(ivf, queries, args.k)
+            recall = np.mean([len(set(a.tolist()) & set(b.tolist())) / len(a) for a, b in zip(ref, got)])
+
+            rows = rng.choice(n, min(n, args.queries), replace=False)      # slightly perturbed re-submissions
+            dups = store.embeddings[rows] + 1e-3 * rng.standard_normal((len(rows), args.dim)).astype(np.float32)
+            hit = {}
+            for name, idx in (("exact", exact), ("ivf", ivf)):
+                d, i = idx.search(dups, 1)
+                hit[name] = np.mean((i[:, 0] == rows) & (d[:, 0] <= store.duplicate_distance))
+            print(f"{n:>8} {t_add:>6.2f} {t_save:>7.3f} {t_load:>7.3f} {t_build:>8.2f} {t_exact*1e3:>9.3f} "
+                  f"{t_ivf*1e3:>7.3f} {t_exact/t_ivf:>7.1f}x {recall:>9.3f} {hit['exact']:>10.3f} {hit['ivf']:>8.3f}")
+            if hit['exact'] < 1.0:
+                sys.exit(f"near-duplicate detection FAILED at {n} designs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Cold import-time benchmark for the core package, the CLI and the dashboard.
+
+    python benchmarks/bench_startup.py --repeat 5
+
+Each target is imported in a fresh interpreter so nothing is shared between
+runs; reports best/median wall time and whether torch / streamlit were pulled in.
+Then, in this process, times what a dashboard rerun pays for the GNN: the
+first ModelRegistry.get() (torch import + checkpoint load) against --reruns
+fresh HybridTrojanDetectionSystem instances that reuse the shared model.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+TARGETS = [
+    ("armoriq",             "import armoriq"),
+    ("parser",              "from armoriq import CompetitionVerilogParser"),
+    ("cli",                 "import armoriq.cli"),
+    ("detector",            "import armoriq.detector"),
+    ("dashboard",           "import armoriq_ht_detection"),
+    ("gnn",                 "import armoriq; armoriq.ModelRegistry.default().get()"),
+]
+
+PROBE = ("import sys, time, warnings; warnings.filterwarnings('ignore'); t0 = time.perf_counter(); {stmt}; "
+         "print(time.perf_counter() - t0, int('torch' in sys.modules), int('streamlit' in sys.modules))")
+
+
+def run(stmt: str):
+    out = subprocess.run([sys.executable, "-c", PROBE.format(stmt=stmt)], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[-3]), out[-2] == "1", out[-1] == "1"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", nargs="+", choices=[t for t, _ in TARGETS])
+    ap.add_argument("--reruns", type=int, default=100)
+    args = ap.parse_args()
+
+    print(f"{'target':>10} {'best s':>8} {'median s':>9} {'torch':>6} {'streamlit':>10}")
+    for name, stmt in TARGETS:
+        if args.only and name not in args.only:
+            continue
+        runs = [run(stmt) for _ in range(args.repeat)]
+        ts = [t for t, _, _ in runs]
+        _, torch_, st = runs[-1]
+        print(f"{name:>10} {min(ts):>8.3f} {statistics.median(ts):>9.3f} {'yes' if torch_ else 'no':>6} "
+              f"{'yes' if st else 'no':>10}")
+
+    if args.reruns:
+        sys.path.insert(0, ROOT)
+        warnings.filterwarnings("ignore")
+        from armoriq import HybridTrojanDetectionSystem, ModelRegistry
+        reg = ModelRegistry.default()
+        t0 = time.perf_counter()
+        reg.get()
+        first = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(args.reruns):
+            HybridTrojanDetectionSystem(models=reg).gnn_model
+        per = (time.perf_counter() - t0) / args.reruns
+        info = reg.info()
+        print(f"\nGNN first load {first:.3f}s (torch import {info['import_s']:.3f}s, {info['source']}); "
+              f"per-rerun detector + model {per*1e6:.1f} µs over {args.reruns} reruns")
+
+
+if __name__ == "__main__":
+    main()
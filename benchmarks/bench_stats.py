@@ -0,0 +1,138 @@
+"""
+Statistical anomaly analysis benchmark and parity check.
+
+    python benchmarks/bench_stats.py --sizes 1000 10000 50000
+
+Compares the vectorised StatisticalTrojanDetector.analyze (columnar
+SignalTable + name masks) against the previous per-signal loops (kept below
+as `reference_analyze`), with and without golden features, and fails if any
+anomaly list differs or a score drifts beyond --tol.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from synth import synthetic_rtl                                  # noqa: E402
+from armoriq import (CompetitionVerilogParser,                   # noqa: E402
+                     StatisticalTrojanDetector, get_netlist)
+
+SUSPICIOUS = [r'trigger', r'payload', r'malicious', r'trojan', r'backdoor', r'secret', r'hidden', r'rare',
+              r'low_prob', r'attack', r'leak', r'covert', r'kill', r'bypass', r'shadow', r'ghost']
+
+
+def reference_features(module):
+    f = {'num_signals': len(module.signals), 'num_assignments': len(module.assignments),
+         'num_always_blocks': len(module.always_blocks), 'num_instances': len(module.instances)}
+    st = defaultdict(int)
+    for sig in module.signals.values():
+        st[sig.signal_type] += 1
+    for k in ('input', 'output', 'reg'):
+        f[f'{k}_ratio'] = st[k] / max(len(module.signals), 1)
+    nl = get_netlist(module)
+    fanins, fanouts = nl.fanin.tolist(), nl.fanout.tolist()
+    widths = [s.width for s in module.signals.values()]
+    f['avg_fanin']  = np.mean(fanins)  if fanins  else 0
+    f['max_fanin']  = np.max(fanins)   if fanins  else 0
+    f['avg_fanout'] = np.mean(fanouts) if fanouts else 0
+    f['max_fanout'] = np.max(fanouts)  if fanouts else 0
+    f['avg_width']  = np.mean(widths)  if widths  else 0
+    f['max_width']  = np.max(widths)   if widths  else 0
+    f['logic_complexity'] = sum(len(re.findall(r'if|case|for|while', b)) for b in module.always_blocks)
+    return f
+
+
+def reference_analyze(module, golden_features=None):
+    """Previous implementation: one Python loop per anomaly category"""
+    a = {k: [] for k in ['suspicious_names','unusual_widths','high_fanout',
+                          'isolated_signals','complex_logic','rare_signals','golden_deviation']}
+    a['score'] = 0.0
+    for name in module.signals:
+        for pat in SUSPICIOUS:
+            if re.search(pat, name, re.I):
+                a['suspicious_names'].append(name); a['score'] += 0.4; break
+    widths = [s.width for s in module.signals.values()]
+    if widths:
+        mu, sd = np.mean(widths), np.std(widths)
+        for name, sig in module.signals.items():
+            if sig.width > mu + 2.5*sd and sig.width > 8:
+                a['unusual_widths'].append((name, sig.width)); a['score'] += 0.15
+    nl = get_netlist(module)
+    fanouts = nl.fanout[nl.fanout > 0]
+    if fanouts.size:
+        thr = np.percentile(fanouts, 90) if len(fanouts) > 5 else 10
+        for name, fo in zip(nl.names, nl.fanout.tolist()):
+            if fo > thr and fo > 8:
+                a['high_fanout'].append((name, fo)); a['score'] += 0.20
+    for (name, sig), fi, fo in zip(module.signals.items(), nl.fanin.tolist(), nl.fanout.tolist()):
+        if fi == 0 and fo == 0 and sig.signal_type not in ['input','output']:
+            a['isolated_signals'].append(name); a['score'] += 0.25
+    for block in module.always_blocks:
+        c = len(re.findall(r'if|case', block))
+        if c > 7:
+            a['complex_logic'].append(c); a['score'] += 0.30
+    for name, sig in module.signals.items():
+        if re.search(r'cnt|counter|count', name, re.I) and sig.width > 16:
+            a['rare_signals'].append(name); a['score'] += 0.20
+    if golden_features:
+        cf = reference_features(module)
+        for key in ['num_signals', 'num_assignments', 'logic_complexity']:
+            if key in golden_features and key in cf:
+                dev = abs(cf[key] - golden_features[key]) / max(golden_features[key], 1)
+                if dev > 0.20:
+                    a['golden_deviation'].append((key, dev)); a['score'] += 0.30*dev
+    a['score'] = min(a['score'], 1.0)
+    ni = sum(len(v) if isinstance(v, list) else 0 for v in a.values())
+    a['confidence'] = min(ni / 10.0, 1.0)
+    return a
+
+
+def compare(ref, got, tol):
+    for k in ref:
+        if k in ('score', 'confidence'):
+            if abs(ref[k] - got[k]) > tol:
+                return f"{k}: {ref[k]} vs {got[k]}"
+        elif ref[k] != got[k]:
+            return f"{k} differs ({len(ref[k])} vs {len(got[k])} items)"
+    return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    ap.add_argument("--tol", type=float, default=1e-9)
+    args = ap.parse_args()
+
+    parser = CompetitionVerilogParser()
+    golden = {'num_signals': 100, 'num_assignments': 50, 'logic_complexity': 10}
+    print(f"{'signals':>8} {'golden':>7} {'loops (s)':>10} {'vectorised (s)':>15} {'speedup':>8}  parity")
+    for n in args.sizes:
+        src = synthetic_rtl(n, seed=n)
+        for gf in (None, golden):
+            # fresh parse each side so neither inherits the other's cached netlist / table
+            m_ref, m_new = parser.parse(src), parser.parse(src)
+            get_netlist(m_ref); get_netlist(m_new)
+            det = StatisticalTrojanDetector()
+            t0 = time.perf_counter()
+            ref = reference_analyze(m_ref, gf)
+            t_ref = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            got = det.analyze(m_new, gf)
+            t_new = time.perf_counter() - t0
+            err = compare(ref, got, args.tol)
+            print(f"{n:>8} {'yes' if gf else 'no':>7} {t_ref:>10.4f} {t_new:>15.4f} {t_ref/t_new:>7.1f}x  "
+                  f"{'OK' if err is None else 'FAIL'}")
+            if err:
+                sys.exit(f"parity FAILED at {n} signals: {err}")
+
+
+if __name__ == "__main__":
+    main()
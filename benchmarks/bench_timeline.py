@@ -0,0 +1,92 @@
+"""
+Threat-timeline benchmark: figure payload and build time vs the original per-design traces.
+
+    python benchmarks/bench_timeline.py --designs 10 100 1000 10000 --max-points 1000
+
+Builds threat events like MonitorAgent does (random hybrid scores → level)
+and renders them with armoriq_ht_detection.timeline_figure and with the
+original one-Scatter-per-design loop. Reports trace count, serialized figure
+size (what is shipped to the browser) and build + serialize time. Checks that
+every design is drawn below --max-points and, above it, that each level keeps
+its top score and the bucket counts add up to the design count.
+The original is skipped above --reference-max designs.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+warnings.filterwarnings("ignore")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from armoriq_ht_detection import TIMELINE_COLORS, timeline_figure   # noqa: E402
+
+
+def reference_figure(events):
+    df = pd.DataFrame(events)
+    df['rank'] = range(len(df))
+    fig = go.Figure()
+    for _, row in df.iterrows():
+        c = TIMELINE_COLORS.get(row['level'], '#4a6080')
+        fig.add_trace(go.Scatter(
+            x=[row['score']], y=[row['rank']], mode='markers+text',
+            marker=dict(size=18, color=c, symbol='diamond', line=dict(width=1, color='#060b14')),
+            text=[f"  {row['file']}"], textfont=dict(size=10, color=c), textposition='middle right',
+            hovertemplate=f"<b>{row['file']}</b><br>Score: {row['score']:.3f}<br>Level: {row['level']}<extra></extra>",
+            name=row['level'], showlegend=False))
+    return fig
+
+
+def events_for(rng, n):
+    score = rng.beta(0.8, 1.6, n)
+    level = np.select([score >= 0.75, score >= 0.5, score >= 0.3], ['CRITICAL', 'HIGH', 'MEDIUM'], 'CLEAN')
+    return [{'file': f"design_{i:05d}.v", 'module': f"d{i}", 'score': float(s), 'level': str(lv)}
+            for i, (s, lv) in enumerate(zip(score, level))]
+
+
+def built(fn, events):
+    t0 = time.perf_counter()
+    fig = fn(events)
+    payload = fig.to_json()
+    return fig, len(payload), time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--designs", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    ap.add_argument("--max-points", type=int, default=1000)
+    ap.add_argument("--reference-max", type=int, default=10000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'designs':>8} {'ref traces':>10} {'ref KiB':>9} {'ref s':>7} {'traces':>7} {'points':>7} {'KiB':>7} "
+          f"{'s':>7} {'smaller':>8}")
+    for n in args.designs:
+        ev = events_for(rng, n)
+        ref = built(reference_figure, ev) if n <= args.reference_max else None
+        fig, kib, t = built(lambda e: timeline_figure(e, args.max_points)[0], ev)
+        points = sum(len(tr.x) for tr in fig.data)
+        drawn = json.loads(fig.to_json())['data']
+        files = [f for tr in drawn for f, _ in tr['customdata']]
+        more = sum(int(m[3:-6]) for tr in drawn for _, m in tr['customdata'] if m)
+        if n <= args.max_points and sorted(files) != sorted(e['file'] for e in ev):
+            sys.exit(f"FAILED at {n}: not every design drawn")
+        if n > args.max_points:
+            top = {lv: max(e['score'] for e in ev if e['level'] == lv) for lv in {e['level'] for e in ev}}
+            if len(files) + more != n or any(max(fig.data[i].x) != top[fig.data[i].name] for i in range(len(fig.data))):
+                sys.exit(f"FAILED at {n}: bucketed timeline lost designs or a level's top score")
+        print(f"{n:>8} {len(ref[0].data) if ref else '-':>10} {ref[1]/1024 if ref else float('nan'):>9.1f} "
+              f"{ref[2] if ref else float('nan'):>7.2f} {len(fig.data):>7} {points:>7} {kib/1024:>7.1f} {t:>7.3f} "
+              f"{(ref[1]/kib if ref else float('nan')):>7.1f}x")
+    print("\ntimeline checks OK")
+
+
+if __name__ == "__main__":
+    main()
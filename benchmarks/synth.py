@@ -0,0 +1,70 @@
+"""
+Synthetic RTL generator shared by the ArmorIQ benchmarks.
+Produces flat, parseable Verilog with a controllable signal count.
+"""
+
+import random
+from typing import List
+
+
+def synthetic_rtl(n_signals: int, seed: int = 0, name: str = "synth_top") -> str:
+    """One module with ~n_signals signals, random assign/always connectivity"""
+    rng = random.Random(seed)
+    n_in  = max(n_signals // 20, 2)
+    n_out = max(n_signals // 20, 1)
+    n_reg = max(n_signals // 4, 1)
+    n_wire = max(n_signals - n_in - n_out - n_reg, 1)
+
+    ins   = ["clk", "rst"] + [f"in_{i}" for i in range(n_in - 2)]
+    outs  = [f"out_{i}" for i in range(n_out)]
+    regs  = [f"r_{i}" for i in range(n_reg)]
+    wires = [f"w_{i}" for i in range(n_wire)]
+    # sprinkle a few names that trip the suspicious-name detectors
+    for i in range(0, len(regs), 97):
+        regs[i] = f"trigger_cnt_{i}"
+    for i in range(0, len(wires), 89):
+        wires[i] = f"payload_{i}"
+
+    lines: List[str] = [f"module {name} ("]
+    lines.append(",\n".join(f"  {n}" for n in ins + outs))
+    lines.append(");")
+    for n in ins:
+        lines.append(f"  input {n};")
+    for n in outs:
+        lines.append(f"  output [{rng.choice([0, 7, 15])}:0] {n};")
+    for n in wires:
+        lines.append(f"  wire [{rng.choice([0, 0, 3, 7, 31])}:0] {n};")
+    for n in regs:
+        lines.append(f"  reg [{rng.choice([0, 7, 15, 31])}:0] {n};")
+
+    drivers = ins + regs + wires
+    for n in wires + outs:
+        srcs = rng.sample(drivers, k=min(3, len(drivers)))
+        lines.append(f"  assign {n} = {srcs[0]} ^ ({srcs[1]} & {srcs[2]});")
+
+    for lo in range(0, len(regs), 16):
+        lines.append("  always @(posedge clk) begin")
+        lines.append("    if (rst) begin")
+        for n in regs[lo:lo + 16]:
+            lines.append(f"      {n} <= 0;")
+        lines.append("    end else begin")
+        for n in regs[lo:lo + 16]:
+            a, b = rng.sample(drivers, k=2)
+            lines.append(f"      {n} <= {a} + {b};")
+        lines.append("    end")
+        lines.append("  end")
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n"
+
+
+def inject_trojan(rtl: str, seed: int = 0) -> str:
+    """Same design plus a classic sequential HT: a free-running counter whose magic value flips an output"""
+    rng  = random.Random(seed)
+    out  = rtl[rtl.index("output"):].split(";")[0].split()[-1]
+    magic = rng.randrange(1 << 20, 1 << 31)
+    body = (f"  reg [31:0] ht_count;\n  reg ht_armed;\n"
+            f"  always @(posedge clk) begin\n    ht_count <= ht_count + 1;\n"
+            f"    if (ht_count == 32'd{magic}) ht_armed <= 1'b1;\n  end\n"
+            f"  wire [31:0] ht_leak = ht_armed ? ht_count : 32'd0;\n")
+    rtl = rtl.replace(f"  assign {out} = ", f"  assign {out} = ht_leak[0] ^ ", 1)
+    return rtl.replace("endmodule", body + "endmodule")